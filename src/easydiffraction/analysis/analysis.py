@@ -13,6 +13,7 @@ from easydiffraction.analysis.categories.constraints import Constraints
 from easydiffraction.analysis.categories.joint_fit_experiments import JointFitExperiments
 from easydiffraction.analysis.fitting import Fitter
 from easydiffraction.analysis.minimizers.factory import MinimizerFactory
+from easydiffraction.core.datablock import mark_changed
 from easydiffraction.core.parameters import NumericDescriptor
 from easydiffraction.core.parameters import Parameter
 from easydiffraction.core.parameters import StringDescriptor
@@ -46,7 +47,9 @@ class Analysis:
         fitter: Active fitter/minimizer driver.
     """
 
-    _calculator = CalculatorFactory.create_calculator('cryspy')
+    # Default calculator shared by projects, created on first use so
+    # that importing the package does not import the engine
+    _calculator = None
 
     def __init__(self, project) -> None:
         """Create a new Analysis instance bound to a project.
@@ -58,9 +61,13 @@ class Analysis:
         self.aliases = Aliases()
         self.constraints = Constraints()
         self.constraints_handler = ConstraintsHandler.get()
+        if Analysis._calculator is None:
+            Analysis._calculator = CalculatorFactory.create_calculator('cryspy')
         self.calculator = Analysis._calculator  # Default calculator shared by project
         self._calculator_key: str = 'cryspy'  # Added to track the current calculator
         self._fit_mode: str = 'single'
+        self._num_workers: int = 1
+        self._jacobian_mode: str = 'numeric'
         self.fitter = Fitter('lmfit (leastsq)')
 
     def _get_params_as_dataframe(
@@ -359,6 +366,8 @@ class Analysis:
             return
         self.calculator = calculator
         self._calculator_key = calculator_name
+        # Calculated patterns depend on the calculator
+        mark_changed(self)
         console.paragraph('Current calculator changed to')
         console.print(self.current_calculator)
 
@@ -421,6 +430,62 @@ class Analysis:
         console.paragraph('Current fit mode changed to')
         console.print(self._fit_mode)
 
+    @property
+    def num_workers(self) -> int:
+        """Number of processes calculating patterns during fitting."""
+        return self._num_workers
+
+    @num_workers.setter
+    def num_workers(self, num_workers: int) -> None:
+        """Set the number of processes calculating patterns during
+        fitting.
+
+        With more than one worker, the patterns of different phases and
+        experiments are calculated in parallel. The default of 1
+        calculates them serially in the current process.
+
+        Args:
+            num_workers: Positive number of worker processes.
+
+        Raises:
+            ValueError: If the value is not a positive integer.
+        """
+        if isinstance(num_workers, bool) or not isinstance(num_workers, int) or num_workers < 1:
+            raise ValueError('Number of workers must be a positive integer')
+        self._num_workers = num_workers
+        console.paragraph('Number of workers changed to')
+        console.print(self._num_workers)
+
+    @property
+    def jacobian_mode(self) -> str:
+        """How the Jacobian is obtained during fitting: 'numeric' or
+        'analytic'.
+        """
+        return self._jacobian_mode
+
+    @jacobian_mode.setter
+    def jacobian_mode(self, mode: str) -> None:
+        """Set how the Jacobian is obtained during fitting.
+
+        In 'analytic' mode, the Jacobian columns of parameters the
+        pattern depends on linearly (phase scales and background
+        intensities, also through constraints) are calculated directly
+        from the patterns, and only the remaining parameters are
+        differentiated numerically. This applies to minimizers that
+        accept a Jacobian, e.g. 'lmfit (leastsq)'.
+
+        Args:
+            mode: Either 'numeric' or 'analytic'.
+
+        Raises:
+            ValueError: If an unsupported mode is provided.
+        """
+        if mode not in ['numeric', 'analytic']:
+            raise ValueError("Jacobian mode must be either 'numeric' or 'analytic'")
+        self._jacobian_mode = mode
+        console.paragraph('Current Jacobian mode changed to')
+        console.print(self._jacobian_mode)
+
     def show_available_fit_modes(self) -> None:
         """Print all supported fitting strategies and their
         descriptions.
@@ -553,7 +618,7 @@ class Analysis:
                 # This is a workaround to set the parent project
                 # of the dummy experiments collection, so that
                 # parameters can be resolved correctly during fitting.
-                object.__setattr__(dummy_experiments, '_parent', self.project)
+                dummy_experiments._parent = self.project
 
                 dummy_experiments._add(experiment)
                 self.fitter.fit(
@@ -14,6 +14,10 @@ from easydiffraction.sample_models.sample_models import SampleModels
 class CalculatorBase(ABC):
     """Base API for diffraction calculation engines."""
 
+    # Whether the calculated pattern already includes the phase scale
+    # of the linked phase, so it cannot be reused when the scale changes
+    uses_phase_scale: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -2,11 +2,11 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import contextlib
-import copy
 import io
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Tuple
 from typing import Union
 
 import numpy as np
@@ -46,6 +46,10 @@ class CryspyCalculator(CalculatorBase):
     def __init__(self) -> None:
         super().__init__()
         self._cryspy_dicts: Dict[str, Dict[str, Any]] = {}
+        # Values last written to each cryspy dict slot, per dict
+        self._pushed_values: Dict[str, Dict[Tuple[str, str], Any]] = {}
+        # Included-point index each cryspy dict holds the data for
+        self._data_rows: Dict[str, Any] = {}
 
     def calculate_structure_factors(
         self,
@@ -74,8 +78,10 @@ class CryspyCalculator(CalculatorBase):
 
         We only recreate the cryspy_obj if this method is
          - NOT called by the minimizer, or
-         - the cryspy_dict is NOT yet created.
-        In other cases, we are modifying the existing cryspy_dict
+         - the cryspy_dict is NOT yet created, or
+         - the points included in calculations have changed.
+        In other cases, we are modifying the existing cryspy_dict in
+        place, writing only the values changed since the previous call.
         This allows significantly speeding up the calculation
 
         Args:
@@ -90,17 +96,24 @@ class CryspyCalculator(CalculatorBase):
         """
         combined_name = f'{sample_model.name}_{experiment.name}'
 
-        if called_by_minimizer:
-            if self._cryspy_dicts and combined_name in self._cryspy_dicts:
-                cryspy_dict = self._recreate_cryspy_dict(sample_model, experiment)
-            else:
-                cryspy_obj = self._recreate_cryspy_obj(sample_model, experiment)
-                cryspy_dict = cryspy_obj.get_dictionary()
+        data_rows = experiment.data._included_rows
+        if (
+            called_by_minimizer
+            and combined_name in self._cryspy_dicts
+            and self._data_rows[combined_name] is data_rows
+        ):
+            cryspy_dict = self._update_cryspy_dict(sample_model, experiment)
         else:
-            cryspy_obj = self._recreate_cryspy_obj(sample_model, experiment)
-            cryspy_dict = cryspy_obj.get_dictionary()
-
-        self._cryspy_dicts[combined_name] = copy.deepcopy(cryspy_dict)
+            self._cryspy_dicts[combined_name] = self._recreate_cryspy_dict(
+                sample_model,
+                experiment,
+            )
+            self._pushed_values[combined_name] = {}
+            self._data_rows[combined_name] = data_rows
+            # Overwrite the values rounded in the CIF representation
+            # with the exact ones, so that cached patterns of unchanged
+            # phases match freshly calculated ones
+            cryspy_dict = self._update_cryspy_dict(sample_model, experiment)
 
         cryspy_in_out_dict: Dict[str, Any] = {}
 
@@ -139,13 +152,17 @@ class CryspyCalculator(CalculatorBase):
 
         return y_calc
 
-    def _recreate_cryspy_dict(
+    def _update_cryspy_dict(
         self,
         sample_model: SampleModelBase,
         experiment: ExperimentBase,
     ) -> Dict[str, Any]:
-        """Recreates the Cryspy dictionary for the given sample model
-        and experiment.
+        """Updates the stored Cryspy dictionary for the given sample
+        model and experiment in place.
+
+        Only the slots whose values changed since the previous update
+        are written, so e.g. atom arrays are not touched when only peak
+        parameters vary.
 
         Args:
             sample_model: The sample model to update.
@@ -155,91 +172,196 @@ class CryspyCalculator(CalculatorBase):
             The updated Cryspy dictionary.
         """
         combined_name = f'{sample_model.name}_{experiment.name}'
-        cryspy_dict = copy.deepcopy(self._cryspy_dicts[combined_name])
+        cryspy_dict = self._cryspy_dicts[combined_name]
+        pushed_values = self._pushed_values[combined_name]
+
+        for slot, values in self._cryspy_dict_values(sample_model, experiment).items():
+            if pushed_values.get(slot) == values:
+                continue
+            block_name, key = slot
+            cryspy_block = cryspy_dict[block_name]
+            target = cryspy_block[key]
+            if isinstance(target, np.ndarray):
+                target[: len(values)] = values
+            else:
+                cryspy_block[key] = values
+            pushed_values[slot] = values
 
-        cryspy_model_id = f'crystal_{sample_model.name}'
-        cryspy_model_dict = cryspy_dict[cryspy_model_id]
+        return cryspy_dict
 
-        # Update sample model parameters
+    def _cryspy_dict_values(
+        self,
+        sample_model: SampleModelBase,
+        experiment: ExperimentBase,
+    ) -> Dict[Tuple[str, str], Any]:
+        """Collects the current parameter values for the Cryspy
+        dictionary.
+
+        Args:
+            sample_model: The sample model to collect values from.
+            experiment: The experiment to collect values from.
+
+        Returns:
+            Values keyed by the Cryspy block name and the dictionary
+                key within that block. Arrays are given as tuples, which
+                are written to the leading elements of the target array.
+        """
+        values: Dict[Tuple[str, str], Any] = {}
+
+        # Sample model parameters
+
+        cryspy_model_id = f'crystal_{sample_model.name}'
+        cell = sample_model.cell
+        atom_sites = list(sample_model.atom_sites)
 
         # Cell
-        cryspy_cell = cryspy_model_dict['unit_cell_parameters']
-        cryspy_cell[0] = sample_model.cell.length_a.value
-        cryspy_cell[1] = sample_model.cell.length_b.value
-        cryspy_cell[2] = sample_model.cell.length_c.value
-        cryspy_cell[3] = np.deg2rad(sample_model.cell.angle_alpha.value)
-        cryspy_cell[4] = np.deg2rad(sample_model.cell.angle_beta.value)
-        cryspy_cell[5] = np.deg2rad(sample_model.cell.angle_gamma.value)
+        values[cryspy_model_id, 'unit_cell_parameters'] = (
+            cell.length_a.value,
+            cell.length_b.value,
+            cell.length_c.value,
+            np.deg2rad(cell.angle_alpha.value),
+            np.deg2rad(cell.angle_beta.value),
+            np.deg2rad(cell.angle_gamma.value),
+        )
 
         # Atomic coordinates
-        cryspy_xyz = cryspy_model_dict['atom_fract_xyz']
-        for idx, atom_site in enumerate(sample_model.atom_sites):
-            cryspy_xyz[0][idx] = atom_site.fract_x.value
-            cryspy_xyz[1][idx] = atom_site.fract_y.value
-            cryspy_xyz[2][idx] = atom_site.fract_z.value
+        values[cryspy_model_id, 'atom_fract_xyz'] = (
+            tuple(atom.fract_x.value for atom in atom_sites),
+            tuple(atom.fract_y.value for atom in atom_sites),
+            tuple(atom.fract_z.value for atom in atom_sites),
+        )
 
         # Atomic occupancies
-        cryspy_occ = cryspy_model_dict['atom_occupancy']
-        for idx, atom_site in enumerate(sample_model.atom_sites):
-            cryspy_occ[idx] = atom_site.occupancy.value
+        values[cryspy_model_id, 'atom_occupancy'] = tuple(
+            atom.occupancy.value for atom in atom_sites
+        )
 
         # Atomic ADPs - Biso only for now
-        cryspy_biso = cryspy_model_dict['atom_b_iso']
-        for idx, atom_site in enumerate(sample_model.atom_sites):
-            cryspy_biso[idx] = atom_site.b_iso.value
+        values[cryspy_model_id, 'atom_b_iso'] = tuple(atom.b_iso.value for atom in atom_sites)
 
-        # Update experiment parameters
+        # Experiment parameters
+
+        instrument = experiment.instrument
+        peak = experiment.peak
 
         if experiment.type.beam_mode.value == BeamModeEnum.CONSTANT_WAVELENGTH:
             cryspy_expt_name = f'pd_{experiment.name}'
-            cryspy_expt_dict = cryspy_dict[cryspy_expt_name]
 
             # Instrument
-            cryspy_expt_dict['offset_ttheta'][0] = np.deg2rad(
-                experiment.instrument.calib_twotheta_offset.value
+            values[cryspy_expt_name, 'offset_ttheta'] = (
+                np.deg2rad(instrument.calib_twotheta_offset.value),
             )
-            cryspy_expt_dict['wavelength'][0] = experiment.instrument.setup_wavelength.value
+            values[cryspy_expt_name, 'wavelength'] = (instrument.setup_wavelength.value,)
 
             # Peak
-            cryspy_resolution = cryspy_expt_dict['resolution_parameters']
-            cryspy_resolution[0] = experiment.peak.broad_gauss_u.value
-            cryspy_resolution[1] = experiment.peak.broad_gauss_v.value
-            cryspy_resolution[2] = experiment.peak.broad_gauss_w.value
-            cryspy_resolution[3] = experiment.peak.broad_lorentz_x.value
-            cryspy_resolution[4] = experiment.peak.broad_lorentz_y.value
+            values[cryspy_expt_name, 'resolution_parameters'] = (
+                peak.broad_gauss_u.value,
+                peak.broad_gauss_v.value,
+                peak.broad_gauss_w.value,
+                peak.broad_lorentz_x.value,
+                peak.broad_lorentz_y.value,
+            )
 
         elif experiment.type.beam_mode.value == BeamModeEnum.TIME_OF_FLIGHT:
             cryspy_expt_name = f'tof_{experiment.name}'
-            cryspy_expt_dict = cryspy_dict[cryspy_expt_name]
 
             # Instrument
-            cryspy_expt_dict['zero'][0] = experiment.instrument.calib_d_to_tof_offset.value
-            cryspy_expt_dict['dtt1'][0] = experiment.instrument.calib_d_to_tof_linear.value
-            cryspy_expt_dict['dtt2'][0] = experiment.instrument.calib_d_to_tof_quad.value
-            cryspy_expt_dict['ttheta_bank'] = np.deg2rad(
-                experiment.instrument.setup_twotheta_bank.value
+            values[cryspy_expt_name, 'zero'] = (instrument.calib_d_to_tof_offset.value,)
+            values[cryspy_expt_name, 'dtt1'] = (instrument.calib_d_to_tof_linear.value,)
+            values[cryspy_expt_name, 'dtt2'] = (instrument.calib_d_to_tof_quad.value,)
+            values[cryspy_expt_name, 'ttheta_bank'] = np.deg2rad(
+                instrument.setup_twotheta_bank.value
             )
 
             # Peak
-            cryspy_sigma = cryspy_expt_dict['profile_sigmas']
-            cryspy_sigma[0] = experiment.peak.broad_gauss_sigma_0.value
-            cryspy_sigma[1] = experiment.peak.broad_gauss_sigma_1.value
-            cryspy_sigma[2] = experiment.peak.broad_gauss_sigma_2.value
+            values[cryspy_expt_name, 'profile_sigmas'] = (
+                peak.broad_gauss_sigma_0.value,
+                peak.broad_gauss_sigma_1.value,
+                peak.broad_gauss_sigma_2.value,
+            )
+            values[cryspy_expt_name, 'profile_betas'] = (
+                peak.broad_mix_beta_0.value,
+                peak.broad_mix_beta_1.value,
+            )
+            values[cryspy_expt_name, 'profile_alphas'] = (
+                peak.asym_alpha_0.value,
+                peak.asym_alpha_1.value,
+            )
 
-            cryspy_beta = cryspy_expt_dict['profile_betas']
-            cryspy_beta[0] = experiment.peak.broad_mix_beta_0.value
-            cryspy_beta[1] = experiment.peak.broad_mix_beta_1.value
+        return values
 
-            cryspy_alpha = cryspy_expt_dict['profile_alphas']
-            cryspy_alpha[0] = experiment.peak.asym_alpha_0.value
-            cryspy_alpha[1] = experiment.peak.asym_alpha_1.value
+    def _recreate_cryspy_dict(
+        self,
+        sample_model: SampleModelBase,
+        experiment: ExperimentBase,
+    ) -> Dict[str, Any]:
+        """Recreates the Cryspy dictionary for the given sample model
+        and experiment.
 
-        return cryspy_dict
+        The measured data are handed over to Cryspy as arrays instead
+        of being formatted into CIF text and parsed back. If the
+        experiment block is not supported by this path, the whole
+        experiment is converted via CIF as a fallback.
+
+        Args:
+            sample_model: The sample model to recreate.
+            experiment: The experiment to recreate.
+
+        Returns:
+            The recreated Cryspy dictionary.
+        """
+        cryspy_obj = self._recreate_cryspy_obj(sample_model, experiment, include_data=False)
+        cryspy_dict = cryspy_obj.get_dictionary()
+        if self._set_cryspy_dict_data(cryspy_dict, experiment):
+            return cryspy_dict
+
+        cryspy_obj = self._recreate_cryspy_obj(sample_model, experiment)
+        return cryspy_obj.get_dictionary()
+
+    def _set_cryspy_dict_data(
+        self,
+        cryspy_dict: Dict[str, Any],
+        experiment: ExperimentBase,
+    ) -> bool:
+        """Sets the measured data arrays in the Cryspy dictionary.
+
+        Args:
+            cryspy_dict: The Cryspy dictionary to update.
+            experiment: The experiment providing the data.
+
+        Returns:
+            True if the data were set, False if the experiment block
+                is not supported.
+        """
+        x_data = experiment.data.x
+        signal_exp = np.stack([experiment.data.meas, experiment.data.meas_su], axis=0)
+        excluded_points = np.zeros(x_data.shape, dtype=bool)
+
+        beam_mode = experiment.type.beam_mode.value
+        if beam_mode == BeamModeEnum.CONSTANT_WAVELENGTH:
+            cryspy_expt_dict = cryspy_dict.get(f'pd_{experiment.name}')
+            if cryspy_expt_dict is None or 'ttheta' not in cryspy_expt_dict:
+                return False
+            cryspy_expt_dict['ttheta'] = np.deg2rad(x_data)
+        elif beam_mode == BeamModeEnum.TIME_OF_FLIGHT:
+            cryspy_expt_dict = cryspy_dict.get(f'tof_{experiment.name}')
+            if cryspy_expt_dict is None or 'time' not in cryspy_expt_dict:
+                return False
+            cryspy_expt_dict['time'] = np.array(x_data, dtype=float)
+            cryspy_expt_dict['time_min'] = float(x_data.min())
+            cryspy_expt_dict['time_max'] = float(x_data.max())
+        else:
+            return False
+
+        cryspy_expt_dict['signal_exp'] = signal_exp
+        cryspy_expt_dict['excluded_points'] = excluded_points
+        return True
 
     def _recreate_cryspy_obj(
         self,
         sample_model: SampleModelBase,
         experiment: ExperimentBase,
+        include_data: bool = True,
     ) -> Any:
         """Recreates the Cryspy object for the given sample model and
         experiment.
@@ -247,6 +369,8 @@ class CryspyCalculator(CalculatorBase):
         Args:
             sample_model: The sample model to recreate.
             experiment: The experiment to recreate.
+            include_data: Whether to include all measured data points
+                or only a placeholder for them.
 
         Returns:
             The recreated Cryspy object.
@@ -261,6 +385,7 @@ class CryspyCalculator(CalculatorBase):
         cryspy_experiment_cif = self._convert_experiment_to_cryspy_cif(
             experiment,
             linked_phase=sample_model,
+            include_data=include_data,
         )
 
         cryspy_experiment_obj = str_to_globaln(cryspy_experiment_cif)
@@ -286,6 +411,7 @@ class CryspyCalculator(CalculatorBase):
         self,
         experiment: ExperimentBase,
         linked_phase: Any,
+        include_data: bool = True,
     ) -> str:
         """Converts an experiment to a Cryspy CIF string.
 
@@ -293,6 +419,10 @@ class CryspyCalculator(CalculatorBase):
             experiment: The experiment to convert.
             linked_phase: The linked phase associated with the
                 experiment.
+            include_data: Whether to include all measured data points.
+                If False, only the first and last points are written,
+                as Cryspy needs the measurement loop to recognize the
+                experiment type.
 
         Returns:
             The Cryspy CIF string representation of the experiment.
@@ -408,7 +538,9 @@ class CryspyCalculator(CalculatorBase):
         y_data: np.ndarray = experiment.data.meas
         sy_data: np.ndarray = experiment.data.meas_su
 
-        for x_val, y_val, sy_val in zip(x_data, y_data, sy_data, strict=True):
+        points = slice(None) if include_data else [0, -1]
+        data_rows = zip(x_data[points], y_data[points], sy_data[points], strict=True)
+        for x_val, y_val, sy_val in data_rows:
             cif_lines.append(f'  {x_val:.5f}   {y_val:.5f}   {sy_val:.5f}')
 
         cryspy_experiment_cif = '\n'.join(cif_lines)
@@ -8,9 +8,7 @@ from typing import Type
 from typing import Union
 
 from easydiffraction.analysis.calculators.base import CalculatorBase
-from easydiffraction.analysis.calculators.crysfml import CrysfmlCalculator
-from easydiffraction.analysis.calculators.cryspy import CryspyCalculator
-from easydiffraction.analysis.calculators.pdffit import PdffitCalculator
+from easydiffraction.utils.lazy import resolve
 from easydiffraction.utils.logging import console
 from easydiffraction.utils.logging import log
 from easydiffraction.utils.utils import render_table
@@ -23,23 +21,31 @@ class CalculatorFactory:
     calculators in the current environment and a creator that returns an
     instantiated calculator or ``None`` if the requested one is not
     available.
+
+    Calculator classes are registered by import path, so an engine is
+    only imported once its calculator is listed or created.
     """
 
     _potential_calculators: Dict[str, Dict[str, Union[str, Type[CalculatorBase]]]] = {
         'crysfml': {
             'description': 'CrysFML library for crystallographic calculations',
-            'class': CrysfmlCalculator,
+            'class': 'easydiffraction.analysis.calculators.crysfml:CrysfmlCalculator',
         },
         'cryspy': {
             'description': 'CrysPy library for crystallographic calculations',
-            'class': CryspyCalculator,
+            'class': 'easydiffraction.analysis.calculators.cryspy:CryspyCalculator',
         },
         'pdffit': {
             'description': 'PDFfit2 library for pair distribution function calculations',
-            'class': PdffitCalculator,
+            'class': 'easydiffraction.analysis.calculators.pdffit:PdffitCalculator',
         },
     }
 
+    @classmethod
+    def _is_supported(cls, config: Dict[str, Union[str, Type[CalculatorBase]]]) -> bool:
+        """Return whether the engine of a calculator is importable."""
+        return resolve(config['class'])().engine_imported  # instantiate and check the @property
+
     @classmethod
     def _supported_calculators(
         cls,
@@ -53,9 +59,7 @@ class CalculatorFactory:
             Mapping from calculator name to its config dict.
         """
         return {
-            name: cfg
-            for name, cfg in cls._potential_calculators.items()
-            if cfg['class']().engine_imported  # instantiate and check the @property
+            name: cfg for name, cfg in cls._potential_calculators.items() if cls._is_supported(cfg)
         }
 
     @classmethod
@@ -94,12 +98,12 @@ class CalculatorFactory:
         Returns:
             A calculator instance or ``None`` if unknown or unsupported.
         """
-        config = cls._supported_calculators().get(calculator_name)
-        if not config:
+        config = cls._potential_calculators.get(calculator_name)
+        if not config or not cls._is_supported(config):
             log.warning(
                 f"Unknown calculator '{calculator_name}', "
                 f'Supported calculators: {cls.list_supported_calculators()}'
             )
             return None
 
-        return config['class']()
+        return resolve(config['class'])()
@@ -42,6 +42,7 @@ class PdffitCalculator(CalculatorBase):
     """Wrapper for Pdffit library."""
 
     engine_imported: bool = PdfFit is not None
+    uses_phase_scale: bool = True
 
     @property
     def name(self):
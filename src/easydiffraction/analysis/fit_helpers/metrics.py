@@ -127,6 +127,10 @@ def get_reliability_inputs(
     """Collect observed and calculated data points for reliability
     calculations.
 
+    Categories are only recalculated if something changed since their
+    last update, so right after a fit the patterns computed by the
+    final minimizer evaluation are reused.
+
     Args:
         sample_models: Collection of sample models.
         experiments: Collection of experiments.
@@ -138,9 +142,9 @@ def get_reliability_inputs(
     y_obs_all = []
     y_calc_all = []
     y_err_all = []
+    for sample_model in sample_models:
+        sample_model._update_categories()
     for experiment in experiments.values():
-        for sample_model in sample_models:
-            sample_model._update_categories()
         experiment._update_categories()
 
         y_calc = experiment.data.calc
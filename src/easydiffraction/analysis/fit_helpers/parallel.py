@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2021-2026 EasyDiffraction contributors <https://github.com/easyscience/diffraction>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Parallel evaluation of phase patterns during fitting.
+
+Every pair of linked phase and experiment is independent, so the
+patterns whose inputs changed since the previous residual evaluation
+can be calculated side by side. The worker processes are forked from
+the fitting process once per fit and keep their own copy of the project
+and the calculator state (e.g. the persistent cryspy dictionaries).
+For every task they receive the current parameter values, calculate
+the unscaled pattern and send it back. The first evaluation is done
+serially, so that the workers are forked with the calculator state
+already set up. The results are stored in the
+phase pattern cache of the experiment data, in submission order, so
+that the following serial update only sums them up.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+from easydiffraction.utils.logging import log
+
+if TYPE_CHECKING:
+    from easydiffraction.experiments.experiments import Experiments
+
+# Project copy of the current worker process, set by _init_worker
+_worker_project = None
+
+
+def _init_worker(project) -> None:
+    """Keep the project inherited from the fitting process."""
+    global _worker_project
+    _worker_project = project
+
+
+def _calculate_phase_pattern(task: Tuple) -> np.ndarray:
+    """Calculate the unscaled pattern of one phase in one experiment.
+
+    Args:
+        task: Sample model name, experiment name, sample model parameter
+            values, experiment parameter values and calculation mask.
+
+    Returns:
+        The pattern for the points included in calculations.
+    """
+    sample_model_name, experiment_name, model_values, experiment_values, calc_mask = task
+    project = _worker_project
+    sample_model = project.sample_models[sample_model_name]
+    experiment = project.experiments[experiment_name]
+
+    for param, value in zip(sample_model.parameters, model_values, strict=True):
+        param._value = value
+    for param, value in zip(experiment.parameters, experiment_values, strict=True):
+        param._value = value
+    experiment.data._set_calc_status(calc_mask)
+
+    return project.analysis.calculator.calculate_pattern(
+        sample_model,
+        experiment,
+        called_by_minimizer=True,
+    )
+
+
+class PatternExecutor:
+    """Process pool calculating phase patterns of several experiments
+    in parallel.
+    """
+
+    def __init__(self, project, num_workers: int) -> None:
+        self._pool = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=_init_worker,
+            initargs=(project,),
+        )
+        # Worker processes are forked on the first submission
+        self._started = False
+
+    @classmethod
+    def create(cls, project, num_workers: int) -> Optional[PatternExecutor]:
+        """Create an executor, or return ``None`` for serial
+        evaluation.
+
+        Worker processes inherit the project by forking, so ``None`` is
+        also returned on platforms without the ``fork`` start method.
+        """
+        if num_workers < 2:
+            return None
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            log.warning(
+                'Parallel pattern calculation requires the fork start method. '
+                'Falling back to serial calculation.'
+            )
+            return None
+        return cls(project, num_workers)
+
+    def prefetch(self, experiments: Experiments) -> None:
+        """Calculate all outdated phase patterns of the experiments.
+
+        Nothing is submitted on the first call, which sets up the
+        calculator state in the fitting process, nor if fewer than two
+        patterns are outdated, as the serial update is faster then.
+        """
+        if not self._started:
+            self._started = True
+            return
+
+        tasks: List[Tuple] = []
+        targets: List[Tuple] = []
+        for experiment in experiments.values():
+            data = experiment.data
+            for sample_model_id, sample_model, fingerprint in data._missing_phase_patterns():
+                tasks.append((
+                    sample_model_id,
+                    experiment.name,
+                    tuple(p.value for p in sample_model.parameters),
+                    tuple(p.value for p in experiment.parameters),
+                    np.array(data._calc_mask),
+                ))
+                targets.append((data, sample_model_id, fingerprint))
+
+        if len(tasks) < 2:
+            return
+
+        patterns = self._pool.map(_calculate_phase_pattern, tasks)
+        for (data, sample_model_id, fingerprint), pattern in zip(targets, patterns, strict=True):
+            data._cache_phase_pattern(sample_model_id, fingerprint, pattern)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        self._pool.shutdown()
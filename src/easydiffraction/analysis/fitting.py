@@ -1,17 +1,24 @@
 # SPDX-FileCopyrightText: 2021-2026 EasyDiffraction contributors <https://github.com/easyscience/diffraction>
 # SPDX-License-Identifier: BSD-3-Clause
 
+from functools import partial
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 import numpy as np
 
 from easydiffraction.analysis.fit_helpers.metrics import get_reliability_inputs
+from easydiffraction.analysis.fit_helpers.parallel import PatternExecutor
 from easydiffraction.analysis.minimizers.factory import MinimizerFactory
+from easydiffraction.analysis.minimizers.jacobian import AnalyticJacobian
+from easydiffraction.analysis.minimizers.jacobian import ParallelJacobian
 from easydiffraction.core.parameters import Parameter
+from easydiffraction.core.parameters import bulk_update
 from easydiffraction.experiments.experiments import Experiments
 from easydiffraction.sample_models.sample_models import SampleModels
 
@@ -27,6 +34,8 @@ class Fitter:
         self.engine: str = selection.split(' ')[0]  # Extracts 'lmfit' or 'dfols'
         self.minimizer = MinimizerFactory.create_minimizer(selection)
         self.results: Optional[FitResults] = None
+        # Residual buffer and per-experiment blocks of the current fit
+        self._residual_layout: Optional[Tuple[np.ndarray, List[Tuple]]] = None
 
     def fit(
         self,
@@ -46,7 +55,11 @@ class Fitter:
             experiments: Collection of experiments.
             weights: Optional weights for joint fitting.
             analysis: Optional Analysis object to update its categories
-                during fitting.
+                during fitting. Its ``num_workers`` sets the number of
+                worker processes. They evaluate the Jacobian if the
+                minimizer supports it, otherwise the patterns. Its
+                ``jacobian_mode`` selects analytic derivatives where
+                available.
         """
         params = sample_models.free_parameters + experiments.free_parameters
 
@@ -57,6 +70,22 @@ class Fitter:
         for param in params:
             param._fit_start_value = param.value
 
+        # The residual layout is rebuilt for the experiments of this fit
+        self._residual_layout = None
+
+        executor = None
+        jacobian = None
+        if analysis is not None and self.minimizer.supports_jacobian:
+            jacobian = self._create_jacobian(
+                params,
+                sample_models,
+                experiments,
+                weights=weights,
+                analysis=analysis,
+            )
+        elif analysis is not None:
+            executor = PatternExecutor.create(analysis.project, analysis.num_workers)
+
         def objective_function(engine_params: Dict[str, Any]) -> np.ndarray:
             return self._residual_function(
                 engine_params=engine_params,
@@ -65,10 +94,74 @@ class Fitter:
                 experiments=experiments,
                 weights=weights,
                 analysis=analysis,
+                executor=executor,
             )
 
+        fit_kwargs = {} if jacobian is None else {'jacobian': jacobian}
+
         # Perform fitting
-        self.results = self.minimizer.fit(params, objective_function)
+        try:
+            self.results = self.minimizer.fit(params, objective_function, **fit_kwargs)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if jacobian is not None:
+                jacobian.shutdown()
+            self._residual_layout = None
+
+    def _create_jacobian(
+        self,
+        parameters: List[Parameter],
+        sample_models: SampleModels,
+        experiments: Experiments,
+        weights: Optional[np.array] = None,
+        analysis=None,
+    ) -> Optional[Union[AnalyticJacobian, ParallelJacobian]]:
+        """Create the Jacobian provider selected by the analysis.
+
+        Args:
+            parameters: List of parameters being optimized.
+            sample_models: Collection of sample models.
+            experiments: Collection of experiments.
+            weights: Optional weights for joint fitting.
+            analysis: Analysis object with the Jacobian settings.
+
+        Returns:
+            The Jacobian provider, or None to let the minimizer
+                estimate the Jacobian itself.
+        """
+        residuals = partial(
+            self._residuals_at,
+            parameters=parameters,
+            sample_models=sample_models,
+            experiments=experiments,
+            weights=weights,
+            analysis=analysis,
+        )
+        lower = np.array([param.fit_min for param in parameters], dtype=float)
+        upper = np.array([param.fit_max for param in parameters], dtype=float)
+        numeric = ParallelJacobian.create(
+            residuals,
+            analysis.num_workers,
+            lower=lower,
+            upper=upper,
+        )
+        if analysis.jacobian_mode != 'analytic':
+            return numeric
+        derivatives = partial(
+            self._residual_derivatives,
+            parameters=parameters,
+            experiments=experiments,
+            weights=weights,
+            analysis=analysis,
+        )
+        return AnalyticJacobian(
+            residuals,
+            derivatives,
+            lower=lower,
+            upper=upper,
+            numeric=numeric,
+        )
 
     def _process_fit_results(
         self,
@@ -128,6 +221,7 @@ class Fitter:
         experiments: Experiments,
         weights: Optional[np.array] = None,
         analysis=None,
+        executor: Optional[PatternExecutor] = None,
     ) -> np.ndarray:
         """Residual function computes the difference between measured
         and calculated patterns. It updates the parameter values
@@ -141,6 +235,9 @@ class Fitter:
             weights: Optional weights for joint fitting.
             analysis: Optional Analysis object to update its categories
                 during fitting.
+            executor: Optional executor calculating the outdated phase
+                patterns in parallel before the experiments are
+                updated.
 
         Returns:
             Array of weighted residuals.
@@ -148,6 +245,80 @@ class Fitter:
         # Sync parameters back to objects
         self.minimizer._sync_result_to_parameters(parameters, engine_params)
 
+        residuals = self._calculate_residuals(
+            sample_models,
+            experiments,
+            weights=weights,
+            analysis=analysis,
+            executor=executor,
+        )
+        return self.minimizer.tracker.track(residuals, parameters)
+
+    def _residuals_at(
+        self,
+        values: np.ndarray,
+        parameters: List[Parameter],
+        sample_models: SampleModels,
+        experiments: Experiments,
+        weights: Optional[np.array] = None,
+        analysis=None,
+    ) -> np.ndarray:
+        """Residuals for the given values of the free parameters.
+
+        Unlike :meth:`_residual_function`, the evaluation is not
+        tracked, so it can be used by the worker processes of the
+        parallel Jacobian.
+
+        Args:
+            values: Values of the parameters being optimized.
+            parameters: List of parameters being optimized.
+            sample_models: Collection of sample models.
+            experiments: Collection of experiments.
+            weights: Optional weights for joint fitting.
+            analysis: Optional Analysis object to update its categories
+                during fitting.
+
+        Returns:
+            Array of weighted residuals.
+        """
+        # Bypass ranges check and mark the changed categories once
+        with bulk_update():
+            for param, value in zip(parameters, values, strict=True):
+                param.value = value
+        return self._calculate_residuals(
+            sample_models,
+            experiments,
+            weights=weights,
+            analysis=analysis,
+        )
+
+    def _calculate_residuals(
+        self,
+        sample_models: SampleModels,
+        experiments: Experiments,
+        weights: Optional[np.array] = None,
+        analysis=None,
+        executor: Optional[PatternExecutor] = None,
+    ) -> np.ndarray:
+        """Update all categories for the current parameter values and
+        compute the weighted residuals of all experiments.
+
+        The residuals are written in place into a buffer allocated once
+        per fit and returned as a single contiguous copy.
+
+        Args:
+            sample_models: Collection of sample models.
+            experiments: Collection of experiments.
+            weights: Optional weights for joint fitting.
+            analysis: Optional Analysis object to update its categories
+                during fitting.
+            executor: Optional executor calculating the outdated phase
+                patterns in parallel before the experiments are
+                updated.
+
+        Returns:
+            Array of weighted residuals.
+        """
         # Update categories to reflect new parameter values
         # Order matters: sample models first (symmetry, structure),
         # then analysis (constraints), then experiments (calculations)
@@ -157,6 +328,72 @@ class Fitter:
         if analysis is not None:
             analysis._update_categories(called_by_minimizer=True)
 
+        residuals, blocks = self._residual_blocks(experiments, weights)
+
+        if executor is not None:
+            executor.prefetch(experiments)
+
+        for experiment, (block, y_meas, scale) in zip(experiments.values(), blocks, strict=True):
+            # Update experiment-specific calculations
+            experiment._update_categories(called_by_minimizer=True)
+
+            # Weighted difference between measured and calculated
+            # patterns, written into this experiment's block
+            diff = residuals[block]
+            np.subtract(y_meas, experiment.data.calc, out=diff)
+            diff *= scale
+
+        # Minimizers and the Jacobian keep the returned residuals
+        return residuals.copy()
+
+    def _residual_blocks(
+        self,
+        experiments: Experiments,
+        weights: Optional[np.array] = None,
+    ) -> Tuple[np.ndarray, List[Tuple[slice, np.ndarray, np.ndarray]]]:
+        """Residual buffer and per-experiment blocks of the current fit.
+
+        Built on the first call of a fit. Each block holds the slice of
+        the buffer with the residuals of one experiment, its measured
+        values and the factor ``sqrt(weight) / meas_su`` scaling their
+        difference to the calculated values. Residuals are squared
+        before going into reduced chi-squared, hence the square root.
+
+        Args:
+            experiments: Collection of experiments.
+            weights: Optional weights for joint fitting.
+
+        Returns:
+            The residual buffer and the blocks in the order of the
+                experiments.
+        """
+        if self._residual_layout is None:
+            _weights = self._normalized_weights(experiments, weights)
+            blocks = []
+            size = 0
+            for experiment, weight in zip(experiments.values(), _weights, strict=True):
+                y_meas = np.array(experiment.data.meas, dtype=np.float64)
+                scale = np.sqrt(weight) / np.asarray(experiment.data.meas_su, dtype=np.float64)
+                blocks.append((slice(size, size + y_meas.size), y_meas, scale))
+                size += y_meas.size
+            self._residual_layout = (np.empty(size, dtype=np.float64), blocks)
+        return self._residual_layout
+
+    def _normalized_weights(
+        self,
+        experiments: Experiments,
+        weights: Optional[np.array] = None,
+    ) -> np.ndarray:
+        """Experiment weights normalized to sum to the number of
+        experiments.
+
+        Args:
+            experiments: Collection of experiments.
+            weights: Optional weights for joint fitting.
+
+        Returns:
+            Array of weights in the order of the experiments.
+        """
         # Prepare weights for joint fitting
         num_expts: int = len(experiments.names)
         if weights is None:
@@ -174,24 +411,62 @@ class Fitter:
         # sum to one, then reduced chi_squared will be half as large as
         # expected.
         _weights *= num_expts / np.sum(_weights)
-        residuals: List[float] = []
+        return _weights
 
-        for experiment, weight in zip(experiments.values(), _weights, strict=True):
-            # Update experiment-specific calculations
-            experiment._update_categories(called_by_minimizer=True)
-
-            # Calculate the difference between measured and calculated
-            # patterns
-            y_calc: np.ndarray = experiment.data.calc
-            y_meas: np.ndarray = experiment.data.meas
-            y_meas_su: np.ndarray = experiment.data.meas_su
-            diff = (y_meas - y_calc) / y_meas_su
+    def _residual_derivatives(
+        self,
+        parameters: List[Parameter],
+        experiments: Experiments,
+        weights: Optional[np.array] = None,
+        analysis=None,
+    ) -> Dict[int, np.ndarray]:
+        """Analytic derivatives of the residuals with respect to the
+        parameters the patterns depend on linearly.
 
-            # Residuals are squared before going into reduced
-            # chi-squared
-            diff *= np.sqrt(weight)
+        Must be called right after the residuals were calculated for
+        the current parameter values. A parameter that constraints
+        depend on only gets a column if all its dependent parameters are
+        linear too; the chain rule then adds their contributions.
 
-            # Append the residuals for this experiment
-            residuals.extend(diff)
+        Args:
+            parameters: List of parameters being optimized.
+            experiments: Collection of experiments.
+            weights: Optional weights for joint fitting.
+            analysis: Optional Analysis object with the constraints.
 
-        return self.minimizer.tracker.track(np.array(residuals), parameters)
+        Returns:
+            Jacobian columns keyed by the index of the parameter. The
+                other parameters need numerical differentiation.
+        """
+        residuals, blocks = self._residual_blocks(experiments, weights)
+        size = residuals.size
+
+        # Residual derivative blocks per parameter uid as (offset,
+        # values) of the experiments the parameter is linear in
+        linear: Dict[str, List] = {}
+        for experiment, (block, _, scale) in zip(experiments.values(), blocks, strict=True):
+            for param, derivative in experiment._linear_derivatives():
+                linear.setdefault(param.uid, []).append((block.start, -scale * derivative))
+
+        def column(uid: str) -> np.ndarray:
+            values = np.zeros(size)
+            for offset, block in linear[uid]:
+                values[offset : offset + block.size] += block
+            return values
+
+        handler = None
+        if analysis is not None and analysis.constraints._items:
+            handler = analysis.constraints_handler
+
+        columns: Dict[int, np.ndarray] = {}
+        for i, param in enumerate(parameters):
+            if param.uid not in linear:
+                continue
+            dependents = handler.derivatives(param.uid) if handler is not None else {}
+            if any(uid not in linear for uid in dependents):
+                continue
+            values = column(param.uid)
+            for uid, derivative in dependents.items():
+                values += derivative * column(uid)
+            columns[i] = values
+        return columns
@@ -24,8 +24,13 @@ class MinimizerBase(ABC):
         ``_check_success``.
     - The ``fit`` method orchestrates the full workflow and returns
         :class:`FitResults`.
+    - Subclasses setting ``supports_jacobian`` accept a ``jacobian``
+        keyword argument in ``_run_solver``.
     """
 
+    # Whether the solver can use an externally evaluated Jacobian
+    supports_jacobian: bool = False
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -125,6 +130,7 @@ class MinimizerBase(ABC):
         self,
         parameters: List[Any],
         objective_function: Callable[..., Any],
+        jacobian: Optional[Callable[[np.ndarray], np.ndarray]] = None,
     ) -> FitResults:
         """Run the full minimization workflow.
 
@@ -132,6 +138,9 @@ class MinimizerBase(ABC):
             parameters: Free parameters to optimize.
             objective_function: Callable returning residuals for a given
                 set of engine arguments.
+            jacobian: Optional callable returning the Jacobian of the
+                residuals for an array of parameter values. Only used
+                if ``supports_jacobian`` is set.
 
         Returns:
             FitResults with success flag, best chi2 and timing.
@@ -143,6 +152,8 @@ class MinimizerBase(ABC):
         self._start_tracking(minimizer_name)
 
         solver_args = self._prepare_solver_args(parameters)
+        if jacobian is not None and self.supports_jacobian:
+            solver_args['jacobian'] = jacobian
         raw_result = self._run_solver(objective_function, **solver_args)
 
         self._stop_tracking()
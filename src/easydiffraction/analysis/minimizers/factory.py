@@ -8,38 +8,39 @@ from typing import Optional
 from typing import Type
 
 from easydiffraction.analysis.minimizers.base import MinimizerBase
-from easydiffraction.analysis.minimizers.dfols import DfolsMinimizer
-from easydiffraction.analysis.minimizers.lmfit import LmfitMinimizer
+from easydiffraction.utils.lazy import resolve
 from easydiffraction.utils.logging import console
 from easydiffraction.utils.utils import render_table
 
 
 class MinimizerFactory:
+    # Built-in minimizers are registered by import path, so lmfit and
+    # dfols are only imported when selected
     _available_minimizers: Dict[str, Dict[str, Any]] = {
         'lmfit': {
             'engine': 'lmfit',
             'method': 'leastsq',
             'description': 'LMFIT library using the default Levenberg-Marquardt '
             'least squares method',
-            'class': LmfitMinimizer,
+            'class': 'easydiffraction.analysis.minimizers.lmfit:LmfitMinimizer',
         },
         'lmfit (leastsq)': {
             'engine': 'lmfit',
             'method': 'leastsq',
             'description': 'LMFIT library with Levenberg-Marquardt least squares method',
-            'class': LmfitMinimizer,
+            'class': 'easydiffraction.analysis.minimizers.lmfit:LmfitMinimizer',
         },
         'lmfit (least_squares)': {
             'engine': 'lmfit',
             'method': 'least_squares',
             'description': 'LMFIT library with SciPy’s trust region reflective algorithm',
-            'class': LmfitMinimizer,
+            'class': 'easydiffraction.analysis.minimizers.lmfit:LmfitMinimizer',
         },
         'dfols': {
             'engine': 'dfols',
             'method': None,
             'description': 'DFO-LS library for derivative-free least-squares optimization',
-            'class': DfolsMinimizer,
+            'class': 'easydiffraction.analysis.minimizers.dfols:DfolsMinimizer',
         },
     }
 
@@ -93,7 +94,7 @@ class MinimizerFactory:
                 f"Unknown minimizer '{selection}'. Use one of {cls.list_available_minimizers()}"
             )
 
-        minimizer_class: Type[MinimizerBase] = config.get('class')
+        minimizer_class: Type[MinimizerBase] = resolve(config.get('class'))
         method: Optional[str] = config.get('method')
 
         kwargs: Dict[str, Any] = {}
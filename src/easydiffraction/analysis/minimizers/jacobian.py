@@ -0,0 +1,240 @@
+# SPDX-FileCopyrightText: 2021-2026 EasyDiffraction contributors <https://github.com/easyscience/diffraction>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Jacobian providers for gradient-based minimizers.
+
+Gradient-based minimizers estimate the Jacobian by perturbing one free
+parameter at a time, so every step costs as many full pattern
+calculations as there are free parameters.
+
+:class:`ParallelJacobian` evaluates the residuals at the current point
+and at all perturbed points side by side in worker processes. The
+workers are forked from the fitting process, so each of them holds its
+own copy of the project and calculator state, and only parameter values
+and residual arrays are exchanged.
+
+:class:`AnalyticJacobian` takes the columns of parameters with known
+derivatives (e.g. phase scales and background intensities, which the
+pattern depends on linearly) from a derivative function and only
+differentiates the remaining columns numerically.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+
+import numpy as np
+
+from easydiffraction.utils.logging import log
+
+# Relative step of the forward differences, as used by MINPACK with
+# lmfit's default epsfcn of 1e-10
+DEFAULT_RELATIVE_STEP = 1e-5
+
+# Residual function of the current worker process, set by _init_worker
+_worker_residuals = None
+
+
+def _init_worker(residuals: Callable[[np.ndarray], np.ndarray]) -> None:
+    """Keep the residual function inherited from the fitting
+    process.
+    """
+    global _worker_residuals
+    _worker_residuals = residuals
+
+
+def _evaluate_residuals(values: np.ndarray) -> np.ndarray:
+    """Calculate the residuals for the given parameter values."""
+    return np.asarray(_worker_residuals(values), dtype=float)
+
+
+def _forward_steps(
+    values: np.ndarray,
+    lower: Optional[np.ndarray],
+    upper: Optional[np.ndarray],
+    relative_step: float,
+) -> np.ndarray:
+    """Signed forward-difference steps for all parameters.
+
+    Steps go downwards where stepping up would leave the upper bound.
+    """
+    steps = relative_step * np.abs(values)
+    steps[steps == 0.0] = relative_step
+    if upper is not None:
+        beyond_upper = values + steps > upper
+        if lower is not None:
+            beyond_upper &= values - steps >= lower
+        steps[beyond_upper] *= -1
+    return steps
+
+
+class ParallelJacobian:
+    """Forward-difference Jacobian of the residuals with respect to
+    the free parameter values.
+
+    Args:
+        residuals: Function returning the residuals for an array of
+            free parameter values. It is called in worker processes
+            only.
+        num_workers: Number of worker processes.
+        lower: Lower bounds of the parameter values.
+        upper: Upper bounds of the parameter values.
+        relative_step: Step relative to the parameter value.
+    """
+
+    def __init__(
+        self,
+        residuals: Callable[[np.ndarray], np.ndarray],
+        num_workers: int,
+        lower: Optional[np.ndarray] = None,
+        upper: Optional[np.ndarray] = None,
+        relative_step: float = DEFAULT_RELATIVE_STEP,
+    ) -> None:
+        self._pool = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=_init_worker,
+            initargs=(residuals,),
+        )
+        self._lower = lower
+        self._upper = upper
+        self._relative_step = relative_step
+
+    @classmethod
+    def create(
+        cls,
+        residuals: Callable[[np.ndarray], np.ndarray],
+        num_workers: int,
+        lower: Optional[np.ndarray] = None,
+        upper: Optional[np.ndarray] = None,
+    ) -> Optional[ParallelJacobian]:
+        """Create a Jacobian provider, or return ``None`` to let the
+        minimizer estimate the Jacobian itself.
+
+        Worker processes inherit the project by forking, so ``None`` is
+        also returned on platforms without the ``fork`` start method.
+        """
+        if num_workers < 2:
+            return None
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            log.warning(
+                'Parallel Jacobian requires the fork start method. '
+                'Falling back to serial calculation.'
+            )
+            return None
+        return cls(residuals, num_workers, lower=lower, upper=upper)
+
+    def _steps(self, values: np.ndarray) -> np.ndarray:
+        """Signed steps for all parameters."""
+        return _forward_steps(values, self._lower, self._upper, self._relative_step)
+
+    def __call__(
+        self,
+        values: np.ndarray,
+        columns: Optional[Sequence[int]] = None,
+    ) -> np.ndarray:
+        """Evaluate the Jacobian at the given parameter values.
+
+        Args:
+            values: Free parameter values.
+            columns: Indices of the parameters to differentiate. All
+                parameters by default.
+
+        Returns:
+            Array of shape ``(number of residuals, number of
+            columns)``.
+        """
+        values = np.asarray(values, dtype=float)
+        if columns is None:
+            columns = range(values.size)
+        steps = self._steps(values)[list(columns)]
+        points = [values]
+        for i, step in zip(columns, steps, strict=True):
+            point = values.copy()
+            point[i] += step
+            points.append(point)
+
+        residuals = list(self._pool.map(_evaluate_residuals, points))
+        base = residuals[0]
+        jacobian = np.empty((base.size, steps.size))
+        for j, step in enumerate(steps):
+            jacobian[:, j] = (residuals[j + 1] - base) / step
+        return jacobian
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        self._pool.shutdown()
+
+
+class AnalyticJacobian:
+    """Jacobian combining analytic columns with forward differences.
+
+    Args:
+        residuals: Function returning the residuals for an array of
+            free parameter values. It is called in the fitting process
+            and leaves the project in the state of these values.
+        derivatives: Function returning the known Jacobian columns,
+            keyed by parameter index, for the current project state.
+        lower: Lower bounds of the parameter values.
+        upper: Upper bounds of the parameter values.
+        numeric: Optional parallel Jacobian for the remaining columns.
+            Without it, they are differentiated serially.
+        relative_step: Step relative to the parameter value.
+    """
+
+    def __init__(
+        self,
+        residuals: Callable[[np.ndarray], np.ndarray],
+        derivatives: Callable[[], Dict[int, np.ndarray]],
+        lower: Optional[np.ndarray] = None,
+        upper: Optional[np.ndarray] = None,
+        numeric: Optional[ParallelJacobian] = None,
+        relative_step: float = DEFAULT_RELATIVE_STEP,
+    ) -> None:
+        self._residuals = residuals
+        self._derivatives = derivatives
+        self._lower = lower
+        self._upper = upper
+        self._numeric = numeric
+        self._relative_step = relative_step
+
+    def __call__(self, values: np.ndarray) -> np.ndarray:
+        """Evaluate the Jacobian at the given parameter values.
+
+        Args:
+            values: Free parameter values.
+
+        Returns:
+            Array of shape ``(number of residuals, number of
+            parameters)``.
+        """
+        values = np.asarray(values, dtype=float)
+        base = np.asarray(self._residuals(values), dtype=float)
+        known = self._derivatives()
+
+        jacobian = np.empty((base.size, values.size))
+        for i, column in known.items():
+            jacobian[:, i] = column
+
+        missing = [i for i in range(values.size) if i not in known]
+        if not missing:
+            return jacobian
+        if self._numeric is not None:
+            jacobian[:, missing] = self._numeric(values, columns=missing)
+            return jacobian
+
+        steps = _forward_steps(values, self._lower, self._upper, self._relative_step)
+        for i in missing:
+            point = values.copy()
+            point[i] += steps[i]
+            jacobian[:, i] = (self._residuals(point) - base) / steps[i]
+        return jacobian
+
+    def shutdown(self) -> None:
+        """Stop the worker processes of the numeric Jacobian."""
+        if self._numeric is not None:
+            self._numeric.shutdown()
@@ -6,11 +6,15 @@ from typing import Dict
 from typing import List
 
 import lmfit
+import numpy as np
 
 from easydiffraction.analysis.minimizers.base import MinimizerBase
+from easydiffraction.core.parameters import bulk_update
 
 DEFAULT_METHOD = 'leastsq'
 DEFAULT_MAX_ITERATIONS = 1000
+# Methods accepting a user-supplied Jacobian
+JACOBIAN_METHODS = ('leastsq', 'least_squares')
 
 
 class LmfitMinimizer(MinimizerBase):
@@ -28,6 +32,13 @@ class LmfitMinimizer(MinimizerBase):
             max_iterations=max_iterations,
         )
 
+    @property
+    def supports_jacobian(self) -> bool:
+        """Whether the selected method can use an external
+        Jacobian.
+        """
+        return self.method in JACOBIAN_METHODS
+
     def _prepare_solver_args(
         self,
         parameters: List[Any],
@@ -39,7 +50,8 @@ class LmfitMinimizer(MinimizerBase):
 
         Returns:
             A dictionary containing the prepared lmfit. Parameters
-                object.
+                object and the parameter names in the order of
+                ``parameters``.
         """
         engine_parameters = lmfit.Parameters()
         for param in parameters:
@@ -50,7 +62,10 @@ class LmfitMinimizer(MinimizerBase):
                 min=param.fit_min,
                 max=param.fit_max,
             )
-        return {'engine_parameters': engine_parameters}
+        return {
+            'engine_parameters': engine_parameters,
+            'names': [param._minimizer_uid for param in parameters],
+        }
 
     def _run_solver(self, objective_function: Any, **kwargs: Any) -> Any:
         """Runs the lmfit solver.
@@ -63,6 +78,18 @@ class LmfitMinimizer(MinimizerBase):
             The result of the lmfit minimization.
         """
         engine_parameters = kwargs.get('engine_parameters')
+        jacobian = kwargs.get('jacobian')
+
+        fit_kws: Dict[str, Any] = {}
+        if jacobian is not None:
+            names = kwargs.get('names')
+
+            def dfun(params: lmfit.Parameters, *args: Any, **kws: Any) -> np.ndarray:
+                # Intentionally unused, required by Dfun signature
+                del args, kws
+                return jacobian(np.array([params[name].value for name in names]))
+
+            fit_kws['Dfun'] = dfun
 
         return lmfit.minimize(
             objective_function,
@@ -70,6 +97,7 @@ class LmfitMinimizer(MinimizerBase):
             method=self.method,
             nan_policy='propagate',
             max_nfev=self.max_iterations,
+            **fit_kws,
         )
 
     def _sync_result_to_parameters(
@@ -85,11 +113,13 @@ class LmfitMinimizer(MinimizerBase):
         """
         param_values = raw_result.params if hasattr(raw_result, 'params') else raw_result
 
-        for param in parameters:
-            param_result = param_values.get(param._minimizer_uid)
-            if param_result is not None:
-                param._value = param_result.value  # Bypass ranges check
-                param.uncertainty = getattr(param_result, 'stderr', None)
+        # Bypass ranges check
+        with bulk_update():
+            for param in parameters:
+                param_result = param_values.get(param._minimizer_uid)
+                if param_result is not None:
+                    param.value = param_result.value
+                    param.uncertainty = getattr(param_result, 'stderr', None)
 
     def _check_success(self, raw_result: Any) -> bool:
         """Determines success from lmfit MinimizerResult.
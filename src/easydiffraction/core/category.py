@@ -13,6 +13,14 @@ from easydiffraction.io.cif.serialize import category_item_from_cif
 from easydiffraction.io.cif.serialize import category_item_to_cif
 
 
+def _columns_size(columns: dict) -> int:
+    """Return the common length of the given columns."""
+    sizes = {len(values) for values in columns.values()}
+    if len(sizes) > 1:
+        raise ValueError(f'Columns must have the same length, got lengths {sorted(sizes)}.')
+    return sizes.pop() if sizes else 0
+
+
 class CategoryItem(GuardedBase):
     """Base class for items in a category collection."""
 
@@ -20,6 +28,15 @@ class CategoryItem(GuardedBase):
     #  CategoryCollection and use them when serializing to CIF!
     # TODO: Common for all categories
     _update_priority = 10  # Default. Lower values run first.
+    # Names of the sibling categories whose changes require this one to
+    # be updated, or '*' for all of them
+    _depends_on: tuple[str, ...] = ()
+    # Whether the update also reads state outside the datablock, e.g.
+    # linked sample models, so it is rerun after any change
+    _external_inputs = False
+    # Update state, kept per instance once set
+    _dirty = True
+    _updated_revision = -1
 
     def __str__(self) -> str:
         """Human-readable representation of this component."""
@@ -32,6 +49,17 @@ class CategoryItem(GuardedBase):
         del called_by_minimizer
         pass
 
+    def _linear_derivatives(self) -> list:
+        """Return ``(parameter, derivative)`` pairs for parameters the
+        calculated pattern depends on linearly.
+
+        Each derivative is the change of the calculated pattern at the
+        points included in calculations per unit change of the
+        parameter. Categories without such parameters return an empty
+        list.
+        """
+        return []
+
     @property
     def unique_name(self):
         parts = [
@@ -65,6 +93,15 @@ class CategoryCollection(CollectionBase):
 
     # TODO: Common for all categories
     _update_priority = 10  # Default. Lower values run first.
+    # Names of the sibling categories whose changes require this one to
+    # be updated, or '*' for all of them
+    _depends_on: tuple[str, ...] = ()
+    # Whether the update also reads state outside the datablock, e.g.
+    # linked sample models, so it is rerun after any change
+    _external_inputs = False
+    # Update state, kept per instance once set
+    _dirty = True
+    _updated_revision = -1
 
     def __str__(self) -> str:
         """Human-readable representation of this component."""
@@ -77,6 +114,17 @@ class CategoryCollection(CollectionBase):
         del called_by_minimizer
         pass
 
+    def _linear_derivatives(self) -> list:
+        """Return ``(parameter, derivative)`` pairs for parameters the
+        calculated pattern depends on linearly.
+
+        Each derivative is the change of the calculated pattern at the
+        points included in calculations per unit change of the
+        parameter. Categories without such parameters return an empty
+        list.
+        """
+        return []
+
     @property
     def unique_name(self):
         return None
@@ -98,6 +146,32 @@ class CategoryCollection(CollectionBase):
         """Populate this collection from a CIF block."""
         category_collection_from_cif(self, block)
 
+    def _load_columns(self, columns: dict) -> None:
+        """Replace all items with ones built from whole columns.
+
+        Args:
+            columns: Mapping from descriptor name to the values of that
+                descriptor for every item. All columns must have the
+                same length; descriptors without a column keep their
+                defaults.
+
+        Raises:
+            ValueError: If the columns differ in length.
+        """
+        size = _columns_size(columns)
+        for item in self._items:
+            self._release(item)
+        self._items = []
+        for row in range(size):
+            item = self._item_type()
+            params = {param.name: param for param in item.parameters}
+            for name, values in columns.items():
+                params[name].value = values[row]
+            item._parent = self
+            self._items.append(item)
+        self._rebuild_index()
+        self._mark_changed()
+
     @checktype
     def _add(self, item) -> None:
         """Add an item to the collection."""
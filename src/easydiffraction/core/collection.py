@@ -10,6 +10,7 @@ set and delete, along with iteration over the items.
 from __future__ import annotations
 
 from easydiffraction.core.guard import GuardedBase
+from easydiffraction.core.singletons import UidMapHandler
 
 
 class CollectionBase(GuardedBase):
@@ -42,26 +43,49 @@ class CollectionBase(GuardedBase):
         """Insert or replace an item under the given identity key."""
         # Check if item with same identity exists; if so, replace it
         for i, existing_item in enumerate(self._items):
-            if existing_item._identity.category_entry_name == name:
+            if self._key_for(existing_item) == name:
+                if existing_item is not item:
+                    self._release(existing_item)
                 self._items[i] = item
                 self._rebuild_index()
+                self._mark_changed()
                 return
         # Otherwise append new item
         item._parent = self  # Explicitly set the parent for the item
         self._items.append(item)
         self._rebuild_index()
+        self._mark_changed()
 
     def __delitem__(self, name: str) -> None:
         """Delete an item by key or raise ``KeyError`` if missing."""
-        # Remove from _items by identity entry name
+        # Remove from _items by identity key
         for i, item in enumerate(self._items):
-            if item._identity.category_entry_name == name:
-                object.__setattr__(item, '_parent', None)  # Unlink the parent before removal
+            if self._key_for(item) == name:
+                self._release(item)  # Unlink the parent before removal
                 del self._items[i]
                 self._rebuild_index()
+                self._mark_changed()
                 return
         raise KeyError(name)
 
+    def _mark_changed(self) -> None:
+        """Mark the categories depending on this collection for
+        update.
+        """
+        from easydiffraction.core.datablock import mark_changed
+
+        mark_changed(self)
+
+    @staticmethod
+    def _release(item) -> None:
+        """Unlink a removed item and drop its parameters from the UID
+        map.
+        """
+        item._parent = None
+        uid_map_handler = UidMapHandler.get()
+        for param in getattr(item, 'parameters', ()):
+            uid_map_handler.remove_from_uid_map(param)
+
     def __iter__(self):
         """Iterate over items in insertion order."""
         return iter(self._items)
@@ -11,6 +11,32 @@ from easydiffraction.core.collection import CollectionBase
 from easydiffraction.core.guard import GuardedBase
 from easydiffraction.core.parameters import Parameter
 
+# Revision of the model state, bumped on every recorded change. Lets
+# categories with inputs outside their datablock tell whether anything
+# changed since their last update.
+_revision = 0
+
+
+def mark_changed(obj) -> None:
+    """Record a change of ``obj`` or of one of its values.
+
+    The top-level category containing ``obj`` and the categories
+    depending on it are marked for update in their datablock. Changes
+    outside any datablock only bump the revision.
+    """
+    global _revision
+    _revision += 1
+    category = None
+    while obj is not None:
+        # Class attribute checks, much faster than isinstance with ABCs
+        cls = type(obj)
+        if hasattr(cls, '_mark_dirty'):
+            obj._mark_dirty(category)
+            return
+        if hasattr(cls, '_depends_on'):
+            category = obj
+        obj = getattr(obj, '_parent', None)
+
 
 class DatablockItem(GuardedBase):
     """Base class for items in a datablock collection."""
@@ -18,6 +44,18 @@ class DatablockItem(GuardedBase):
     def __init__(self):
         super().__init__()
         self._need_categories_update = False
+        # Categories in update order and, by category id, the
+        # categories to mark when it changes; rebuilt on demand
+        self._category_order = None
+        self._category_dependents = None
+
+    def __setattr__(self, key: str, value) -> None:
+        super().__setattr__(key, value)
+        if isinstance(value, (CategoryItem, CategoryCollection)):
+            self._category_order = None
+            self._category_dependents = None
+            for category in self._dependents_of(value):
+                category._dirty = True
 
     def __str__(self) -> str:
         """Human-readable representation of this component."""
@@ -25,41 +63,94 @@ class DatablockItem(GuardedBase):
         items = getattr(self, '_items', None)
         return f'<{name} ({items})>'
 
+    def _categories_by_name(self) -> dict:
+        """Return the categories of this datablock by attribute name."""
+        return {
+            key.lstrip('_'): v
+            for key, v in vars(self).items()
+            if isinstance(v, (CategoryItem, CategoryCollection))
+        }
+
+    def _dependents_of(self, category) -> list:
+        """Return ``category`` and the categories depending on it,
+        directly or through other categories.
+        """
+        if self._category_dependents is None:
+            by_name = self._categories_by_name()
+            direct = {
+                name: [
+                    other_name
+                    for other_name, other in by_name.items()
+                    if other_name != name
+                    and (name in other._depends_on or '*' in other._depends_on)
+                ]
+                for name in by_name
+            }
+            dependents = {}
+            for name, cat in by_name.items():
+                found = {name: cat}
+                pending = [name]
+                while pending:
+                    for other_name in direct[pending.pop()]:
+                        if other_name not in found:
+                            found[other_name] = by_name[other_name]
+                            pending.append(other_name)
+                dependents[id(cat)] = list(found.values())
+            self._category_dependents = dependents
+        return self._category_dependents.get(id(category), self.categories)
+
+    def _mark_dirty(self, category=None) -> None:
+        """Mark ``category`` and its dependents for update, or all
+        categories if it is not given.
+        """
+        targets = self.categories if category is None else self._dependents_of(category)
+        for target in targets:
+            target._dirty = True
+        self._need_categories_update = True
+
     def _update_categories(
         self,
         called_by_minimizer=False,
     ) -> None:
-        # TODO: Make abstract method and implement in subclasses.
-        # This should call apply_symmetry and apply_constraints in the
-        # case of sample models. In the case of experiments, it should
-        # run calculations to update the "data" categories.
-        # Any parameter change should set _need_categories_update to
-        # True.
-        # Calling as_cif or data getter should first check this flag
-        # and call this method if True.
-        # Should this be also called when parameters are accessed? E.g.
-        # if one change background coefficients, then access the
-        # background points in the data category?
-        # return
-        # if not self._need_categories_update:
-        #    return
+        """Update the categories changed since their last update, and
+        the categories depending on them, in priority order.
 
+        Categories with inputs outside the datablock are also updated
+        whenever anything changed since their last update.
+        """
         for category in self.categories:
-            category._update(called_by_minimizer=called_by_minimizer)
+            if category._dirty or (
+                category._external_inputs and category._updated_revision != _revision
+            ):
+                category._update(called_by_minimizer=called_by_minimizer)
+                category._dirty = False
+                category._updated_revision = _revision
 
         self._need_categories_update = False
 
+    def _linear_derivatives(self) -> list:
+        """Return ``(parameter, derivative)`` pairs for parameters the
+        calculated pattern depends on linearly, collected from all
+        categories.
+        """
+        derivatives = []
+        for category in self.categories:
+            derivatives.extend(category._linear_derivatives())
+        return derivatives
+
     @property
     def unique_name(self):
         return self._identity.datablock_entry_name
 
     @property
     def categories(self):
-        cats = [
-            v for v in vars(self).values() if isinstance(v, (CategoryItem, CategoryCollection))
-        ]
-        # Sort by _update_priority (lower values first)
-        return sorted(cats, key=lambda c: type(c)._update_priority)
+        if self._category_order is None:
+            # Sort by _update_priority (lower values first)
+            self._category_order = sorted(
+                self._categories_by_name().values(),
+                key=lambda c: type(c)._update_priority,
+            )
+        return list(self._category_order)
 
     @property
     def parameters(self):
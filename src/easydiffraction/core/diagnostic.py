@@ -4,6 +4,10 @@
 
 This module centralizes human-friendly error and debug logs for
 attribute validation and configuration checks.
+
+Validation diagnostics accept the attribute name either as a string or
+as a callable returning it, so that the name is only built when a
+message is actually emitted.
 """
 
 import difflib
@@ -79,6 +83,7 @@ class Diagnostics:
         default=None,
     ):
         """Log a type mismatch and keep current or default value."""
+        name = Diagnostics._resolve_name(name)
         got_type = type(value).__name__
         msg = (
             f'Type mismatch for <{name}>. '
@@ -98,6 +103,7 @@ class Diagnostics:
         default=None,
     ):
         """Log range violation for a numeric value."""
+        name = Diagnostics._resolve_name(name)
         msg = f'Value mismatch for <{name}>. Provided {value!r} outside [{ge}, {le}].'
         Diagnostics._log_error_with_fallback(
             msg, current=current, default=default, exc_type=TypeError
@@ -112,6 +118,7 @@ class Diagnostics:
         default=None,
     ):
         """Log an invalid choice against allowed values."""
+        name = Diagnostics._resolve_name(name)
         msg = f'Value mismatch for <{name}>. Provided {value!r} is unknown.'
         if allowed is not None:
             msg += Diagnostics._build_allowed(allowed, label='Allowed values')
@@ -128,6 +135,7 @@ class Diagnostics:
         default=None,
     ):
         """Log a regex mismatch with the expected pattern."""
+        name = Diagnostics._resolve_name(name)
         msg = (
             f"Value mismatch for <{name}>. Provided {value!r} does not match pattern '{pattern}'."
         )
@@ -138,16 +146,19 @@ class Diagnostics:
     @staticmethod
     def no_value(name, default):
         """Log that default will be used due to missing value."""
+        name = Diagnostics._resolve_name(name)
         Diagnostics._log_debug(f'No value provided for <{name}>. Using default {default!r}.')
 
     @staticmethod
     def none_value(name):
         """Log explicit None provided by a user."""
+        name = Diagnostics._resolve_name(name)
         Diagnostics._log_debug(f'Using `None` explicitly provided for <{name}>.')
 
     @staticmethod
     def none_value_skip_range(name):
         """Log that range validation is skipped due to None."""
+        name = Diagnostics._resolve_name(name)
         Diagnostics._log_debug(
             f'Skipping range validation as `None` is explicitly provided for <{name}>.'
         )
@@ -155,6 +166,9 @@ class Diagnostics:
     @staticmethod
     def validated(name, value, stage: str | None = None):
         """Log that a value passed a validation stage."""
+        if not log.debug_enabled():
+            return
+        name = Diagnostics._resolve_name(name)
         stage_info = f' {stage}' if stage else ''
         Diagnostics._log_debug(f'Value {value!r} for <{name}> passed{stage_info} validation.')
 
@@ -162,6 +176,11 @@ class Diagnostics:
     # Helper log methods
     # ==============================================================
 
+    @staticmethod
+    def _resolve_name(name) -> str:
+        """Return the name, calling it first if it is a callable."""
+        return name() if callable(name) else name
+
     @staticmethod
     def _log_error(msg, exc_type=Exception):
         """Emit an error-level message via shared logger."""
@@ -6,16 +6,32 @@ from abc import abstractmethod
 
 from easydiffraction.core.diagnostic import Diagnostics
 from easydiffraction.core.identity import Identity
+from easydiffraction.core.identity import invalidate_identities
 
 
 class GuardedBase(ABC):
     """Base class enforcing controlled attribute access and parent
     linkage.
+
+    The identity and parent are slots, so that subclasses declaring
+    ``__slots__`` themselves (e.g. descriptors and parameters) carry no
+    per-instance ``__dict__``.
     """
 
+    __slots__ = ('_identity', '_parent', '__weakref__')
+
     _diagnoser = Diagnostics()
 
+    # Names of the public properties of the class: all, read-only and
+    # writable ones. Computed once per class, when it is created.
+    _public_attr_sets: tuple[frozenset[str], frozenset[str], frozenset[str]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._public_attr_sets = cls._collect_public_attrs()
+
     def __init__(self):
+        object.__setattr__(self, '_parent', None)
         self._identity = Identity(owner=self)
 
     def __str__(self) -> str:
@@ -42,6 +58,10 @@ class GuardedBase(ABC):
             # Also maintain parent linkage for nested objects
             if key != '_parent' and isinstance(value, GuardedBase):
                 object.__setattr__(value, '_parent', self)
+                invalidate_identities()
+            # Reparenting or renaming changes the identity paths
+            elif key in ('_parent', '_name'):
+                invalidate_identities()
             return
 
         # Handle public attributes with diagnostics
@@ -72,6 +92,7 @@ class GuardedBase(ABC):
         object.__setattr__(self, key, value)
         if key != '_parent' and isinstance(value, GuardedBase):
             object.__setattr__(value, '_parent', self)
+            invalidate_identities()
 
     @classmethod
     def _iter_properties(cls):
@@ -89,19 +110,34 @@ class GuardedBase(ABC):
                 yield key, attr
 
     @classmethod
-    def _public_attrs(cls):
+    def _collect_public_attrs(cls):
+        """Scan the class hierarchy for public property names.
+
+        Returns:
+            tuple[frozenset[str], frozenset[str], frozenset[str]]: All,
+            read-only and writable public property names.
+        """
+        props = list(cls._iter_properties())
+        return (
+            frozenset(key for key, _ in props),
+            frozenset(key for key, prop in props if prop.fset is None),
+            frozenset(key for key, prop in props if prop.fset is not None),
+        )
+
+    @classmethod
+    def _public_attrs(cls) -> frozenset[str]:
         """All public properties (read-only + writable)."""
-        return {key for key, _ in cls._iter_properties()}
+        return cls._public_attr_sets[0]
 
     @classmethod
-    def _public_readonly_attrs(cls):
+    def _public_readonly_attrs(cls) -> frozenset[str]:
         """Public properties without a setter."""
-        return {key for key, prop in cls._iter_properties() if prop.fset is None}
+        return cls._public_attr_sets[1]
 
     @classmethod
-    def _public_writable_attrs(cls) -> set[str]:
+    def _public_writable_attrs(cls) -> frozenset[str]:
         """Public properties with a setter."""
-        return {key for key, prop in cls._iter_properties() if prop.fset is not None}
+        return cls._public_attr_sets[2]
 
     def _allowed_attrs(self, writable_only=False):
         cls = type(self)
@@ -109,6 +145,12 @@ class GuardedBase(ABC):
             return cls._public_writable_attrs()
         return cls._public_attrs()
 
+    def _on_child_value_changed(self, child) -> None:
+        """Hook called after the value of a child descriptor has
+        changed. Does nothing by default.
+        """
+        del child
+
     @property
     def _log_name(self):
         return self.unique_name or type(self).__name__
@@ -141,3 +183,6 @@ class GuardedBase(ABC):
         by subclasses).
         """
         raise NotImplementedError
+
+
+GuardedBase._public_attr_sets = GuardedBase._collect_public_attrs()
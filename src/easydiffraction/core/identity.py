@@ -4,14 +4,36 @@
 
 Used by containers and items to expose datablock/category/entry names
 without tight coupling.
+
+Resolved names are cached per object. All caches are invalidated at
+once by :func:`invalidate_identities`, which is called whenever an
+object is reparented or renamed.
 """
 
 from typing import Callable
 
+# Revision of the identity paths, bumped on reparenting or renaming
+_revision = 0
+
+
+def invalidate_identities() -> None:
+    """Invalidate the cached names of all identities."""
+    global _revision
+    _revision += 1
+
 
 class Identity:
     """Resolve datablock/category/entry relationships lazily."""
 
+    __slots__ = (
+        '_owner',
+        '_datablock_entry',
+        '_category_code',
+        '_category_entry',
+        '_cache',
+        '_cache_revision',
+    )
+
     def __init__(
         self,
         *,
@@ -24,6 +46,35 @@ class Identity:
         self._datablock_entry = datablock_entry
         self._category_code = category_code
         self._category_entry = category_entry
+        self._cache: dict | None = None
+        self._cache_revision = -1
+
+    def __getstate__(self) -> dict:
+        """Drop the cached names, which are only valid within this
+        process.
+        """
+        state = {key: getattr(self, key) for key in self.__slots__}
+        state['_cache'] = None
+        state['_cache_revision'] = -1
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the slots from a pickled state."""
+        for key, value in state.items():
+            setattr(self, key, value)
+
+    def _resolved(self, attr: str):
+        """Return the resolved attribute, cached until the identity
+        paths change.
+        """
+        if self._cache_revision != _revision:
+            self._cache = {}
+            self._cache_revision = _revision
+        try:
+            return self._cache[attr]
+        except KeyError:
+            value = self._cache[attr] = self._resolve_up(attr)
+            return value
 
     def _resolve_up(self, attr: str, visited=None):
         """Resolve attribute by walking up parent chain safely."""
@@ -41,7 +92,7 @@ class Identity:
             return value
 
         # Climb to parent if available
-        parent = getattr(self._owner, '__dict__', {}).get('_parent')
+        parent = getattr(self._owner, '_parent', None)
         if parent and hasattr(parent, '_identity'):
             return parent._identity._resolve_up(attr, visited)
         return None
@@ -49,29 +100,32 @@ class Identity:
     @property
     def datablock_entry_name(self):
         """Datablock entry name or None if not set."""
-        return self._resolve_up('datablock_entry')
+        return self._resolved('datablock_entry')
 
     @datablock_entry_name.setter
     def datablock_entry_name(self, func: callable):
         """Set callable returning datablock entry name."""
         self._datablock_entry = func
+        invalidate_identities()
 
     @property
     def category_code(self):
         """Category code like 'atom_site' or 'background'."""
-        return self._resolve_up('category_code')
+        return self._resolved('category_code')
 
     @category_code.setter
     def category_code(self, value: str):
         """Set category code value."""
         self._category_code = value
+        invalidate_identities()
 
     @property
     def category_entry_name(self):
         """Category entry name or None if not set."""
-        return self._resolve_up('category_entry')
+        return self._resolved('category_entry')
 
     @category_entry_name.setter
     def category_entry_name(self, func: callable):
         """Set callable returning category entry name."""
         self._category_entry = func
+        invalidate_identities()
@@ -3,8 +3,8 @@
 
 from __future__ import annotations
 
-import secrets
-import string
+import itertools
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -12,6 +12,7 @@ import numpy as np
 
 from easydiffraction.core.diagnostic import Diagnostics
 from easydiffraction.core.guard import GuardedBase
+from easydiffraction.core.identity import invalidate_identities
 from easydiffraction.core.singletons import UidMapHandler
 from easydiffraction.core.validation import AttributeSpec
 from easydiffraction.core.validation import DataTypes
@@ -23,6 +24,46 @@ from easydiffraction.io.cif.serialize import param_to_cif
 if TYPE_CHECKING:
     from easydiffraction.io.cif.handler import CifHandler
 
+# Source of parameter UIDs, and the table spelling its hexadecimal
+# digits with the letters 'a' to 'p'
+_uid_counter = itertools.count(1)
+_UID_LETTERS = str.maketrans('0123456789abcdef', 'abcdefghijklmnop')
+
+# Descriptors written within `bulk_update`, one per owner, or None
+# outside of it
+_bulk_updated: dict | None = None
+
+
+@contextmanager
+def bulk_update():
+    """Context for trusted, batched descriptor assignments.
+
+    Within the context, ``descriptor.value = v`` stores ``v`` without
+    running the validators of the descriptor, and the categories
+    depending on the changed values are marked for update once per
+    owner, when the outermost context exits, instead of on every
+    assignment. Owners are still notified of each change.
+
+    Use it only for values computed from already validated ones, e.g.
+    when applying symmetry constraints::
+
+        with bulk_update():
+            cell.length_b.value = cell.length_a.value
+    """
+    global _bulk_updated
+    if _bulk_updated is not None:
+        yield
+        return
+    _bulk_updated = {}
+    try:
+        yield
+    finally:
+        from easydiffraction.core.datablock import mark_changed
+
+        updated, _bulk_updated = _bulk_updated, None
+        for descriptor in updated.values():
+            mark_changed(descriptor)
+
 
 class GenericDescriptorBase(GuardedBase):
     """Base class for all parameter-like descriptors.
@@ -39,6 +80,8 @@ class GenericDescriptorBase(GuardedBase):
         uid: Stable random identifier for external references.
     """
 
+    __slots__ = ('_value_spec', '_name', '_description', '_value')
+
     _BOOL_SPEC_TEMPLATE = AttributeSpec(
         type_=DataTypes.BOOL,
         default=False,
@@ -76,7 +119,7 @@ class GenericDescriptorBase(GuardedBase):
                 )
             else:
                 # Enforce descriptor's own type if not already defined
-                value_spec._type_validator = TypeValidator(expected_type)
+                value_spec._type_validator = TypeValidator.shared(expected_type)
 
         self._value_spec = value_spec
         self._name = name
@@ -85,7 +128,7 @@ class GenericDescriptorBase(GuardedBase):
         # Initial validated states
         self._value = self._value_spec.validated(
             value_spec.value,
-            name=self.unique_name,
+            name=lambda: self.unique_name,
         )
 
     def __str__(self) -> str:
@@ -123,12 +166,6 @@ class GenericDescriptorBase(GuardedBase):
             obj = getattr(obj, '_parent', None)
         return None
 
-    def _datablock_item(self):
-        """Return the DatablockItem ancestor, if any."""
-        from easydiffraction.core.datablock import DatablockItem
-
-        return self._parent_of_type(DatablockItem)
-
     @property
     def value(self):
         """Current validated value."""
@@ -141,18 +178,34 @@ class GenericDescriptorBase(GuardedBase):
         if self._value == v:
             return
 
-        # Validate and set the new value
-        self._value = self._value_spec.validated(
-            v,
-            name=self.unique_name,
-            current=self._value,
-        )
+        owner = self._parent
+
+        if _bulk_updated is not None:
+            # Trusted write: the categories are marked once per owner
+            # when the bulk update ends
+            self._value = v
+            _bulk_updated.setdefault(id(owner), self)
+        else:
+            # Validate and set the new value
+            self._value = self._value_spec.validated(
+                v,
+                name=lambda: self.unique_name,
+                current=self._value,
+            )
 
-        # Mark parent datablock as needing categories update
-        # TODO: Check if it is actually in use?
-        parent_datablock = self._datablock_item()
-        if parent_datablock is not None:
-            parent_datablock._need_categories_update = True
+            # Mark the categories depending on this value for update
+            from easydiffraction.core.datablock import mark_changed
+
+            mark_changed(self)
+
+        # String values may name their owner, e.g. atom site labels
+        if isinstance(v, str):
+            invalidate_identities()
+
+        # Notify the owner, e.g. a data point view writing the value
+        # back to its columnar storage
+        if isinstance(owner, GuardedBase):
+            owner._on_child_value_changed(self)
 
     @property
     def description(self):
@@ -180,6 +233,8 @@ class GenericDescriptorBase(GuardedBase):
 
 
 class GenericStringDescriptor(GenericDescriptorBase):
+    __slots__ = ()
+
     _value_type = DataTypes.STRING
 
     def __init__(
@@ -190,6 +245,8 @@ class GenericStringDescriptor(GenericDescriptorBase):
 
 
 class GenericNumericDescriptor(GenericDescriptorBase):
+    __slots__ = ('_units',)
+
     _value_type = DataTypes.NUMERIC
 
     def __init__(
@@ -222,6 +279,29 @@ class GenericParameter(GenericNumericDescriptor):
     integrate with specific backends while preserving this interface.
     """
 
+    __slots__ = (
+        '_free',
+        '_uncertainty',
+        '_fit_min',
+        '_fit_max',
+        '_start_value',
+        '_constrained',
+        '_fit_start_value',
+        '_uid',
+    )
+
+    # Specs of the fitting-related attributes, shared by all parameters
+    _free_spec = GenericDescriptorBase._BOOL_SPEC_TEMPLATE
+    _uncertainty_spec = AttributeSpec(
+        type_=DataTypes.NUMERIC,
+        content_validator=RangeValidator(ge=0),
+        allow_none=True,
+    )
+    _fit_min_spec = AttributeSpec(type_=DataTypes.NUMERIC, default=-np.inf)
+    _fit_max_spec = AttributeSpec(type_=DataTypes.NUMERIC, default=np.inf)
+    _start_value_spec = AttributeSpec(type_=DataTypes.NUMERIC, default=0.0)
+    _constrained_spec = GenericDescriptorBase._BOOL_SPEC_TEMPLATE
+
     def __init__(
         self,
         **kwargs: Any,
@@ -229,22 +309,14 @@ class GenericParameter(GenericNumericDescriptor):
         super().__init__(**kwargs)
 
         # Initial validated states
-        self._free_spec = self._BOOL_SPEC_TEMPLATE
         self._free = self._free_spec.default
-        self._uncertainty_spec = AttributeSpec(
-            type_=DataTypes.NUMERIC,
-            content_validator=RangeValidator(ge=0),
-            allow_none=True,
-        )
         self._uncertainty = self._uncertainty_spec.default
-        self._fit_min_spec = AttributeSpec(type_=DataTypes.NUMERIC, default=-np.inf)
         self._fit_min = self._fit_min_spec.default
-        self._fit_max_spec = AttributeSpec(type_=DataTypes.NUMERIC, default=np.inf)
         self._fit_max = self._fit_max_spec.default
-        self._start_value_spec = AttributeSpec(type_=DataTypes.NUMERIC, default=0.0)
         self._start_value = self._start_value_spec.default
-        self._constrained_spec = self._BOOL_SPEC_TEMPLATE
         self._constrained = self._constrained_spec.default
+        # Value at the start of the last fit, set by the fitter
+        self._fit_start_value = None
 
         self._uid: str = self._generate_uid()
         UidMapHandler.get().add_to_uid_map(self)
@@ -261,8 +333,19 @@ class GenericParameter(GenericNumericDescriptor):
 
     @staticmethod
     def _generate_uid(length: int = 16) -> str:
-        letters = string.ascii_lowercase
-        return ''.join(secrets.choice(letters) for _ in range(length))
+        """Return a new uid of ``length`` lowercase letters.
+
+        Uids are numbered by a process-wide counter instead of being
+        drawn at random, so a project built in the same order gets the
+        same uids in every session. Uids already taken by a live
+        parameter, e.g. after :meth:`UidMapHandler.replace_uid`, are
+        skipped.
+        """
+        uid_map = UidMapHandler.get().get_uid_map()
+        while True:
+            uid = f'{next(_uid_counter):0{length}x}'.translate(_UID_LETTERS)
+            if uid not in uid_map:
+                return uid
 
     @property
     def uid(self):
@@ -305,7 +388,7 @@ class GenericParameter(GenericNumericDescriptor):
     def free(self, v):
         """Set the "free" flag after validation."""
         self._free = self._free_spec.validated(
-            v, name=f'{self.unique_name}.free', current=self._free
+            v, name=lambda: f'{self.unique_name}.free', current=self._free
         )
 
     @property
@@ -319,7 +402,7 @@ class GenericParameter(GenericNumericDescriptor):
     def uncertainty(self, v):
         """Set the uncertainty value (must be non-negative or None)."""
         self._uncertainty = self._uncertainty_spec.validated(
-            v, name=f'{self.unique_name}.uncertainty', current=self._uncertainty
+            v, name=lambda: f'{self.unique_name}.uncertainty', current=self._uncertainty
         )
 
     @property
@@ -331,7 +414,7 @@ class GenericParameter(GenericNumericDescriptor):
     def fit_min(self, v):
         """Set the lower bound for the parameter value."""
         self._fit_min = self._fit_min_spec.validated(
-            v, name=f'{self.unique_name}.fit_min', current=self._fit_min
+            v, name=lambda: f'{self.unique_name}.fit_min', current=self._fit_min
         )
 
     @property
@@ -343,11 +426,13 @@ class GenericParameter(GenericNumericDescriptor):
     def fit_max(self, v):
         """Set the upper bound for the parameter value."""
         self._fit_max = self._fit_max_spec.validated(
-            v, name=f'{self.unique_name}.fit_max', current=self._fit_max
+            v, name=lambda: f'{self.unique_name}.fit_max', current=self._fit_max
         )
 
 
 class StringDescriptor(GenericStringDescriptor):
+    __slots__ = ('_cif_handler',)
+
     def __init__(
         self,
         *,
@@ -366,6 +451,8 @@ class StringDescriptor(GenericStringDescriptor):
 
 
 class NumericDescriptor(GenericNumericDescriptor):
+    __slots__ = ('_cif_handler',)
+
     def __init__(
         self,
         *,
@@ -384,6 +471,8 @@ class NumericDescriptor(GenericNumericDescriptor):
 
 
 class Parameter(GenericParameter):
+    __slots__ = ('_cif_handler',)
+
     def __init__(
         self,
         *,
@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: 2021-2026 EasyDiffraction contributors <https://github.com/easyscience/diffraction>
 # SPDX-License-Identifier: BSD-3-Clause
 
+import ast
+import weakref
 from typing import Any
 from typing import Dict
 from typing import List
@@ -8,8 +10,11 @@ from typing import Tuple
 from typing import Type
 from typing import TypeVar
 
+import numpy as np
 from asteval import Interpreter
 
+from easydiffraction.utils.logging import log
+
 T = TypeVar('T', bound='SingletonBase')
 
 
@@ -31,13 +36,18 @@ class SingletonBase:
 
 
 class UidMapHandler(SingletonBase):
-    """Global handler to manage UID-to-Parameter object mapping."""
+    """Global handler to manage UID-to-Parameter object mapping.
+
+    Parameters are referenced weakly, so that they leave the map once
+    the project owning them is discarded. Parameters of removed items
+    are dropped explicitly, see :meth:`remove_from_uid_map`.
+    """
 
     def __init__(self) -> None:
-        # Internal map: uid (str) → Parameter instance
-        self._uid_map: Dict[str, Any] = {}
+        # Internal map: uid (str) → Parameter instance (weak reference)
+        self._uid_map: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
 
-    def get_uid_map(self) -> Dict[str, Any]:
+    def get_uid_map(self) -> weakref.WeakValueDictionary:
         """Returns the current UID-to-Parameter map."""
         return self._uid_map
 
@@ -68,7 +78,67 @@ class UidMapHandler(SingletonBase):
             raise KeyError(f"UID '{old_uid}' not found in the UID map.")
         self._uid_map[new_uid] = self._uid_map.pop(old_uid)
 
-    # TODO: Implement removing from the UID map
+    def remove_from_uid_map(self, parameter) -> None:
+        """Removes a single Parameter object from the UID map.
+
+        Objects without a UID, e.g. plain descriptors, and parameters
+        not in the map are ignored.
+        """
+        from easydiffraction.core.parameters import GenericParameter
+
+        if not isinstance(parameter, GenericParameter):
+            return
+        if self._uid_map.get(parameter.uid) is parameter:
+            del self._uid_map[parameter.uid]
+
+
+def _affine_terms(node, aliases) -> Tuple[float, Dict[str, float]] | None:
+    """Decompose an expression into a constant and alias coefficients.
+
+    Args:
+        node: Syntax tree of the expression, as parsed by asteval.
+        aliases: Names that may appear in the expression.
+
+    Returns:
+        ``(constant, {alias: coefficient})`` if the expression is an
+        affine function of the aliases, e.g. ``1 - 2 * occ_La``, or
+        None otherwise.
+    """
+    if isinstance(node, ast.Module):
+        if len(node.body) != 1 or not isinstance(node.body[0], ast.Expr):
+            return None
+        return _affine_terms(node.body[0].value, aliases)
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            return None
+        return float(node.value), {}
+    if isinstance(node, ast.Name):
+        return (0.0, {node.id: 1.0}) if node.id in aliases else None
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        terms = _affine_terms(node.operand, aliases)
+        if terms is None or isinstance(node.op, ast.UAdd):
+            return terms
+        return -terms[0], {name: -coef for name, coef in terms[1].items()}
+    if not isinstance(node, ast.BinOp):
+        return None
+    left = _affine_terms(node.left, aliases)
+    right = _affine_terms(node.right, aliases)
+    if left is None or right is None:
+        return None
+    if isinstance(node.op, (ast.Add, ast.Sub)):
+        sign = 1.0 if isinstance(node.op, ast.Add) else -1.0
+        coefs = dict(left[1])
+        for name, coef in right[1].items():
+            coefs[name] = coefs.get(name, 0.0) + sign * coef
+        return left[0] + sign * right[0], coefs
+    if isinstance(node.op, ast.Mult):
+        if left[1] and right[1]:
+            return None
+        (factor, _), (const, coefs) = (left, right) if not left[1] else (right, left)
+        return factor * const, {name: factor * coef for name, coef in coefs.items()}
+    if isinstance(node.op, ast.Div) and not right[1] and right[0] != 0:
+        return left[0] / right[0], {name: coef / right[0] for name, coef in left[1].items()}
+    return None
 
 
 # TODO: Implement changing atrr '.constrained' back to False
@@ -80,6 +150,17 @@ class ConstraintsHandler(SingletonBase):
     Uses the asteval interpreter for safe evaluation of mathematical
     expressions. Constraints are defined as: lhs_alias =
     expression(rhs_aliases).
+
+    Each expression is parsed once and its syntax tree is reused.
+    Constraints are ordered so that those depending on the result of
+    another constraint come after it, and chained constraints resolve
+    in a single pass.
+
+    Linear constraints, e.g. ``occ_Ba = 1 - occ_La`` or
+    ``biso_a = biso_b``, are collected into a sparse matrix over the
+    independent aliases and applied together as one matrix-vector
+    product. Set :attr:`vectorize_linear` to False to evaluate them one
+    by one like other constraints.
     """
 
     def __init__(self) -> None:
@@ -91,9 +172,24 @@ class ConstraintsHandler(SingletonBase):
         # Each value should contain: lhs_alias, rhs_expr
         self._constraints = {}
 
-        # Internally parsed constraints as (lhs_alias, rhs_expr) tuples
+        # Internally parsed constraints as (lhs_alias, rhs_expr)
+        # tuples, in evaluation order
         self._parsed_constraints: List[Tuple[str, str]] = []
 
+        # Parsed syntax trees by expression, shared interpreter, and
+        # alias values after the last application of the constraints
+        self._nodes: Dict[str, Any] = {}
+        self._interpreter: Interpreter | None = None
+        self._applied_values: Dict[str, Any] | None = None
+
+        # Whether linear constraints are applied as a matrix product
+        self.vectorize_linear: bool = True
+
+        # Linear constraints as (inputs, outputs, matrix, offset), so
+        # that outputs = matrix @ inputs + offset, built on first use
+        self._linear_system: Tuple | None = None
+        self._linear_system_ready: bool = False
+
     def set_aliases(self, aliases):
         """Sets the alias map (name → parameter wrapper).
 
@@ -101,6 +197,10 @@ class ConstraintsHandler(SingletonBase):
             alias='biso_La', param=model.atom_sites['La'].b_iso
         """
         self._alias_to_param = dict(aliases.items())
+        # Start from a clean symbol table without removed aliases
+        self._interpreter = None
+        self._applied_values = None
+        self._linear_system_ready = False
 
     def set_constraints(self, constraints):
         """Sets the constraints and triggers parsing into internal
@@ -115,9 +215,9 @@ class ConstraintsHandler(SingletonBase):
     def _parse_constraints(self) -> None:
         """Converts raw expression input into a normalized internal list
         of (lhs_alias, rhs_expr) pairs, stripping whitespace and
-        skipping invalid entries.
+        skipping invalid entries, in evaluation order.
         """
-        self._parsed_constraints = []
+        parsed = []
 
         for expr_obj in self._constraints:
             lhs_alias = expr_obj.lhs_alias.value
@@ -125,47 +225,266 @@ class ConstraintsHandler(SingletonBase):
 
             if lhs_alias and rhs_expr:
                 constraint = (lhs_alias.strip(), rhs_expr.strip())
-                self._parsed_constraints.append(constraint)
+                if self._node(constraint[1]) is not None:
+                    parsed.append(constraint)
+
+        self._parsed_constraints = self._ordered(parsed)
+        self._applied_values = None
+        self._linear_system_ready = False
+
+    def _node(self, rhs_expr: str):
+        """Return the parsed syntax tree of an expression, or None if
+        it cannot be parsed.
+        """
+        try:
+            return self._nodes[rhs_expr]
+        except KeyError:
+            pass
+        ae = self._get_interpreter()
+        ae.error = []
+        try:
+            node = ae.parse(rhs_expr)
+        except Exception as error:
+            message = ae.error[-1].get_error()[1] if ae.error else error
+            log.warning(f"Failed to parse constraint expression '{rhs_expr}': {message}")
+            node = None
+        self._nodes[rhs_expr] = node
+        return node
+
+    def _ordered(self, constraints: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Sort constraints so that each one follows the constraints
+        defining the aliases its expression uses.
+
+        The given order is kept where there is no dependency. Circular
+        constraints are reported and kept in the given order after all
+        others.
+        """
+        lhs_aliases = {lhs_alias for lhs_alias, _ in constraints}
+        depends_on = {}
+        for lhs_alias, rhs_expr in constraints:
+            names = {n.id for n in ast.walk(self._node(rhs_expr)) if isinstance(n, ast.Name)}
+            depends_on[lhs_alias] = (names & lhs_aliases) - {lhs_alias}
+
+        ordered = []
+        resolved = set()
+        pending = list(constraints)
+        while pending:
+            ready = [c for c in pending if depends_on[c[0]] <= resolved]
+            if not ready:
+                cycle = ', '.join(lhs_alias for lhs_alias, _ in pending)
+                log.warning(f'Circular constraints for: {cycle}')
+                ordered.extend(pending)
+                break
+            ordered.extend(ready)
+            resolved.update(lhs_alias for lhs_alias, _ in ready)
+            pending = [c for c in pending if c not in ready]
+        return ordered
+
+    def _linear(self) -> Tuple | None:
+        """Return the linear constraints as a sparse matrix system.
+
+        A constraint is included if its expression is affine in aliases
+        that are either independent or defined by included constraints.
+        The latter are substituted, so the matrix maps the independent
+        aliases directly to all included dependent ones.
+
+        Returns:
+            ``(inputs, outputs, matrix, offset)`` with the names of the
+            independent and dependent aliases, a sparse matrix of
+            shape ``(len(outputs), len(inputs))`` and the constant
+            offsets, or None if no constraint is linear.
+        """
+        if self._linear_system_ready:
+            return self._linear_system
+        self._linear_system_ready = True
+        self._linear_system = None
+
+        aliases = set(self._alias_to_param)
+        lhs_aliases = {lhs_alias for lhs_alias, _ in self._parsed_constraints}
+        expanded = {}
+        for lhs_alias, rhs_expr in self._parsed_constraints:
+            terms = _affine_terms(self._node(rhs_expr), aliases)
+            if terms is None or lhs_alias in expanded:
+                continue
+            const, coefs = terms
+            flat = {}
+            for name, coef in coefs.items():
+                if name in expanded:
+                    sub_const, sub_coefs = expanded[name]
+                    const += coef * sub_const
+                    for sub_name, sub_coef in sub_coefs.items():
+                        flat[sub_name] = flat.get(sub_name, 0.0) + coef * sub_coef
+                elif name in lhs_aliases:
+                    break  # Depends on a constraint that is not linear
+                else:
+                    flat[name] = flat.get(name, 0.0) + coef
+            else:
+                expanded[lhs_alias] = (const, flat)
+        if not expanded:
+            return None
+
+        from scipy import sparse
+
+        outputs = list(expanded)
+        inputs = sorted({name for _, coefs in expanded.values() for name in coefs})
+        columns = {name: i for i, name in enumerate(inputs)}
+        rows, cols, data = [], [], []
+        for row, lhs_alias in enumerate(outputs):
+            for name, coef in expanded[lhs_alias][1].items():
+                if coef != 0:
+                    rows.append(row)
+                    cols.append(columns[name])
+                    data.append(coef)
+        matrix = sparse.csr_matrix((data, (rows, cols)), shape=(len(outputs), len(inputs)))
+        offset = np.array([expanded[lhs_alias][0] for lhs_alias in outputs])
+        self._linear_system = (inputs, outputs, matrix, offset)
+        return self._linear_system
+
+    def _get_interpreter(self) -> Interpreter:
+        """Return the interpreter evaluating the expressions."""
+        if self._interpreter is None:
+            self._interpreter = Interpreter()
+        return self._interpreter
+
+    def _evaluate(self, values: Dict[str, Any]) -> List[Any]:
+        """Evaluate all constraints in order for the given alias values.
+
+        The result of each constraint is visible to the constraints
+        after it. A constraint that fails to evaluate is reported and
+        yields None.
+
+        Returns:
+            The value of each constraint, in the order of
+            ``_parsed_constraints``.
+        """
+        ae = self._get_interpreter()
+        ae.symtable.update(values)
+
+        # Linear constraints first: they only depend on independent
+        # aliases, while other constraints may depend on them
+        linear_values = {}
+        linear = self._linear() if self.vectorize_linear else None
+        if linear is not None:
+            inputs, outputs, matrix, offset = linear
+            x = np.array([values[name] for name in inputs], dtype=float)
+            linear_values = dict(zip(outputs, (matrix @ x + offset).tolist(), strict=True))
+            ae.symtable.update(linear_values)
+
+        results = []
+        for lhs_alias, rhs_expr in self._parsed_constraints:
+            if lhs_alias in linear_values:
+                results.append(linear_values[lhs_alias])
+                continue
+            ae.error = []
+            rhs_value = ae.run(self._node(rhs_expr), expr=rhs_expr, with_raise=False)
+            if ae.error:
+                message = ae.error[-1].get_error()[1]
+                log.warning(f"Failed to apply constraint '{lhs_alias} = {rhs_expr}': {message}")
+                rhs_value = None
+            else:
+                ae.symtable[lhs_alias] = rhs_value
+            results.append(rhs_value)
+        return results
+
+    def _alias_values(self) -> Dict[str, Any]:
+        """Return the current value of every aliased parameter."""
+        uid_map = UidMapHandler.get().get_uid_map()
+        return {
+            alias: uid_map[alias_obj.param_uid.value].value
+            for alias, alias_obj in self._alias_to_param.items()
+        }
 
     def apply(self) -> None:
         """Evaluates constraints and applies them to dependent
         parameters.
 
-        For each constraint:
+        For each constraint, in dependency order:
         - Evaluate RHS using current values of aliases
         - Locate the dependent parameter by alias → uid → param
         - Update its value and mark it as constrained
+
+        Nothing is evaluated if no aliased parameter changed since the
+        constraints were last applied.
         """
         if not self._parsed_constraints:
             return  # Nothing to apply
 
-        # Retrieve global UID → Parameter object map
-        uid_map = UidMapHandler.get().get_uid_map()
-
         # Prepare a flat dict of {alias: value} for use in expressions
-        param_values = {}
-        for alias, alias_obj in self._alias_to_param.items():
-            uid = alias_obj.param_uid.value
-            param = uid_map[uid]
-            value = param.value
-            param_values[alias] = value
+        param_values = self._alias_values()
+        if param_values == self._applied_values:
+            return  # Up to date
 
-        # Create an asteval interpreter for safe expression evaluation
-        ae = Interpreter()
-        ae.symtable.update(param_values)
-
-        for lhs_alias, rhs_expr in self._parsed_constraints:
-            try:
-                # Evaluate the RHS expression using the current values
-                rhs_value = ae(rhs_expr)
+        from easydiffraction.core.datablock import mark_changed
 
-                # Get the actual parameter object we want to update
+        uid_map = UidMapHandler.get().get_uid_map()
+        results = self._evaluate(param_values)
+        for (lhs_alias, _), rhs_value in zip(self._parsed_constraints, results, strict=True):
+            if rhs_value is None:
+                continue
+            # Get the actual parameter object we want to update
+            dependent_uid = self._alias_to_param[lhs_alias].param_uid.value
+            param = uid_map[dependent_uid]
+
+            # Update its value and mark it as constrained
+            param._value = rhs_value  # To bypass ranges check
+            param._constrained = True  # To bypass read-only check
+            param_values[lhs_alias] = rhs_value
+            # Mark the categories depending on it for update
+            mark_changed(param)
+
+        self._applied_values = param_values
+
+    def derivatives(self, uid: str, step: float = 1e-6) -> Dict[str, float]:
+        """Partial derivatives of the dependent parameters with respect
+        to the parameter with the given uid.
+
+        The derivatives are evaluated by central differences of the
+        constraint expressions at the current parameter values, so they
+        can be combined with derivatives of the pattern by the chain
+        rule.
+
+        Args:
+            uid: UID of the independent parameter.
+            step: Step relative to the parameter value.
+
+        Returns:
+            Mapping of dependent parameter UID to its derivative, for
+            all constraints depending on the parameter.
+        """
+        aliases = [
+            alias
+            for alias, alias_obj in self._alias_to_param.items()
+            if alias_obj.param_uid.value == uid
+        ]
+        if not aliases or not self._parsed_constraints:
+            return {}
+
+        # Exact derivatives if all constraints are linear
+        linear = self._linear() if self.vectorize_linear else None
+        if linear is not None and len(linear[1]) == len(self._parsed_constraints):
+            inputs, outputs, matrix, _ = linear
+            cols = [i for i, name in enumerate(inputs) if name in aliases]
+            column = np.asarray(matrix[:, cols].sum(axis=1)).ravel()
+            return {
+                self._alias_to_param[lhs_alias].param_uid.value: float(derivative)
+                for lhs_alias, derivative in zip(outputs, column, strict=True)
+                if derivative != 0
+            }
+
+        param_values = self._alias_values()
+        value = UidMapHandler.get().get_uid_map()[uid].value
+        delta = step * abs(value) or step
+
+        evaluated = []
+        for shifted in (value + delta, value - delta):
+            evaluated.append(self._evaluate({**param_values, **dict.fromkeys(aliases, shifted)}))
+
+        derivatives = {}
+        for (lhs_alias, _), up, down in zip(self._parsed_constraints, *evaluated, strict=True):
+            if up is None or down is None:
+                continue
+            derivative = (up - down) / (2 * delta)
+            if derivative != 0:
                 dependent_uid = self._alias_to_param[lhs_alias].param_uid.value
-                param = uid_map[dependent_uid]
-
-                # Update its value and mark it as constrained
-                param._value = rhs_value  # To bypass ranges check
-                param._constrained = True  # To bypass read-only check
-
-            except Exception as error:
-                print(f"Failed to apply constraint '{lhs_alias} = {rhs_expr}': {error}")
+                derivatives[dependent_uid] = derivative
+        return derivatives
@@ -103,6 +103,8 @@ class ValidationStage(Enum):
 class ValidatorBase(ABC):
     """Abstract base class for all validators."""
 
+    __slots__ = ()
+
     @abstractmethod
     def validated(self, value, name, default=None, current=None):
         """Return a validated value or fallback.
@@ -123,6 +125,8 @@ class ValidatorBase(ABC):
 class TypeValidator(ValidatorBase):
     """Ensure a value is of the expected Python type."""
 
+    __slots__ = ('expected_type', 'expected_label')
+
     def __init__(self, expected_type: DataTypes):
         if isinstance(expected_type, DataTypes):
             self.expected_type = expected_type
@@ -130,6 +134,14 @@ class TypeValidator(ValidatorBase):
         else:
             raise TypeError(f'TypeValidator expected a DataTypes member, got {expected_type!r}')
 
+    @classmethod
+    @functools.cache
+    def shared(cls, expected_type: DataTypes) -> 'TypeValidator':
+        """Return the validator for ``expected_type`` shared by all
+        attribute specs.
+        """
+        return cls(expected_type)
+
     def validated(
         self,
         value,
@@ -174,6 +186,8 @@ class TypeValidator(ValidatorBase):
 class RangeValidator(ValidatorBase):
     """Ensure a numeric value lies within [ge, le]."""
 
+    __slots__ = ('ge', 'le')
+
     def __init__(
         self,
         *,
@@ -215,6 +229,8 @@ class MembershipValidator(ValidatorBase):
     `allowed` may be an iterable or a callable returning a collection.
     """
 
+    __slots__ = ('allowed',)
+
     def __init__(self, allowed):
         # Do not convert immediately to list — may be callable
         self.allowed = allowed
@@ -251,6 +267,8 @@ class MembershipValidator(ValidatorBase):
 class RegexValidator(ValidatorBase):
     """Ensure that a string matches a given regular expression."""
 
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern):
         self.pattern = re.compile(pattern)
 
@@ -288,6 +306,8 @@ class RegexValidator(ValidatorBase):
 class AttributeSpec:
     """Hold metadata and validators for a single attribute."""
 
+    __slots__ = ('value', 'default', 'allow_none', '_type_validator', '_content_validator')
+
     def __init__(
         self,
         *,
@@ -300,7 +320,7 @@ class AttributeSpec:
         self.value = value
         self.default = default
         self.allow_none = allow_none
-        self._type_validator = TypeValidator(type_) if type_ else None
+        self._type_validator = TypeValidator.shared(type_) if type_ else None
         self._content_validator = content_validator
 
     def validated(
@@ -313,6 +333,9 @@ class AttributeSpec:
 
         Returns validated value, possibly default or current if errors
         occur. None may short-circuit further checks when allowed.
+
+        ``name`` may be a callable returning the name; it is only called
+        when a diagnostic is emitted.
         """
         val = value
         # Evaluate callable defaults dynamically
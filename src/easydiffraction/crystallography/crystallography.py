@@ -1,21 +1,29 @@
 # SPDX-FileCopyrightText: 2021-2026 EasyDiffraction contributors <https://github.com/easyscience/diffraction>
 # SPDX-License-Identifier: BSD-3-Clause
 
+import re
+from fractions import Fraction
+from functools import lru_cache
 from typing import Any
 from typing import Dict
-from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
 
-from cryspy.A_functions_base.function_2_space_group import get_crystal_system_by_it_number
-from cryspy.A_functions_base.function_2_space_group import get_it_number_by_name_hm_short
-from sympy import Expr
-from sympy import Symbol
-from sympy import simplify
-from sympy import symbols
-from sympy import sympify
+import numpy as np
 
-from easydiffraction.crystallography.space_groups import SPACE_GROUPS
+from easydiffraction.crystallography.space_groups import CELL_CONSTRAINTS
+from easydiffraction.crystallography.space_groups import CELL_PARAMETERS
+from easydiffraction.crystallography.space_groups import crystal_system_by_it_number
+from easydiffraction.crystallography.space_groups import it_number_by_name_hm
+from easydiffraction.crystallography.space_groups import wyckoff_positions
 from easydiffraction.utils.logging import log
 
+_AXES = ('x', 'y', 'z')
+
+# Signed terms of an affine coordinate expression, e.g. '-x+1/2'
+_AFFINE_TERM = re.compile(r'([+-]?)([^+-]+)')
+
 
 def apply_cell_symmetry_constraints(
     cell: Dict[str, float],
@@ -31,59 +39,104 @@ def apply_cell_symmetry_constraints(
     Returns:
         The cell dictionary with applied symmetry constraints.
     """
-    it_number = get_it_number_by_name_hm_short(name_hm)
+    it_number = it_number_by_name_hm(name_hm)
     if it_number is None:
         error_msg = f"Failed to get IT_number for name_H-M '{name_hm}'"
         log.error(error_msg)  # TODO: ValueError? Diagnostics?
         return cell
 
-    crystal_system = get_crystal_system_by_it_number(it_number)
+    crystal_system = crystal_system_by_it_number(it_number)
     if crystal_system is None:
         error_msg = f"Failed to get crystal system for IT_number '{it_number}'"
         log.error(error_msg)  # TODO: ValueError? Diagnostics?
         return cell
 
-    if crystal_system == 'cubic':
-        a = cell['lattice_a']
-        cell['lattice_b'] = a
-        cell['lattice_c'] = a
-        cell['angle_alpha'] = 90.0
-        cell['angle_beta'] = 90.0
-        cell['angle_gamma'] = 90.0
-
-    elif crystal_system == 'tetragonal':
-        a = cell['lattice_a']
-        cell['lattice_b'] = a
-        cell['angle_alpha'] = 90.0
-        cell['angle_beta'] = 90.0
-        cell['angle_gamma'] = 90.0
-
-    elif crystal_system == 'orthorhombic':
-        cell['angle_alpha'] = 90.0
-        cell['angle_beta'] = 90.0
-        cell['angle_gamma'] = 90.0
-
-    elif crystal_system in {'hexagonal', 'trigonal'}:
-        a = cell['lattice_a']
-        cell['lattice_b'] = a
-        cell['angle_alpha'] = 90.0
-        cell['angle_beta'] = 90.0
-        cell['angle_gamma'] = 120.0
-
-    elif crystal_system == 'monoclinic':
-        cell['angle_alpha'] = 90.0
-        cell['angle_gamma'] = 90.0
-
-    elif crystal_system == 'triclinic':
-        pass  # No constraints to apply
-
-    else:
+    constraints = CELL_CONSTRAINTS.get(crystal_system)
+    if constraints is None:
         error_msg = f'Unknown or unsupported crystal system: {crystal_system}'
         log.error(error_msg)  # TODO: ValueError? Diagnostics?
+        return cell
+
+    values = np.array([cell[name] for name in CELL_PARAMETERS], dtype=float)
+    values = np.where(constraints.equal_to_a, values[0], values)
+    values = np.where(constraints.fixed, constraints.fixed_values, values)
+    constrained = constraints.equal_to_a | constraints.fixed
+    for name, value, is_constrained in zip(CELL_PARAMETERS, values, constrained, strict=True):
+        if is_constrained:
+            cell[name] = float(value)
 
     return cell
 
 
+def _parse_affine_component(component: str) -> Tuple[Tuple[Fraction, ...], Fraction]:
+    """Parse one coordinate of a Wyckoff position, e.g. ``'-x+1/2'``
+    or ``'2x'``.
+
+    Returns:
+        The coefficients of x, y and z and the constant term.
+    """
+    coefficients = dict.fromkeys(_AXES, Fraction(0))
+    constant = Fraction(0)
+    for sign, body in _AFFINE_TERM.findall(component.replace(' ', '')):
+        factor = -1 if sign == '-' else 1
+        if body[-1] in coefficients:
+            coefficients[body[-1]] += factor * Fraction(body[:-1].rstrip('*') or 1)
+        else:
+            constant += factor * Fraction(body)
+    return tuple(coefficients[axis] for axis in _AXES), constant
+
+
+@lru_cache(maxsize=None)
+def _atom_site_constraint_plan(
+    it_number: int,
+    coord_code: Any,
+    wyckoff_letter: str,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compile the first position of a Wyckoff site into an affine map.
+
+    A coordinate is constrained if its own symbol does not appear in
+    the position, e.g. y and z in ``(x,x,1/4)``. Its value is then
+    given by ``matrix @ (x, y, z) + offset``.
+
+    Returns:
+        Read-only boolean mask of constrained coordinates, 3x3 matrix
+            and offset vector.
+    """
+    positions = wyckoff_positions(it_number, coord_code)[wyckoff_letter]
+    first_position = positions['coords_xyz'][0]
+    components = first_position.strip('()').split(',')
+
+    matrix = np.zeros((3, 3))
+    offset = np.zeros(3)
+    for i, component in enumerate(components):
+        coefficients, constant = _parse_affine_component(component)
+        matrix[i] = [float(c) for c in coefficients]
+        offset[i] = float(constant)
+    constrained = ~matrix.any(axis=0)
+
+    for array in (constrained, matrix, offset):
+        array.flags.writeable = False
+    return constrained, matrix, offset
+
+
+def _resolve_it_number(name_hm: str, coord_code: Any) -> Optional[int]:
+    """Resolve the IT number for atom-site constraints, logging
+    missing inputs.
+    """
+    it_number = it_number_by_name_hm(name_hm)
+    if it_number is None:
+        error_msg = f"Failed to get IT_number for name_H-M '{name_hm}'"
+        log.error(error_msg)  # TODO: ValueError? Diagnostics?
+        return None
+
+    if coord_code is None:
+        error_msg = 'IT_coordinate_system_code is not set'
+        log.error(error_msg)  # TODO: ValueError? Diagnostics?
+        return None
+
+    return it_number
+
+
 def apply_atom_site_symmetry_constraints(
     atom_site: Dict[str, Any],
     name_hm: str,
@@ -102,43 +155,51 @@ def apply_atom_site_symmetry_constraints(
     Returns:
         The atom_site dictionary with applied symmetry constraints.
     """
-    it_number = get_it_number_by_name_hm_short(name_hm)
-    if it_number is None:
-        error_msg = f"Failed to get IT_number for name_H-M '{name_hm}'"
-        log.error(error_msg)  # TODO: ValueError? Diagnostics?
-        return atom_site
-
-    it_coordinate_system_code = coord_code
-    if it_coordinate_system_code is None:
-        error_msg = 'IT_coordinate_system_code is not set'
-        log.error(error_msg)  # TODO: ValueError? Diagnostics?
-        return atom_site
-
-    space_group_entry = SPACE_GROUPS[(it_number, it_coordinate_system_code)]
-    wyckoff_positions = space_group_entry['Wyckoff_positions'][wyckoff_letter]
-    coords_xyz = wyckoff_positions['coords_xyz']
+    coords = np.array([[atom_site[f'fract_{axis}'] for axis in _AXES]], dtype=float)
+    constrained = apply_atom_sites_symmetry_constraints(
+        coords,
+        name_hm=name_hm,
+        coord_code=coord_code,
+        wyckoff_letters=[wyckoff_letter],
+    )
+    for i, axis in enumerate(_AXES):
+        if constrained[0, i] != coords[0, i]:
+            atom_site[f'fract_{axis}'] = float(constrained[0, i])
+    return atom_site
 
-    first_position = coords_xyz[0]
-    components = first_position.strip('()').split(',')
-    parsed_exprs: List[Expr] = [sympify(comp.strip()) for comp in components]
 
-    x_val: Expr = sympify(atom_site['fract_x'])
-    y_val: Expr = sympify(atom_site['fract_y'])
-    z_val: Expr = sympify(atom_site['fract_z'])
+def apply_atom_sites_symmetry_constraints(
+    coords: np.ndarray,
+    name_hm: str,
+    coord_code: int,
+    wyckoff_letters: Sequence[str],
+) -> np.ndarray:
+    """Apply symmetry constraints to the coordinates of several atom
+    sites at once.
 
-    substitutions: Dict[str, Expr] = {'x': x_val, 'y': y_val, 'z': z_val}
+    Each Wyckoff position is compiled once into an affine map, which
+    is then applied to all sites with plain NumPy.
 
-    axes: tuple[str, ...] = ('x', 'y', 'z')
-    x, y, z = symbols('x y z')
-    symbols_xyz: tuple[Symbol, ...] = (x, y, z)
+    Args:
+        coords: Fractional coordinates, one row of (x, y, z) per site.
+        name_hm: Hermann-Mauguin symbol of the space group.
+        coord_code: Coordinate system code.
+        wyckoff_letters: Wyckoff position letter of every site.
 
-    for i, axis in enumerate(axes):
-        symbol = symbols_xyz[i]
-        is_free = any(symbol in expr.free_symbols for expr in parsed_exprs)
+    Returns:
+        The constrained coordinates as a new array.
+    """
+    coords = np.asarray(coords, dtype=float)
+    it_number = _resolve_it_number(name_hm, coord_code)
+    if it_number is None:
+        return coords.copy()
 
-        if not is_free:
-            evaluated = parsed_exprs[i].subs(substitutions)
-            simplified = simplify(evaluated)
-            atom_site[f'fract_{axis}'] = float(simplified)
+    plans = [
+        _atom_site_constraint_plan(it_number, coord_code, letter) for letter in wyckoff_letters
+    ]
+    masks = np.array([plan[0] for plan in plans], dtype=bool).reshape(coords.shape)
+    matrices = np.array([plan[1] for plan in plans]).reshape(-1, 3, 3)
+    offsets = np.array([plan[2] for plan in plans]).reshape(coords.shape)
 
-    return atom_site
+    mapped = np.einsum('nij,nj->ni', matrices, coords) + offsets
+    return np.where(masks, mapped, coords)
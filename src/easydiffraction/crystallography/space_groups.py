@@ -4,13 +4,26 @@
 
 Loads a gzipped, packaged pickle with crystallographic space-group
 information. The file is part of the distribution; user input is not
-involved.
+involved. The table is only read on first access of ``SPACE_GROUPS``,
+so importing the package does not pay for it.
+
+The lookups used when applying symmetry constraints (H-M name to IT
+number, IT number to crystal system and cell constraints, Wyckoff
+positions of a setting) are indexed once, so that they cost a
+dictionary hit during fitting.
 """
 
 import gzip
 import pickle  # noqa: S403 - trusted internal pickle file (package data only)
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
 
 
 def _restricted_pickle_load(file_obj) -> Any:
@@ -23,11 +36,116 @@ def _restricted_pickle_load(file_obj) -> Any:
     return data
 
 
+@lru_cache(maxsize=None)
 def _load():
-    """Load space-group data from the packaged archive."""
+    """Load space-group data from the packaged archive once."""
     path = Path(__file__).with_name('space_groups.pkl.gz')
     with gzip.open(path, 'rb') as f:
         return _restricted_pickle_load(f)
 
 
-SPACE_GROUPS = _load()
+def __getattr__(name: str) -> Any:
+    """Load ``SPACE_GROUPS`` on first access."""
+    if name == 'SPACE_GROUPS':
+        return _load()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+# Order of the cell parameters in the constraint masks
+CELL_PARAMETERS = (
+    'lattice_a',
+    'lattice_b',
+    'lattice_c',
+    'angle_alpha',
+    'angle_beta',
+    'angle_gamma',
+)
+
+
+class CellConstraints(NamedTuple):
+    """Symmetry constraints on the cell parameters of a crystal system.
+
+    All arrays follow the order of :data:`CELL_PARAMETERS`.
+
+    Attributes:
+        equal_to_a: Mask of the lengths set equal to ``lattice_a``.
+        fixed: Mask of the angles fixed by symmetry.
+        fixed_values: Values of the fixed angles in degrees.
+    """
+
+    equal_to_a: np.ndarray
+    fixed: np.ndarray
+    fixed_values: np.ndarray
+
+
+def _cell_constraints(
+    equal_to_a: Tuple[str, ...],
+    fixed: Dict[str, float],
+) -> CellConstraints:
+    """Build read-only constraint masks from parameter names."""
+    equal_mask = np.array([name in equal_to_a for name in CELL_PARAMETERS])
+    fixed_mask = np.array([name in fixed for name in CELL_PARAMETERS])
+    fixed_values = np.array([fixed.get(name, 0.0) for name in CELL_PARAMETERS])
+    for array in (equal_mask, fixed_mask, fixed_values):
+        array.flags.writeable = False
+    return CellConstraints(equal_mask, fixed_mask, fixed_values)
+
+
+_RIGHT_ANGLES = {'angle_alpha': 90.0, 'angle_beta': 90.0, 'angle_gamma': 90.0}
+_HEXAGONAL_ANGLES = {'angle_alpha': 90.0, 'angle_beta': 90.0, 'angle_gamma': 120.0}
+
+CELL_CONSTRAINTS: Dict[str, CellConstraints] = {
+    'cubic': _cell_constraints(('lattice_b', 'lattice_c'), _RIGHT_ANGLES),
+    'tetragonal': _cell_constraints(('lattice_b',), _RIGHT_ANGLES),
+    'orthorhombic': _cell_constraints((), _RIGHT_ANGLES),
+    'hexagonal': _cell_constraints(('lattice_b',), _HEXAGONAL_ANGLES),
+    'trigonal': _cell_constraints(('lattice_b',), _HEXAGONAL_ANGLES),
+    'monoclinic': _cell_constraints((), {'angle_alpha': 90.0, 'angle_gamma': 90.0}),
+    'triclinic': _cell_constraints((), {}),
+}
+
+
+@lru_cache(maxsize=None)
+def _it_numbers_by_name_hm() -> Dict[str, int]:
+    """Index the short H-M names known to cryspy by IT number.
+
+    The first occurrence wins, as in cryspy's own lookup.
+    """
+    from cryspy.A_functions_base.function_2_space_group import ACCESIBLE_NAME_HM_SHORT
+
+    index: Dict[str, int] = {}
+    for i, name in enumerate(ACCESIBLE_NAME_HM_SHORT):
+        index.setdefault(name, i + 1)
+    return index
+
+
+def it_number_by_name_hm(name_hm: str) -> Optional[int]:
+    """Return the IT number of a short H-M name, or ``None`` if the
+    name is unknown.
+    """
+    return _it_numbers_by_name_hm().get(name_hm)
+
+
+@lru_cache(maxsize=None)
+def crystal_system_by_it_number(it_number: Optional[int]) -> Optional[str]:
+    """Return the crystal system of an IT number, or ``None`` if the
+    number is out of range.
+    """
+    from cryspy.A_functions_base.function_2_space_group import get_crystal_system_by_it_number
+
+    return get_crystal_system_by_it_number(it_number)
+
+
+def cell_constraints_by_name_hm(name_hm: str) -> Optional[CellConstraints]:
+    """Return the cell constraints of a space group, or ``None`` if
+    the space group is unknown.
+    """
+    crystal_system = crystal_system_by_it_number(it_number_by_name_hm(name_hm))
+    return CELL_CONSTRAINTS.get(crystal_system)
+
+
+def wyckoff_positions(it_number: int, coord_code: Any) -> Dict[str, Any]:
+    """Return the Wyckoff positions of a space group setting, keyed by
+    Wyckoff letter.
+    """
+    return _load()[(it_number, coord_code)]['Wyckoff_positions']
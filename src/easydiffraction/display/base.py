@@ -13,6 +13,7 @@ from typing import Tuple
 import pandas as pd
 
 from easydiffraction.core.singletons import SingletonBase
+from easydiffraction.utils.lazy import resolve
 from easydiffraction.utils.logging import console
 from easydiffraction.utils.logging import log
 
@@ -107,7 +108,7 @@ class RendererFactoryBase(ABC):
         if engine_name not in registry:
             supported = list(registry.keys())
             raise ValueError(f"Unsupported engine '{engine_name}'. Supported engines: {supported}")
-        engine_class = registry[engine_name]['class']
+        engine_class = resolve(registry[engine_name]['class'])
         return engine_class()
 
     @classmethod
@@ -129,7 +130,8 @@ class RendererFactoryBase(ABC):
         """Return engine registry. Implementations must provide this.
 
         The returned mapping should have keys as engine names and values
-        as a config dict with 'description' and 'class'. Lazy imports
-        are allowed to avoid circular dependencies.
+        as a config dict with 'description' and 'class'. The class may
+        be given by import path (``'module:Name'``) so that the backend
+        is only imported when its engine is created.
         """
         raise NotImplementedError
@@ -13,12 +13,10 @@ import pandas as pd
 
 from easydiffraction.display.base import RendererBase
 from easydiffraction.display.base import RendererFactoryBase
-from easydiffraction.display.plotters.ascii import AsciiPlotter
 from easydiffraction.display.plotters.base import DEFAULT_AXES_LABELS
 from easydiffraction.display.plotters.base import DEFAULT_HEIGHT
 from easydiffraction.display.plotters.base import DEFAULT_MAX
 from easydiffraction.display.plotters.base import DEFAULT_MIN
-from easydiffraction.display.plotters.plotly import PlotlyPlotter
 from easydiffraction.display.tables import TableRenderer
 from easydiffraction.utils.environment import in_jupyter
 from easydiffraction.utils.logging import console
@@ -431,10 +429,10 @@ class PlotterFactory(RendererFactoryBase):
         return {
             PlotterEngineEnum.ASCII.value: {
                 'description': PlotterEngineEnum.ASCII.description(),
-                'class': AsciiPlotter,
+                'class': 'easydiffraction.display.plotters.ascii:AsciiPlotter',
             },
             PlotterEngineEnum.PLOTLY.value: {
                 'description': PlotterEngineEnum.PLOTLY.description(),
-                'class': PlotlyPlotter,
+                'class': 'easydiffraction.display.plotters.plotly:PlotlyPlotter',
             },
         }
@@ -11,8 +11,6 @@ import pandas as pd
 
 from easydiffraction.display.base import RendererBase
 from easydiffraction.display.base import RendererFactoryBase
-from easydiffraction.display.tablers.pandas import PandasTableBackend
-from easydiffraction.display.tablers.rich import RichTableBackend
 from easydiffraction.utils.environment import in_jupyter
 from easydiffraction.utils.logging import console
 from easydiffraction.utils.logging import log
@@ -107,12 +105,12 @@ class TableRendererFactory(RendererFactoryBase):
         base = {
             TableEngineEnum.RICH.value: {
                 'description': TableEngineEnum.RICH.description(),
-                'class': RichTableBackend,
+                'class': 'easydiffraction.display.tablers.rich:RichTableBackend',
             }
         }
         if in_jupyter():
             base[TableEngineEnum.PANDAS.value] = {
                 'description': TableEngineEnum.PANDAS.description(),
-                'class': PandasTableBackend,
+                'class': 'easydiffraction.display.tablers.pandas:PandasTableBackend',
             }
         return base
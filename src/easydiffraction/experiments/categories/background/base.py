@@ -15,6 +15,8 @@ class BackgroundBase(CategoryCollection):
     compute background intensities on the experiment grid.
     """
 
+    _depends_on = ('data',)
+
     # TODO: Consider moving to CategoryCollection
     @abstractmethod
     def show(self) -> None:
@@ -141,12 +141,25 @@ class ChebyshevPolynomialBackground(BackgroundBase):
             data._set_bkg(np.zeros_like(x))
             return
 
-        u = (x - x.min()) / (x.max() - x.min()) * 2 - 1
         coefs = [term.coef.value for term in self._items]
-
-        y = chebval(u, coefs)
+        y = self._evaluate(x, coefs)
         data._set_bkg(y)
 
+    def _evaluate(self, x, coefs):
+        """Evaluate the polynomial with the given coefficients over
+        x.
+        """
+        u = (x - x.min()) / (x.max() - x.min()) * 2 - 1
+        return chebval(u, coefs)
+
+    def _linear_derivatives(self) -> list:
+        """The background is linear in the polynomial coefficients."""
+        if not self._items:
+            return []
+        x = self._parent.data.x
+        unit = np.eye(len(self._items))
+        return [(term.coef, self._evaluate(x, unit[i])) for i, term in enumerate(self._items)]
+
     def show(self) -> None:
         """Print a table of polynomial orders and coefficients."""
         columns_headers: List[str] = ['Order', 'Coefficient']
@@ -142,8 +142,13 @@ class LineSegmentBackground(BackgroundBase):
             data._set_bkg(np.zeros_like(x))
             return
 
-        segments_x = np.array([point.x.value for point in self._items])
         segments_y = np.array([point.y.value for point in self._items])
+        y = self._interpolate(x, segments_y)
+        data._set_bkg(y)
+
+    def _interpolate(self, x, segments_y):
+        """Interpolate the given control point intensities over x."""
+        segments_x = np.array([point.x.value for point in self._items])
         interp_func = interp1d(
             segments_x,
             segments_y,
@@ -151,9 +156,15 @@ class LineSegmentBackground(BackgroundBase):
             bounds_error=False,
             fill_value=(segments_y[0], segments_y[-1]),
         )
+        return interp_func(x)
 
-        y = interp_func(x)
-        data._set_bkg(y)
+    def _linear_derivatives(self) -> list:
+        """The background is linear in the control point intensities."""
+        if not self._items:
+            return []
+        x = self._parent.data.x
+        unit = np.eye(len(self._items))
+        return [(point.y, self._interpolate(x, unit[i])) for i, point in enumerate(self._items)]
 
     def show(self) -> None:
         """Print a table of control points (x, intensity)."""
@@ -0,0 +1,448 @@
+# SPDX-FileCopyrightText: 2021-2026 EasyDiffraction contributors <https://github.com/easyscience/diffraction>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Columnar storage shared by the data categories.
+
+Measured and calculated data can hold hundreds of thousands of points.
+Instead of keeping one ``CategoryItem`` with several descriptors per
+point, :class:`ColumnarDataBase` stores every data point field as one
+contiguous NumPy array (``float64`` for numeric fields, ``bool`` for
+the calculation status). Per-point items are only created on demand,
+e.g. when serializing to CIF or accessing ``data['123']``, as views
+whose descriptors write changes back to the arrays.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from easydiffraction.core.category import CategoryCollection
+from easydiffraction.core.category import _columns_size
+from easydiffraction.core.datablock import mark_changed
+from easydiffraction.core.validation import DataTypes
+from easydiffraction.experiments.categories.background.base import BackgroundBase
+from easydiffraction.experiments.categories.excluded_regions import ExcludedRegions
+from easydiffraction.experiments.categories.linked_phases import LinkedPhases
+from easydiffraction.io.cif.serialize import columnar_collection_from_cif
+
+
+class DataPointViewMixin:
+    """Mixin for data point items used as views into columnar data.
+
+    A view knows its row in the parent :class:`ColumnarDataBase` and
+    writes every descriptor change back to the corresponding column.
+    """
+
+    def _on_child_value_changed(self, child) -> None:
+        row = self.__dict__.get('_row')
+        if row is None:
+            return
+        self._parent._set_cell(child.name, row, child.value)
+
+
+class _RowViews(Sequence):
+    """Read-only sequence creating item views for the data rows."""
+
+    def __init__(self, collection: ColumnarDataBase) -> None:
+        self._collection = collection
+
+    def __len__(self) -> int:
+        return self._collection._size
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        size = len(self)
+        if idx < 0:
+            idx += size
+        if not 0 <= idx < size:
+            raise IndexError('data point index out of range')
+        return self._collection._row_view(idx)
+
+
+class ColumnarDataBase(CategoryCollection):
+    """Category collection storing its items column by column.
+
+    Subclasses define ``_x_name``, the column holding the independent
+    variable (e.g. ``'two_theta'``), and ``_meas_name`` and
+    ``_meas_su_name``, the columns holding the measured values and
+    their standard uncertainties. Columns are derived from the
+    descriptors of the item type: numeric descriptors become ``float64``
+    arrays, the ``calc_status`` descriptor becomes a boolean array
+    (``True`` for ``'incl'``) and other strings become object arrays.
+    """
+
+    # Redefine update priority to ensure data updated after other
+    # categories. Higher number = runs later. Default for other
+    # categories, e.g., background and excluded regions are 10 by
+    # default
+    _update_priority = 100
+    # Calculated patterns depend on all other categories and on the
+    # linked sample models
+    _depends_on = ('*',)
+    _external_inputs = True
+
+    _x_name: str = ''
+    _meas_name: str = ''
+    _meas_su_name: str = ''
+    _status_name = 'calc_status'
+
+    def __init__(self, item_type) -> None:
+        super().__init__(item_type=item_type)
+        prototype = item_type()
+        self._defaults: dict = {}
+        self._dtypes: dict = {}
+        for param in prototype.parameters:
+            self._defaults[param.name] = param.value
+            if param.name == self._status_name:
+                self._dtypes[param.name] = bool
+            elif param._value_type == DataTypes.NUMERIC:
+                self._dtypes[param.name] = np.float64
+            else:
+                self._dtypes[param.name] = object
+        self._columns: dict[str, np.ndarray] = {}
+        self._point_index: dict | None = None
+        self._calc_index: np.ndarray | None = None
+        self._x_revision = 0
+        # Unscaled patterns of the linked phases with the state they
+        # were calculated for, keyed by sample model name
+        self._phase_patterns: dict = {}
+        self._items = _RowViews(self)
+        self._resize(0)
+
+    # Storage
+
+    def _resize(self, size: int) -> None:
+        """Allocate all columns for ``size`` points, filled with
+        defaults.
+        """
+        self._size = size
+        self._point_index = None
+        self._calc_index = None
+        self._x_changed()
+        for name, dtype in self._dtypes.items():
+            self._columns[name] = np.full(size, self._to_cell(name, self._defaults[name]), dtype)
+
+    def _to_cell(self, name: str, value):
+        """Convert a descriptor value to its column representation."""
+        if name == self._status_name:
+            return value == 'incl'
+        return value
+
+    def _from_cell(self, name: str, value):
+        """Convert a column value to its descriptor representation."""
+        if name == self._status_name:
+            return 'incl' if value else 'excl'
+        if self._dtypes[name] is np.float64:
+            return float(value)
+        return value
+
+    def _set_column(self, name: str, values, included_only: bool = False) -> None:
+        """Write ``values`` to a column, optionally only to the points
+        included in calculations.
+        """
+        column = self._columns[name]
+        rows = self._included_rows if included_only else slice(None)
+        target_size = rows.size if included_only else self._size
+        values = np.asarray(values, dtype=column.dtype)
+        if values.shape != (target_size,):
+            raise ValueError(f"Expected {target_size} values for '{name}', got {values.size}.")
+        # Keep the cached included-point index if the status is
+        # unchanged
+        if name == self._status_name and np.array_equal(column, values):
+            return
+        column[rows] = values
+        self._invalidate(name)
+
+    def _get_column(self, name: str, included_only: bool = False) -> np.ndarray:
+        """Return a column as a read-only view or, if requested, a copy
+        restricted to the points included in calculations.
+        """
+        column = self._columns[name]
+        if included_only:
+            return column[self._included_rows]
+        view = column.view()
+        view.flags.writeable = False
+        return view
+
+    def _load_columns(self, columns: dict) -> None:
+        """Replace all points with the given columns.
+
+        The columns are allocated once and written as whole arrays; no
+        per-point items are created. Points without a ``point_id``
+        column are numbered from 1.
+        """
+        size = _columns_size(columns)
+        self._resize(size)
+        if 'point_id' not in columns:
+            self._columns['point_id'] = np.arange(1, size + 1).astype(str).astype(object)
+        for name, values in columns.items():
+            self._set_column(name, values)
+
+    def _set_cell(self, name: str, row: int, value) -> None:
+        """Write a single descriptor value back to its column."""
+        self._columns[name][row] = self._to_cell(name, value)
+        self._invalidate(name)
+
+    def _invalidate(self, name: str) -> None:
+        """Drop cached lookups depending on the given column."""
+        if name == 'point_id':
+            self._point_index = None
+        elif name == self._status_name:
+            self._calc_index = None
+        elif name == self._x_name:
+            self._x_changed()
+
+    def _x_changed(self) -> None:
+        """Record a change of the x values of the points."""
+        self._x_revision += 1
+        mark_changed(self)
+
+    # Item views
+
+    def _row_view(self, row: int):
+        """Create an item reflecting the values stored at ``row``."""
+        item = self._item_type()
+        for param in item.parameters:
+            param._value = self._from_cell(param.name, self._columns[param.name][row])
+        item._row = row
+        item._parent = self
+        return item
+
+    def _row_for(self, point_id: str) -> int:
+        """Return the row index of the given point ID."""
+        if self._point_index is None:
+            self._point_index = {str(pid): i for i, pid in enumerate(self._columns['point_id'])}
+        return self._point_index[point_id]
+
+    def __getitem__(self, name: str):
+        """Return a view of the data point with the given point ID."""
+        return self._row_view(self._row_for(name))
+
+    def __setitem__(self, name: str, item) -> None:
+        """Replace the point with the given ID or append a new one."""
+        try:
+            row = self._row_for(name)
+        except KeyError:
+            row = self._size
+            for column_name, column in self._columns.items():
+                default = self._to_cell(column_name, self._defaults[column_name])
+                self._columns[column_name] = np.append(column, np.array([default], column.dtype))
+            self._size += 1
+        for param in item.parameters:
+            self._set_cell(param.name, row, param.value)
+        self._point_index = None
+        self._calc_index = None
+        self._x_changed()
+
+    def __delitem__(self, name: str) -> None:
+        """Delete the point with the given ID."""
+        row = self._row_for(name)
+        for column_name, column in self._columns.items():
+            self._columns[column_name] = np.delete(column, row)
+        self._size -= 1
+        self._point_index = None
+        self._calc_index = None
+        self._x_changed()
+
+    def _rebuild_index(self) -> None:
+        """Point IDs are indexed lazily by :meth:`_row_for`."""
+        self._point_index = None
+
+    def keys(self):
+        """Yield point IDs in storage order."""
+        return (str(pid) for pid in self._columns['point_id'])
+
+    @property
+    def parameters(self):
+        """Data points are exposed as arrays, not as parameters."""
+        return []
+
+    def from_cif(self, block):
+        """Populate the columns from a CIF loop."""
+        columnar_collection_from_cif(self, block)
+
+    # Common helpers
+
+    def _set_point_id(self, values) -> None:
+        """Helper method to set point IDs."""
+        self._set_column('point_id', values)
+
+    def _set_calc_status(self, values) -> None:
+        """Helper method to set calculation status."""
+        self._set_column(self._status_name, values)
+
+    @property
+    def _calc_mask(self) -> np.ndarray:
+        return self._get_column(self._status_name)
+
+    @property
+    def _included_rows(self) -> np.ndarray:
+        """Integer indices of the points included in calculations.
+
+        Cached until the calculation status changes.
+        """
+        if self._calc_index is None:
+            self._calc_index = np.flatnonzero(self._columns[self._status_name])
+        return self._calc_index
+
+    @property
+    def calc_status(self) -> np.ndarray:
+        return np.where(self._calc_mask, 'incl', 'excl').astype(object)
+
+    def _set_x(self, values) -> None:
+        """Helper method to set the independent variable values and
+        (re)create default points.
+        """
+        self._load_columns({self._x_name: np.asarray(values, dtype=float)})
+
+    def _load_measured(self, x, meas, meas_su) -> None:
+        """Helper method to (re)create the points from measured
+        data in one pass.
+        """
+        self._load_columns({self._x_name: x, self._meas_name: meas, self._meas_su_name: meas_su})
+
+    @property
+    def all_x(self) -> np.ndarray:
+        """Get the x values for all data points in this collection."""
+        return self._get_column(self._x_name)
+
+    @property
+    def x(self) -> np.ndarray:
+        """Get the x values for data points included in
+        calculations.
+        """
+        return self._get_column(self._x_name, included_only=True)
+
+    # Calculation
+
+    def _experiment_fingerprint(self) -> tuple:
+        """Values of the experiment parameters the phase patterns depend
+        on.
+
+        Background, excluded regions and phase scales are applied on top
+        of the phase patterns, so they are left out. The included points
+        are checked separately.
+        """
+        values = []
+        for category in self._parent.categories:
+            if category is self or isinstance(
+                category, (BackgroundBase, ExcludedRegions, LinkedPhases)
+            ):
+                continue
+            values.extend(p.value for p in category.parameters)
+        return tuple(values)
+
+    def _linked_phase_inputs(self) -> list:
+        """Return ``(linked_phase, sample_model, fingerprint)`` for all
+        valid linked phases.
+
+        The fingerprint describes everything the unscaled pattern of the
+        phase depends on: the calculator, the included points, the phase
+        parameters and the relevant experiment parameters.
+        """
+        experiment = self._parent
+        experiments = experiment._parent
+        project = experiments._parent
+        sample_models = project.sample_models
+        # calculator = experiment.calculator  # TODO: move from analysis
+        calculator = project.analysis.calculator
+
+        rows = self._included_rows
+        experiment_fingerprint = self._experiment_fingerprint()
+
+        inputs = []
+        for linked_phase in experiment._get_valid_linked_phases(sample_models):
+            sample_model = sample_models[linked_phase._identity.category_entry_name]
+            fingerprint = (
+                calculator,
+                rows,
+                experiment_fingerprint,
+                tuple(p.value for p in sample_model.parameters),
+                linked_phase.scale.value if calculator.uses_phase_scale else None,
+            )
+            inputs.append((linked_phase, sample_model, fingerprint))
+        return inputs
+
+    def _cached_phase_pattern(self, sample_model_id: str, fingerprint: tuple):
+        """Return the cached pattern of a phase if it was calculated
+        for the given fingerprint, otherwise ``None``.
+        """
+        cached = self._phase_patterns.get(sample_model_id)
+        if cached is None:
+            return None
+        cached_fingerprint, pattern = cached
+        calculator, rows = fingerprint[:2]
+        if (
+            cached_fingerprint[0] is calculator
+            and cached_fingerprint[1] is rows
+            and cached_fingerprint[2:] == fingerprint[2:]
+        ):
+            return pattern
+        return None
+
+    def _cache_phase_pattern(
+        self,
+        sample_model_id: str,
+        fingerprint: tuple,
+        pattern: np.ndarray,
+    ) -> None:
+        """Store the unscaled pattern of a phase."""
+        self._phase_patterns[sample_model_id] = (fingerprint, pattern)
+
+    def _missing_phase_patterns(self) -> list:
+        """Return ``(sample_model_id, sample_model, fingerprint)`` for
+        the linked phases whose pattern has to be recalculated.
+        """
+        missing = []
+        for linked_phase, sample_model, fingerprint in self._linked_phase_inputs():
+            sample_model_id = linked_phase._identity.category_entry_name
+            if self._cached_phase_pattern(sample_model_id, fingerprint) is None:
+                missing.append((sample_model_id, sample_model, fingerprint))
+        return missing
+
+    def _calc_linked_phases(self, called_by_minimizer: bool = False) -> np.ndarray:
+        """Sum the scaled patterns of all valid linked phases.
+
+        The unscaled pattern of each phase is reused as long as its
+        fingerprint is unchanged, so that only the phases affected by a
+        change are recalculated.
+        """
+        experiment = self._parent
+        calc = np.zeros(self._included_rows.size)
+        for linked_phase, sample_model, fingerprint in self._linked_phase_inputs():
+            sample_model_id = linked_phase._identity.category_entry_name
+            sample_model_calc = self._cached_phase_pattern(sample_model_id, fingerprint)
+            if sample_model_calc is None:
+                calculator = fingerprint[0]
+                sample_model_calc = calculator.calculate_pattern(
+                    sample_model,
+                    experiment,
+                    called_by_minimizer=called_by_minimizer,
+                )
+                self._cache_phase_pattern(sample_model_id, fingerprint, sample_model_calc)
+
+            sample_model_scaled_calc = linked_phase.scale.value * sample_model_calc
+            calc += sample_model_scaled_calc
+
+        return calc
+
+    def _linear_derivatives(self) -> list:
+        """The calculated pattern is linear in the phase scales, unless
+        the calculator applies them itself.
+
+        The derivatives are the unscaled phase patterns of the latest
+        calculation. Phases without a pattern for the current state are
+        left out.
+        """
+        derivatives = []
+        for linked_phase, _, fingerprint in self._linked_phase_inputs():
+            calculator = fingerprint[0]
+            if calculator.uses_phase_scale:
+                continue
+            sample_model_id = linked_phase._identity.category_entry_name
+            pattern = self._cached_phase_pattern(sample_model_id, fingerprint)
+            if pattern is not None:
+                derivatives.append((linked_phase.scale, pattern))
+        return derivatives
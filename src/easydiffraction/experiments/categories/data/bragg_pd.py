@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import numpy as np
 
-from easydiffraction.core.category import CategoryCollection
 from easydiffraction.core.category import CategoryItem
 from easydiffraction.core.parameters import NumericDescriptor
 from easydiffraction.core.parameters import StringDescriptor
@@ -14,6 +13,8 @@ from easydiffraction.core.validation import DataTypes
 from easydiffraction.core.validation import MembershipValidator
 from easydiffraction.core.validation import RangeValidator
 from easydiffraction.core.validation import RegexValidator
+from easydiffraction.experiments.categories.data.base import ColumnarDataBase
+from easydiffraction.experiments.categories.data.base import DataPointViewMixin
 from easydiffraction.io.cif.handler import CifHandler
 from easydiffraction.utils.utils import tof_to_d
 from easydiffraction.utils.utils import twotheta_to_d
@@ -216,6 +217,7 @@ class PdTofDataPointMixin:
 class PdCwlDataPoint(
     PdDataPointBaseMixin,
     PdCwlDataPointMixin,
+    DataPointViewMixin,
     CategoryItem,  # Must be last to ensure mixins initialized first
 ):
     """Powder diffraction data point for constant-wavelength
@@ -231,6 +233,7 @@ class PdCwlDataPoint(
 class PdTofDataPoint(
     PdDataPointBaseMixin,
     PdTofDataPointMixin,
+    DataPointViewMixin,
     CategoryItem,  # Must be last to ensure mixins initialized first
 ):
     """Powder diffraction data point for time-of-flight experiments."""
@@ -241,83 +244,45 @@ class PdTofDataPoint(
         self._identity.category_entry_name = lambda: str(self.point_id.value)
 
 
-class PdDataBase(CategoryCollection):
-    # TODO: ???
+class PdDataBase(ColumnarDataBase):
+    """Base class for powder diffraction data collections."""
 
-    # Redefine update priority to ensure data updated after other
-    # categories. Higher number = runs later. Default for other
-    # categories, e.g., background and excluded regions are 10 by
-    # default
-    _update_priority = 100
+    _meas_name = 'intensity_meas'
+    _meas_su_name = 'intensity_meas_su'
 
     # Should be set only once
 
-    def _set_point_id(self, values) -> None:
-        """Helper method to set point IDs."""
-        for p, v in zip(self._items, values, strict=True):
-            p.point_id._value = v
-
     def _set_meas(self, values) -> None:
         """Helper method to set measured intensity."""
-        for p, v in zip(self._items, values, strict=True):
-            p.intensity_meas._value = v
+        self._set_column(self._meas_name, values)
 
     def _set_meas_su(self, values) -> None:
         """Helper method to set standard uncertainty of measured
         intensity.
         """
-        for p, v in zip(self._items, values, strict=True):
-            p.intensity_meas_su._value = v
+        self._set_column(self._meas_su_name, values)
 
     # Can be set multiple times
 
     def _set_d_spacing(self, values) -> None:
         """Helper method to set d-spacing values."""
-        for p, v in zip(self._calc_items, values, strict=True):
-            p.d_spacing._value = v
+        self._set_column('d_spacing', values, included_only=True)
 
     def _set_calc(self, values) -> None:
         """Helper method to set calculated intensity."""
-        for p, v in zip(self._calc_items, values, strict=True):
-            p.intensity_calc._value = v
+        self._set_column('intensity_calc', values, included_only=True)
 
     def _set_bkg(self, values) -> None:
         """Helper method to set background intensity."""
-        for p, v in zip(self._calc_items, values, strict=True):
-            p.intensity_bkg._value = v
-
-    def _set_calc_status(self, values) -> None:
-        """Helper method to set refinement status."""
-        for p, v in zip(self._items, values, strict=True):
-            if v:
-                p.calc_status._value = 'incl'
-            elif not v:
-                p.calc_status._value = 'excl'
-            else:
-                raise ValueError(
-                    f'Invalid refinement status value: {v}. Expected boolean True/False.'
-                )
-
-    @property
-    def _calc_mask(self) -> np.ndarray:
-        return self.calc_status == 'incl'
-
-    @property
-    def _calc_items(self):
-        """Get only the items included in calculations."""
-        return [item for item, mask in zip(self._items, self._calc_mask, strict=False) if mask]
-
-    @property
-    def calc_status(self) -> np.ndarray:
-        return np.fromiter((p.calc_status.value for p in self._items), dtype=object)
+        self._set_column('intensity_bkg', values, included_only=True)
 
     @property
     def d(self) -> np.ndarray:
-        return np.fromiter((p.d_spacing.value for p in self._calc_items), dtype=float)
+        return self._get_column('d_spacing', included_only=True)
 
     @property
     def meas(self) -> np.ndarray:
-        return np.fromiter((p.intensity_meas.value for p in self._calc_items), dtype=float)
+        return self._get_column('intensity_meas', included_only=True)
 
     @property
     def meas_su(self) -> np.ndarray:
@@ -325,7 +290,6 @@ class PdDataBase(CategoryCollection):
         #  or near-zero uncertainties in the data, when dats is loaded
         #  from CIF files. This is necessary because zero uncertainties
         #  cause fitting algorithms to fail.
-        #  The current implementation is inefficient.
         #  In the future, we should extend the functionality of
         #  the NumericDescriptor to automatically replace the value
         #  outside of the valid range (`content_validator`) with a
@@ -333,43 +297,21 @@ class PdDataBase(CategoryCollection):
         #  BraggPdExperiment._load_ascii_data_to_experiment() handles
         #  this for ASCII data, but we also need to handle CIF data and
         #  come up with a consistent approach for both data sources.
-        original = np.fromiter((p.intensity_meas_su.value for p in self._calc_items), dtype=float)
+        original = self._get_column('intensity_meas_su', included_only=True)
         # Replace values smaller than 0.0001 with 1.0
         modified = np.where(original < 0.0001, 1.0, original)
         return modified
 
     @property
     def calc(self) -> np.ndarray:
-        return np.fromiter((p.intensity_calc.value for p in self._calc_items), dtype=float)
+        return self._get_column('intensity_calc', included_only=True)
 
     @property
     def bkg(self) -> np.ndarray:
-        return np.fromiter((p.intensity_bkg.value for p in self._calc_items), dtype=float)
+        return self._get_column('intensity_bkg', included_only=True)
 
     def _update(self, called_by_minimizer=False):
-        experiment = self._parent
-        experiments = experiment._parent
-        project = experiments._parent
-        sample_models = project.sample_models
-        # calculator = experiment.calculator  # TODO: move from analysis
-        calculator = project.analysis.calculator
-
-        initial_calc = np.zeros_like(self.x)
-        calc = initial_calc
-        for linked_phase in experiment._get_valid_linked_phases(sample_models):
-            sample_model_id = linked_phase._identity.category_entry_name
-            sample_model_scale = linked_phase.scale.value
-            sample_model = sample_models[sample_model_id]
-
-            sample_model_calc = calculator.calculate_pattern(
-                sample_model,
-                experiment,
-                called_by_minimizer=called_by_minimizer,
-            )
-
-            sample_model_scaled_calc = sample_model_scale * sample_model_calc
-            calc += sample_model_scaled_calc
-
+        calc = self._calc_linked_phases(called_by_minimizer)
         self._set_calc(calc + self.bkg)
 
 
@@ -378,31 +320,11 @@ class PdCwlData(PdDataBase):
     # _description: str = 'Powder diffraction data points for
     # constant-wavelength experiments.'
 
+    _x_name = 'two_theta'
+
     def __init__(self):
         super().__init__(item_type=PdCwlDataPoint)
 
-    # Should be set only once
-
-    def _set_x(self, values) -> None:
-        """Helper method to set 2θ values."""
-        # TODO: split into multiple methods
-        self._items = [self._item_type() for _ in range(values.size)]
-        for p, v in zip(self._items, values, strict=True):
-            p.two_theta._value = v
-        self._set_point_id([str(i + 1) for i in range(values.size)])
-
-    @property
-    def all_x(self) -> np.ndarray:
-        """Get the 2θ values for all data points in this collection."""
-        return np.fromiter((p.two_theta.value for p in self._items), dtype=float)
-
-    @property
-    def x(self) -> np.ndarray:
-        """Get the 2θ values for data points included in
-        calculations.
-        """
-        return np.fromiter((p.two_theta.value for p in self._calc_items), dtype=float)
-
     def _update(self, called_by_minimizer=False):
         super()._update(called_by_minimizer)
 
@@ -419,29 +341,11 @@ class PdTofData(PdDataBase):
     # _description: str = 'Powder diffraction data points for
     # time-of-flight experiments.'
 
+    _x_name = 'time_of_flight'
+
     def __init__(self):
         super().__init__(item_type=PdTofDataPoint)
 
-    def _set_x(self, values) -> None:
-        """Helper method to set time-of-flight values."""
-        # TODO: split into multiple methods
-        self._items = [self._item_type() for _ in range(values.size)]
-        for p, v in zip(self._items, values, strict=True):
-            p.time_of_flight._value = v
-        self._set_point_id([str(i + 1) for i in range(values.size)])
-
-    @property
-    def all_x(self) -> np.ndarray:
-        """Get the TOF values for all data points in this collection."""
-        return np.fromiter((p.time_of_flight.value for p in self._items), dtype=float)
-
-    @property
-    def x(self) -> np.ndarray:
-        """Get the TOF values for data points included in
-        calculations.
-        """
-        return np.fromiter((p.time_of_flight.value for p in self._calc_items), dtype=float)
-
     def _update(self, called_by_minimizer=False):
         super()._update(called_by_minimizer)
 
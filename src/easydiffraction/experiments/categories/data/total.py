@@ -6,7 +6,6 @@ from __future__ import annotations
 
 import numpy as np
 
-from easydiffraction.core.category import CategoryCollection
 from easydiffraction.core.category import CategoryItem
 from easydiffraction.core.parameters import NumericDescriptor
 from easydiffraction.core.parameters import StringDescriptor
@@ -15,10 +14,12 @@ from easydiffraction.core.validation import DataTypes
 from easydiffraction.core.validation import MembershipValidator
 from easydiffraction.core.validation import RangeValidator
 from easydiffraction.core.validation import RegexValidator
+from easydiffraction.experiments.categories.data.base import ColumnarDataBase
+from easydiffraction.experiments.categories.data.base import DataPointViewMixin
 from easydiffraction.io.cif.handler import CifHandler
 
 
-class TotalDataPoint(CategoryItem):
+class TotalDataPoint(DataPointViewMixin, CategoryItem):
     """Total scattering (PDF) data point in r-space (real space).
 
     Note: PDF data is always in r-space regardless of whether the
@@ -140,73 +141,41 @@ class TotalDataPoint(CategoryItem):
         return self._calc_status
 
 
-class TotalDataBase(CategoryCollection):
+class TotalDataBase(ColumnarDataBase):
     """Base class for total scattering data collections."""
 
-    _update_priority = 100
+    _meas_name = 'g_r_meas'
+    _meas_su_name = 'g_r_meas_su'
 
     # Should be set only once
 
-    def _set_point_id(self, values) -> None:
-        """Helper method to set point IDs."""
-        for p, v in zip(self._items, values, strict=True):
-            p.point_id._value = v
-
     def _set_meas(self, values) -> None:
         """Helper method to set measured G(r)."""
-        for p, v in zip(self._items, values, strict=True):
-            p.g_r_meas._value = v
+        self._set_column(self._meas_name, values)
 
     def _set_meas_su(self, values) -> None:
         """Helper method to set standard uncertainty of measured
         G(r).
         """
-        for p, v in zip(self._items, values, strict=True):
-            p.g_r_meas_su._value = v
+        self._set_column(self._meas_su_name, values)
 
     # Can be set multiple times
 
     def _set_calc(self, values) -> None:
         """Helper method to set calculated G(r)."""
-        for p, v in zip(self._calc_items, values, strict=True):
-            p.g_r_calc._value = v
-
-    def _set_calc_status(self, values) -> None:
-        """Helper method to set calculation status."""
-        for p, v in zip(self._items, values, strict=True):
-            if v:
-                p.calc_status._value = 'incl'
-            elif not v:
-                p.calc_status._value = 'excl'
-            else:
-                raise ValueError(
-                    f'Invalid calculation status value: {v}. Expected boolean True/False.'
-                )
-
-    @property
-    def _calc_mask(self) -> np.ndarray:
-        return self.calc_status == 'incl'
-
-    @property
-    def _calc_items(self):
-        """Get only the items included in calculations."""
-        return [item for item, mask in zip(self._items, self._calc_mask, strict=False) if mask]
-
-    @property
-    def calc_status(self) -> np.ndarray:
-        return np.fromiter((p.calc_status.value for p in self._items), dtype=object)
+        self._set_column('g_r_calc', values, included_only=True)
 
     @property
     def meas(self) -> np.ndarray:
-        return np.fromiter((p.g_r_meas.value for p in self._calc_items), dtype=float)
+        return self._get_column('g_r_meas', included_only=True)
 
     @property
     def meas_su(self) -> np.ndarray:
-        return np.fromiter((p.g_r_meas_su.value for p in self._calc_items), dtype=float)
+        return self._get_column('g_r_meas_su', included_only=True)
 
     @property
     def calc(self) -> np.ndarray:
-        return np.fromiter((p.g_r_calc.value for p in self._calc_items), dtype=float)
+        return self._get_column('g_r_calc', included_only=True)
 
     @property
     def bkg(self) -> np.ndarray:
@@ -214,28 +183,7 @@ class TotalDataBase(CategoryCollection):
         return np.zeros_like(self.calc)
 
     def _update(self, called_by_minimizer=False):
-        experiment = self._parent
-        experiments = experiment._parent
-        project = experiments._parent
-        sample_models = project.sample_models
-        calculator = project.analysis.calculator
-
-        initial_calc = np.zeros_like(self.x)
-        calc = initial_calc
-        for linked_phase in experiment._get_valid_linked_phases(sample_models):
-            sample_model_id = linked_phase._identity.category_entry_name
-            sample_model_scale = linked_phase.scale.value
-            sample_model = sample_models[sample_model_id]
-
-            sample_model_calc = calculator.calculate_pattern(
-                sample_model,
-                experiment,
-                called_by_minimizer=called_by_minimizer,
-            )
-
-            sample_model_scaled_calc = sample_model_scale * sample_model_calc
-            calc += sample_model_scaled_calc
-
+        calc = self._calc_linked_phases(called_by_minimizer)
         self._set_calc(calc)
 
 
@@ -246,22 +194,7 @@ class TotalData(TotalDataBase):
     is always transformed to r-space.
     """
 
+    _x_name = 'r'
+
     def __init__(self):
         super().__init__(item_type=TotalDataPoint)
-
-    def _set_x(self, values) -> None:
-        """Helper method to set r values."""
-        self._items = [self._item_type() for _ in range(values.size)]
-        for p, v in zip(self._items, values, strict=True):
-            p.r._value = v
-        self._set_point_id([str(i + 1) for i in range(values.size)])
-
-    @property
-    def all_x(self) -> np.ndarray:
-        """Get the r values for all data points."""
-        return np.fromiter((p.r.value for p in self._items), dtype=float)
-
-    @property
-    def x(self) -> np.ndarray:
-        """Get the r values for data points included in calculations."""
-        return np.fromiter((p.r.value for p in self._calc_items), dtype=float)
@@ -119,22 +119,32 @@ class ExcludedRegions(CategoryCollection):
     fitting and plotting.
     """
 
+    _depends_on = ('data',)
+
     def __init__(self):
         super().__init__(item_type=ExcludedRegion)
+        self._applied_key = None
 
     def _update(self, called_by_minimizer=False):
         del called_by_minimizer
 
         data = self._parent.data
+
+        # Skip if neither the regions nor the data points changed since
+        # the calculation status was last set
+        regions = tuple((r.start.value, r.end.value) for r in self.values())
+        key = (regions, getattr(data, '_x_revision', None))
+        if key == self._applied_key:
+            return
+        self._applied_key = key
+
         x = data.all_x
 
         # Start with a mask of all False (nothing excluded yet)
         combined_mask = np.full_like(x, fill_value=False, dtype=bool)
 
         # Combine masks for all excluded regions
-        for region in self.values():
-            start = region.start.value
-            end = region.end.value
+        for start, end in regions:
             region_mask = (x >= start) & (x <= end)
             combined_mask |= region_mask
 
@@ -81,9 +81,7 @@ class BraggPdExperiment(InstrumentMixin, PdExperimentBase):
         sy = np.where(sy < 0.0001, 1.0, sy)
 
         # Set the experiment data
-        self.data._set_x(x)
-        self.data._set_meas(y)
-        self.data._set_meas_su(sy)
+        self.data._load_measured(x, y, sy)
 
         console.paragraph('Data loaded successfully')
         console.print(f"Experiment 🔬 '{self.name}'. Number of data points: {len(x)}")
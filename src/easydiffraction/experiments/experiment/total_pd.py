@@ -51,9 +51,7 @@ class TotalPdExperiment(PdExperimentBase):
         y = data[:, 1]
         sy = data[:, 2] if data.shape[1] > 2 else np.full_like(y, fill_value=default_sy)
 
-        self.data._set_x(x)
-        self.data._set_meas(y)
-        self.data._set_meas_su(sy)
+        self.data._load_measured(x, y, sy)
 
         console.paragraph('Data loaded successfully')
         console.print(f"Experiment 🔬 '{self.name}'. Number of data points: {len(x)}")
@@ -114,7 +114,7 @@ class Experiments(DatablockCollection):
     @typechecked
     def remove(self, name: str) -> None:
         """Remove an experiment by name if it exists."""
-        if name in self:
+        if name in self.names:
             del self[name]
 
     # ------------
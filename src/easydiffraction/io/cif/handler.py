@@ -4,16 +4,36 @@
 
 from __future__ import annotations
 
+import sys
+
+# Shared lists of CIF tag names, one per distinct tuple of names, so
+# that the handlers of all instances of a descriptor reuse one list
+_interned_names: dict[tuple[str, ...], list[str]] = {}
+
+
+def _intern_names(names: list[str]) -> list[str]:
+    """Return the shared list equal to ``names``."""
+    key = tuple(names)
+    interned = _interned_names.get(key)
+    if interned is None:
+        interned = _interned_names[key] = [sys.intern(name) for name in names]
+    return interned
+
 
 class CifHandler:
     """Canonical CIF handler used by descriptors/parameters.
 
     Holds CIF tags (names) and attaches to an owning descriptor so it
     can derive a stable uid if needed.
+
+    The names are interned: handlers created with equal names share one
+    list, which must therefore not be modified in place.
     """
 
+    __slots__ = ('_names', '_owner')
+
     def __init__(self, *, names: list[str]) -> None:
-        self._names = names
+        self._names = _intern_names(names)
         self._owner = None  # set by attach
 
     def attach(self, owner):
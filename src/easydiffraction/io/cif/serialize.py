@@ -20,6 +20,7 @@ if TYPE_CHECKING:
     from easydiffraction.core.category import CategoryCollection
     from easydiffraction.core.category import CategoryItem
     from easydiffraction.core.parameters import GenericDescriptorBase
+    from easydiffraction.experiments.categories.data.base import ColumnarDataBase
 
 
 def format_value(value) -> str:
@@ -91,8 +92,12 @@ def category_collection_to_cif(
 
     lines: list[str] = []
 
+    # Rows are accessed by position, so that collections creating their
+    # items on demand only materialize the displayed rows
+    items = collection._items
+
     # Header
-    first_item = list(collection.values())[0]
+    first_item = items[0]
     lines.append('loop_')
     for p in first_item.parameters:
         tags = p._cif_handler.names  # type: ignore[attr-defined]
@@ -103,17 +108,17 @@ def category_collection_to_cif(
     if len(collection) > max_display:
         half_display = max_display // 2
         for i in range(half_display):
-            item = list(collection.values())[i]
+            item = items[i]
             row_vals = [format_value(p.value) for p in item.parameters]
             lines.append(' '.join(row_vals))
         lines.append('...')
         for i in range(-half_display, 0):
-            item = list(collection.values())[i]
+            item = items[i]
             row_vals = [format_value(p.value) for p in item.parameters]
             lines.append(' '.join(row_vals))
     # No limit
     else:
-        for item in collection.values():
+        for item in items:
             row_vals = [format_value(p.value) for p in item.parameters]
             lines.append(' '.join(row_vals))
 
@@ -278,6 +283,28 @@ def category_item_from_cif(
         param.from_cif(block, idx=idx)
 
 
+def _get_loop(
+    block: gemmi.cif.Block,
+    category_item: CategoryItem,
+) -> Optional[gemmi.cif.Loop]:
+    """Iterate over category parameters and their possible CIF names
+    trying to find the whole loop it belongs to inside the CIF block.
+    """
+    for param in category_item.parameters:
+        for name in param._cif_handler.names:
+            loop = block.find_loop(name).get_loop()
+            if loop is not None:
+                return loop
+    return None
+
+
+def _strip_quotes(raw: str) -> str:
+    """Strip matching single or double quotes around a CIF string."""
+    if len(raw) >= 2 and raw[0] == raw[-1] and raw[0] in {"'", '"'}:
+        return raw[1:-1]
+    return raw
+
+
 def category_collection_from_cif(
     self: CategoryCollection,
     block: gemmi.cif.Block,
@@ -292,16 +319,6 @@ def category_collection_from_cif(
     # parameter CIF names
     category_item = self._item_type()
 
-    # Iterate over category parameters and their possible CIF names
-    # trying to find the whole loop it belongs to inside the CIF block
-    def _get_loop(block, category_item):
-        for param in category_item.parameters:
-            for name in param._cif_handler.names:
-                loop = block.find_loop(name).get_loop()
-                if loop is not None:
-                    return loop
-        return None
-
     loop = _get_loop(block, category_item)
 
     # If no loop found
@@ -319,7 +336,7 @@ def category_collection_from_cif(
 
     # Set parent for each item to enable identity resolution
     for item in self._items:
-        object.__setattr__(item, '_parent', self)
+        item._parent = self
 
     # Set those items' parameters, which are present in the loop
     for row_idx in range(num_rows):
@@ -354,3 +371,60 @@ def category_collection_from_cif(
                         log.debug(f'Unrecognized type: {param._value_type}')
 
                     break
+
+
+def columnar_collection_from_cif(
+    self: ColumnarDataBase,
+    block: gemmi.cif.Block,
+) -> None:
+    """Populate a columnar data collection from a CIF loop.
+
+    Whole loop columns are converted at once instead of creating and
+    validating one item per row.
+    """
+    category_item = self._item_type()
+    loop = _get_loop(block, category_item)
+
+    # If no loop found
+    if loop is None:
+        log.debug(f'No loop found for category {self}.')
+        return
+
+    # Get 2D array of loop values (as strings)
+    num_rows = loop.length()
+    num_cols = loop.width()
+    array = np.array(loop.values, dtype=str).reshape(num_rows, num_cols)
+
+    # Collect those columns, which are present in the loop
+    columns = {}
+    for param in category_item.parameters:
+        for cif_name in param._cif_handler.names:
+            if cif_name not in loop.tags:
+                continue
+            raw = array[:, loop.tags.index(cif_name)]
+
+            # If numeric, try the fast conversion first and fall back
+            # to parsing values with uncertainties in brackets
+            if param._value_type == DataTypes.NUMERIC:
+                try:
+                    values = raw.astype(float)
+                except ValueError:
+                    default = self._defaults[param.name]
+                    values = np.array([str_to_ufloat(v, default).n for v in raw], dtype=float)
+
+            # If string, strip quotes if present
+            elif param._value_type == DataTypes.STRING:
+                values = [_strip_quotes(v) for v in raw]
+                if param.name == self._status_name:
+                    values = [v == 'incl' for v in values]
+
+            # Other types are not supported
+            else:
+                log.debug(f'Unrecognized type: {param._value_type}')
+                break
+
+            columns[param.name] = values
+            break
+
+    # Allocate and fill all columns at once
+    self._load_columns(columns)
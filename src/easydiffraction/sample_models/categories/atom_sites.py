@@ -6,12 +6,15 @@ Defines AtomSite items and AtomSites collection used in sample models.
 Only documentation was added; behavior remains unchanged.
 """
 
-from cryspy.A_functions_base.database import DATABASE
+import functools
+
+import numpy as np
 
 from easydiffraction.core.category import CategoryCollection
 from easydiffraction.core.category import CategoryItem
 from easydiffraction.core.parameters import Parameter
 from easydiffraction.core.parameters import StringDescriptor
+from easydiffraction.core.parameters import bulk_update
 from easydiffraction.core.validation import AttributeSpec
 from easydiffraction.core.validation import DataTypes
 from easydiffraction.core.validation import MembershipValidator
@@ -21,6 +24,14 @@ from easydiffraction.crystallography import crystallography as ecr
 from easydiffraction.io.cif.handler import CifHandler
 
 
+@functools.cache
+def _type_symbols() -> list[str]:
+    """Chemical symbols known to cryspy, shared by all atom sites."""
+    from cryspy.A_functions_base.database import DATABASE
+
+    return list({key[1] for key in DATABASE['Isotopes']})
+
+
 class AtomSite(CategoryItem):
     """Single atom site with fractional coordinates and ADP.
 
@@ -192,7 +203,7 @@ class AtomSite(CategoryItem):
 
     @property
     def _type_symbol_allowed_values(self):
-        return list({key[1] for key in DATABASE['Isotopes']})
+        return _type_symbols()
 
     @property
     def _wyckoff_letter_allowed_values(self):
@@ -292,6 +303,8 @@ class AtomSite(CategoryItem):
 class AtomSites(CategoryCollection):
     """Collection of AtomSite instances."""
 
+    _depends_on = ('space_group',)
+
     def __init__(self):
         super().__init__(item_type=AtomSite)
 
@@ -302,30 +315,36 @@ class AtomSites(CategoryCollection):
         sample_model = self._parent
         space_group_name = sample_model.space_group.name_h_m.value
         space_group_coord_code = sample_model.space_group.it_coordinate_system_code.value
-        for atom in self._items:
-            dummy_atom = {
-                'fract_x': atom.fract_x.value,
-                'fract_y': atom.fract_y.value,
-                'fract_z': atom.fract_z.value,
-            }
-            wl = atom.wyckoff_letter.value
-            if not wl:
-                # TODO: Decide how to handle this case
-                #  For now, we just skip applying constraints if wyckoff
-                #  letter is not set. Alternatively, could raise an
-                #  error or warning
-                #  print(f"Warning: Wyckoff letter is not ...")
-                #  raise ValueError("Wyckoff letter is not ...")
-                continue
-            ecr.apply_atom_site_symmetry_constraints(
-                atom_site=dummy_atom,
-                name_hm=space_group_name,
-                coord_code=space_group_coord_code,
-                wyckoff_letter=wl,
-            )
-            atom.fract_x.value = dummy_atom['fract_x']
-            atom.fract_y.value = dummy_atom['fract_y']
-            atom.fract_z.value = dummy_atom['fract_z']
+
+        # TODO: Decide how to handle atoms without a Wyckoff letter
+        #  For now, we just skip applying constraints if wyckoff
+        #  letter is not set. Alternatively, could raise an
+        #  error or warning
+        #  print(f"Warning: Wyckoff letter is not ...")
+        #  raise ValueError("Wyckoff letter is not ...")
+        atoms = [atom for atom in self._items if atom.wyckoff_letter.value]
+        if not atoms:
+            return
+
+        coords = np.array([
+            [atom.fract_x.value, atom.fract_y.value, atom.fract_z.value] for atom in atoms
+        ])
+        constrained = ecr.apply_atom_sites_symmetry_constraints(
+            coords,
+            name_hm=space_group_name,
+            coord_code=space_group_coord_code,
+            wyckoff_letters=[atom.wyckoff_letter.value for atom in atoms],
+        )
+
+        # Only write the coordinates fixed by symmetry. They derive
+        # from validated ones, so are written as trusted values
+        with bulk_update():
+            for atom, old, new in zip(atoms, coords, constrained, strict=True):
+                for param, old_value, new_value in zip(
+                    (atom.fract_x, atom.fract_y, atom.fract_z), old, new, strict=True
+                ):
+                    if new_value != old_value:
+                        param.value = float(new_value)
 
     def _update(self, called_by_minimizer=False):
         """Update atom sites by applying symmetry constraints."""
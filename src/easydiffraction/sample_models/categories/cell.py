@@ -6,6 +6,7 @@ from typing import Optional
 
 from easydiffraction.core.category import CategoryItem
 from easydiffraction.core.parameters import Parameter
+from easydiffraction.core.parameters import bulk_update
 from easydiffraction.core.validation import AttributeSpec
 from easydiffraction.core.validation import DataTypes
 from easydiffraction.core.validation import RangeValidator
@@ -16,6 +17,8 @@ from easydiffraction.io.cif.handler import CifHandler
 class Cell(CategoryItem):
     """Unit cell with lengths a, b, c and angles alpha, beta, gamma."""
 
+    _depends_on = ('space_group',)
+
     def __init__(
         self,
         *,
@@ -174,12 +177,14 @@ class Cell(CategoryItem):
             name_hm=space_group_name,
         )
 
-        self.length_a.value = dummy_cell['lattice_a']
-        self.length_b.value = dummy_cell['lattice_b']
-        self.length_c.value = dummy_cell['lattice_c']
-        self.angle_alpha.value = dummy_cell['angle_alpha']
-        self.angle_beta.value = dummy_cell['angle_beta']
-        self.angle_gamma.value = dummy_cell['angle_gamma']
+        # Constrained values derive from validated ones
+        with bulk_update():
+            self.length_a.value = dummy_cell['lattice_a']
+            self.length_b.value = dummy_cell['lattice_b']
+            self.length_c.value = dummy_cell['lattice_c']
+            self.angle_alpha.value = dummy_cell['angle_alpha']
+            self.angle_beta.value = dummy_cell['angle_beta']
+            self.angle_gamma.value = dummy_cell['angle_gamma']
 
     def _update(self, called_by_minimizer=False):
         """Update cell parameters by applying symmetry constraints."""
@@ -2,17 +2,12 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Space group category for crystallographic sample models."""
 
-from cryspy.A_functions_base.function_2_space_group import ACCESIBLE_NAME_HM_SHORT
-from cryspy.A_functions_base.function_2_space_group import (
-    get_it_coordinate_system_codes_by_it_number,
-)
-from cryspy.A_functions_base.function_2_space_group import get_it_number_by_name_hm_short
-
 from easydiffraction.core.category import CategoryItem
 from easydiffraction.core.parameters import StringDescriptor
 from easydiffraction.core.validation import AttributeSpec
 from easydiffraction.core.validation import DataTypes
 from easydiffraction.core.validation import MembershipValidator
+from easydiffraction.crystallography.space_groups import it_number_by_name_hm
 from easydiffraction.io.cif.handler import CifHandler
 
 
@@ -73,12 +68,18 @@ class SpaceGroup(CategoryItem):
 
     @property
     def _name_h_m_allowed_values(self):
+        from cryspy.A_functions_base.function_2_space_group import ACCESIBLE_NAME_HM_SHORT
+
         return ACCESIBLE_NAME_HM_SHORT
 
     @property
     def _it_coordinate_system_code_allowed_values(self):
+        from cryspy.A_functions_base.function_2_space_group import (
+            get_it_coordinate_system_codes_by_it_number,
+        )
+
         name = self.name_h_m.value
-        it_number = get_it_number_by_name_hm_short(name)
+        it_number = it_number_by_name_hm(name)
         codes = get_it_coordinate_system_codes_by_it_number(it_number)
         codes = [str(code) for code in codes]
         return codes if codes else ['']
@@ -67,7 +67,7 @@ class SampleModels(DatablockCollection):
         Args:
             name: ID of the model to remove.
         """
-        if name in self:
+        if name in self.names:
             del self[name]
 
     # ------------
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2021-2026 EasyDiffraction contributors <https://github.com/easyscience/diffraction>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Deferred imports for pluggable backends.
+
+Factories register their backends by import path (``'module:Name'``)
+so that heavy engines such as cryspy, pdffit2, lmfit or plotly are
+only imported once a backend is actually selected.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+
+def import_object(path: str) -> Any:
+    """Import and return the object at ``path``.
+
+    Args:
+        path: Import path in the form ``'package.module:Name'``.
+
+    Returns:
+        The named attribute of the imported module.
+    """
+    module_name, _, attr_name = path.partition(':')
+    return getattr(import_module(module_name), attr_name)
+
+
+def resolve(obj: Any) -> Any:
+    """Return ``obj``, importing it first if it is an import path.
+
+    Registries accept either the object itself or its import path, so
+    that user-registered classes keep working unchanged.
+    """
+    if isinstance(obj, str):
+        return import_object(obj)
+    return obj
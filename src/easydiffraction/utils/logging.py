@@ -436,6 +436,12 @@ class Logger:
     def mode(cls) -> Mode:
         return cls._mode
 
+    @classmethod
+    def debug_enabled(cls) -> bool:
+        """Whether debug messages are emitted at the current level."""
+        cls._lazy_config()
+        return cls._logger.isEnabledFor(logging.DEBUG)
+
     @classmethod
     def _lazy_config(cls) -> None:
         if not cls._configured:  # pragma: no cover - trivial
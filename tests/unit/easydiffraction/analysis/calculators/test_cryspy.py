@@ -23,3 +23,93 @@ def test_cryspy_calculator_engine_flag_and_converters():
 
     # _convert_sample_model_to_cryspy_cif returns input as_cif
     assert calc._convert_sample_model_to_cryspy_cif(DummySample()) == 'data_x'
+
+
+def test_update_cryspy_dict_writes_only_changed_slots():
+    from types import SimpleNamespace as NS
+
+    import numpy as np
+
+    from easydiffraction.analysis.calculators.cryspy import CryspyCalculator
+    from easydiffraction.experiments.experiment.enums import BeamModeEnum
+
+    def v(x):
+        return NS(value=x)
+
+    atom = NS(fract_x=v(0.1), fract_y=v(0.2), fract_z=v(0.3), occupancy=v(1.0), b_iso=v(0.5))
+    cell = NS(
+        length_a=v(4.0),
+        length_b=v(4.0),
+        length_c=v(4.0),
+        angle_alpha=v(90.0),
+        angle_beta=v(90.0),
+        angle_gamma=v(90.0),
+    )
+    model = NS(name='m', cell=cell, atom_sites=[atom])
+    peak = NS(
+        broad_gauss_u=v(0.1),
+        broad_gauss_v=v(-0.1),
+        broad_gauss_w=v(0.2),
+        broad_lorentz_x=v(0.0),
+        broad_lorentz_y=v(0.0),
+    )
+    expt = NS(
+        name='e',
+        type=NS(beam_mode=v(BeamModeEnum.CONSTANT_WAVELENGTH)),
+        instrument=NS(calib_twotheta_offset=v(0.0), setup_wavelength=v(1.5)),
+        peak=peak,
+    )
+
+    calc = CryspyCalculator()
+    cryspy_dict = {
+        'crystal_m': {
+            'unit_cell_parameters': np.zeros(6),
+            'atom_fract_xyz': np.zeros((3, 1)),
+            'atom_occupancy': np.zeros(1),
+            'atom_b_iso': np.zeros(1),
+        },
+        'pd_e': {
+            'offset_ttheta': np.zeros(1),
+            'wavelength': np.zeros(1),
+            'resolution_parameters': np.zeros(5),
+        },
+    }
+    calc._cryspy_dicts['m_e'] = cryspy_dict
+    calc._pushed_values['m_e'] = {}
+
+    assert calc._update_cryspy_dict(model, expt) is cryspy_dict
+    assert np.allclose(cryspy_dict['crystal_m']['atom_fract_xyz'][:, 0], [0.1, 0.2, 0.3])
+    assert cryspy_dict['pd_e']['wavelength'][0] == 1.5
+
+    # Unchanged slots are not rewritten
+    cryspy_dict['crystal_m']['unit_cell_parameters'][:] = -1.0
+    peak.broad_gauss_u = v(0.3)
+    calc._update_cryspy_dict(model, expt)
+    assert np.all(cryspy_dict['crystal_m']['unit_cell_parameters'] == -1.0)
+    assert cryspy_dict['pd_e']['resolution_parameters'][0] == 0.3
+
+
+def test_set_cryspy_dict_data_uses_arrays_directly():
+    from types import SimpleNamespace as NS
+
+    import numpy as np
+
+    from easydiffraction.analysis.calculators.cryspy import CryspyCalculator
+    from easydiffraction.experiments.experiment.enums import BeamModeEnum
+
+    x = np.array([10.123456789, 20.0, 30.0])
+    data = NS(x=x, meas=np.array([1.0, 2.0, 3.0]), meas_su=np.array([0.1234567, 0.2, 0.3]))
+    expt = NS(name='e', type=NS(beam_mode=NS(value=BeamModeEnum.CONSTANT_WAVELENGTH)), data=data)
+
+    calc = CryspyCalculator()
+
+    # Block without measured data is not supported by the direct path
+    assert not calc._set_cryspy_dict_data({'pd_e': {}}, expt)
+
+    cryspy_dict = {'pd_e': {'ttheta': np.zeros(2)}}
+    assert calc._set_cryspy_dict_data(cryspy_dict, expt)
+    expt_dict = cryspy_dict['pd_e']
+    assert np.allclose(expt_dict['ttheta'], np.deg2rad(x))
+    assert expt_dict['signal_exp'].shape == (2, 3)
+    assert expt_dict['signal_exp'][1, 0] == 0.1234567
+    assert not expt_dict['excluded_points'].any()
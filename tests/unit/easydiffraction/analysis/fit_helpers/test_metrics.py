@@ -52,3 +52,34 @@ def test_get_reliability_inputs_collects_arrays_with_default_su():
     y_obs, y_calc, y_err = M.get_reliability_inputs(SampleModels(), Expts())
     assert y_obs.shape == (2,) and y_calc.shape == (2,) and y_err.shape == (2,)
     assert np.allclose(y_err, 1.0)
+
+
+def test_get_reliability_inputs_updates_sample_models_once():
+    from easydiffraction.analysis.fit_helpers import metrics as M
+
+    updates = []
+
+    class DS:
+        meas = np.array([1.0])
+        meas_su = np.array([0.1])
+        calc = np.array([1.1])
+
+    class Model:
+        def _update_categories(self, called_by_minimizer=False):
+            del called_by_minimizer
+            updates.append('model')
+
+    class Expt:
+        data = DS()
+
+        def _update_categories(self, called_by_minimizer=False):
+            del called_by_minimizer
+            updates.append('expt')
+
+    class Expts(dict):
+        def values(self):
+            return [Expt(), Expt()]
+
+    y_obs, _, _ = M.get_reliability_inputs([Model()], Expts())
+    assert y_obs.shape == (2,)
+    assert updates == ['model', 'expt', 'expt']
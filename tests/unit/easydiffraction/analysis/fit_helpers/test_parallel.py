@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2021-2026 EasyDiffraction contributors <https://github.com/easyscience/diffraction>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+
+
+def test_module_import():
+    import easydiffraction.analysis.fit_helpers.parallel as MUT
+
+    expected_module_name = 'easydiffraction.analysis.fit_helpers.parallel'
+    actual_module_name = MUT.__name__
+    assert expected_module_name == actual_module_name
+
+
+def test_create_returns_none_for_single_worker():
+    from easydiffraction.analysis.fit_helpers.parallel import PatternExecutor
+
+    assert PatternExecutor.create(project=object(), num_workers=1) is None
+
+
+def test_prefetch_caches_patterns_in_submission_order(monkeypatch):
+    from types import SimpleNamespace as NS
+
+    import easydiffraction.analysis.fit_helpers.parallel as MUT
+
+    class Data:
+        def __init__(self, missing):
+            self._missing = missing
+            self._calc_mask = np.array([True, False, True])
+            self.cached = []
+
+        def _missing_phase_patterns(self):
+            return self._missing
+
+        def _cache_phase_pattern(self, sample_model_id, fingerprint, pattern):
+            self.cached.append((sample_model_id, fingerprint, pattern))
+
+    phase_a = NS(name='a', parameters=[NS(value=1.0)])
+    phase_b = NS(name='b', parameters=[NS(value=2.0)])
+    data1 = Data([('a', phase_a, 'fp-a1'), ('b', phase_b, 'fp-b1')])
+    data2 = Data([('b', phase_b, 'fp-b2')])
+    experiments = {
+        'e1': NS(name='e1', data=data1, parameters=[NS(value=10.0)]),
+        'e2': NS(name='e2', data=data2, parameters=[NS(value=20.0)]),
+    }
+
+    # Evaluate the tasks in-process instead of in worker processes
+    def fake_calculate(task):
+        _, _, model_values, experiment_values, calc_mask = task
+        return np.full(calc_mask.sum(), model_values[0] + experiment_values[0])
+
+    monkeypatch.setattr(MUT, '_calculate_phase_pattern', fake_calculate)
+    executor = MUT.PatternExecutor.__new__(MUT.PatternExecutor)
+    executor._pool = NS(map=map)
+    executor._started = True
+
+    executor.prefetch(NS(values=experiments.values))
+
+    assert [(i, fp) for i, fp, _ in data1.cached] == [('a', 'fp-a1'), ('b', 'fp-b1')]
+    assert [(i, fp) for i, fp, _ in data2.cached] == [('b', 'fp-b2')]
+    assert np.array_equal(data1.cached[0][2], [11.0, 11.0])
+    assert np.array_equal(data1.cached[1][2], [12.0, 12.0])
+    assert np.array_equal(data2.cached[0][2], [22.0, 22.0])
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2021-2026 EasyDiffraction contributors <https://github.com/easyscience/diffraction>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import types
+
+import numpy as np
+
+
+def test_module_import():
+    import easydiffraction.analysis.minimizers.jacobian as MUT
+
+    assert MUT.__name__ == 'easydiffraction.analysis.minimizers.jacobian'
+
+
+def test_create_returns_none_for_single_worker():
+    from easydiffraction.analysis.minimizers.jacobian import ParallelJacobian
+
+    assert ParallelJacobian.create(lambda values: values, num_workers=1) is None
+
+
+def _in_process_jacobian(monkeypatch, residuals, lower=None, upper=None):
+    import easydiffraction.analysis.minimizers.jacobian as MUT
+
+    # Evaluate the points in-process instead of in worker processes
+    monkeypatch.setattr(MUT, '_worker_residuals', residuals)
+    jacobian = MUT.ParallelJacobian.__new__(MUT.ParallelJacobian)
+    jacobian._pool = types.SimpleNamespace(map=map)
+    jacobian._lower = lower
+    jacobian._upper = upper
+    jacobian._relative_step = MUT.DEFAULT_RELATIVE_STEP
+    return jacobian
+
+
+def test_forward_differences_of_linear_residuals(monkeypatch):
+    matrix = np.array([[1.0, 2.0], [3.0, -4.0], [0.5, 0.0]])
+    jacobian = _in_process_jacobian(monkeypatch, lambda values: matrix @ values)
+
+    result = jacobian(np.array([2.0, 0.0]))
+
+    assert result.shape == (3, 2)
+    assert np.allclose(result, matrix)
+
+
+def test_steps_go_down_at_upper_bound(monkeypatch):
+    jacobian = _in_process_jacobian(
+        monkeypatch,
+        lambda values: values**2,
+        lower=np.array([-np.inf, -np.inf]),
+        upper=np.array([1.0, np.inf]),
+    )
+
+    steps = jacobian._steps(np.array([1.0, 1.0]))
+    assert steps[0] < 0 < steps[1]
+    assert np.allclose(np.diag(jacobian(np.array([1.0, 1.0]))), 2.0, rtol=1e-4)
+
+
+def test_analytic_jacobian_differentiates_only_unknown_columns():
+    from easydiffraction.analysis.minimizers.jacobian import AnalyticJacobian
+
+    matrix = np.array([[1.0, 2.0, 0.0], [3.0, -4.0, 1.0]])
+    evaluated = []
+
+    def residuals(values):
+        evaluated.append(values.copy())
+        return matrix @ values + np.array([0.0, values[2] ** 2])
+
+    # Column 0 is known, the others are differentiated numerically
+    jacobian = AnalyticJacobian(residuals, lambda: {0: np.array([10.0, 20.0])})
+    result = jacobian(np.array([1.0, 1.0, 1.0]))
+
+    assert len(evaluated) == 3
+    assert np.allclose(result[:, 0], [10.0, 20.0])
+    assert np.allclose(result[:, 1], [2.0, -4.0])
+    assert np.allclose(result[:, 2], [0.0, 3.0], rtol=1e-4)
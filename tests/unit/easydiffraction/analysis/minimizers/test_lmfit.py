@@ -71,3 +71,40 @@ def test_lmfit_prepare_and_sync(monkeypatch):
     assert params[0].value == 10.0 and params[0].uncertainty == 0.5
     assert params[1].value == 20.0 and params[1].uncertainty == 1.0
     assert minim._check_success(res) is True
+
+
+def test_lmfit_passes_jacobian_as_dfun(monkeypatch):
+    import easydiffraction.analysis.minimizers.lmfit as lm
+    from easydiffraction.analysis.minimizers.lmfit import LmfitMinimizer
+
+    captured = {}
+
+    def fake_minimize(*args, **kwargs):
+        captured.update(kwargs)
+        return types.SimpleNamespace(success=True)
+
+    monkeypatch.setattr(lm.lmfit, 'minimize', fake_minimize)
+
+    class P:
+        def __init__(self, name, value):
+            self._minimizer_uid = name
+            self.value = value
+            self.free = True
+            self.fit_min = -np.inf
+            self.fit_max = np.inf
+
+    minim = LmfitMinimizer()
+    assert minim.supports_jacobian
+    kwargs = minim._prepare_solver_args([P('p1', 1.0), P('p2', 2.0)])
+    minim._run_solver(
+        lambda *a, **k: np.array([0.0]),
+        jacobian=lambda values: np.outer([1.0, 1.0, 1.0], values),
+        **kwargs,
+    )
+
+    # Dfun receives lmfit parameters and returns the Jacobian for the
+    # values in the order of the free parameters
+    jac = captured['Dfun'](kwargs['engine_parameters'])
+    assert np.array_equal(jac, [[1.0, 2.0]] * 3)
+
+    assert not LmfitMinimizer(method='nelder').supports_jacobian
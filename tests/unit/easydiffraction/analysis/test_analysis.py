@@ -135,3 +135,40 @@ def test_show_fit_results_calls_process_fit_results(monkeypatch):
     a.show_fit_results()
 
     assert process_called['called'], '_process_fit_results should be called'
+
+
+def test_num_workers_default_and_validation(capsys):
+    import pytest
+
+    from easydiffraction.analysis.analysis import Analysis
+
+    a = Analysis(project=_make_project_with_names([]))
+    assert a.num_workers == 1
+
+    a.num_workers = 4
+    out = capsys.readouterr().out
+    assert 'Number of workers changed to' in out
+    assert a.num_workers == 4
+
+    for invalid in (0, -1, 2.5, True):
+        with pytest.raises(ValueError):
+            a.num_workers = invalid
+    assert a.num_workers == 4
+
+
+def test_jacobian_mode_default_and_validation(capsys):
+    import pytest
+
+    from easydiffraction.analysis.analysis import Analysis
+
+    a = Analysis(project=_make_project_with_names([]))
+    assert a.jacobian_mode == 'numeric'
+
+    a.jacobian_mode = 'analytic'
+    out = capsys.readouterr().out
+    assert 'Current Jacobian mode changed to' in out
+    assert a.jacobian_mode == 'analytic'
+
+    with pytest.raises(ValueError):
+        a.jacobian_mode = 'symbolic'
+    assert a.jacobian_mode == 'analytic'
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2021-2026 EasyDiffraction contributors <https://github.com/easyscience/diffraction>
 # SPDX-License-Identifier: BSD-3-Clause
 
+
 def test_module_import():
     import easydiffraction.analysis.fitting as MUT
 
@@ -90,3 +91,48 @@ def test_fitter_fit_does_not_call_process_fit_results(monkeypatch):
         'Use Analysis.show_fit_results() instead.'
     )
     assert f.results is not None, 'Fitter.fit() should still set results'
+
+
+def test_fitter_calculates_weighted_residuals_in_one_buffer():
+    import numpy as np
+
+    from easydiffraction.analysis.fitting import Fitter
+
+    class Data:
+        def __init__(self, meas, su):
+            self.meas = np.array(meas)
+            self.meas_su = np.array(su)
+            self.calc = np.zeros_like(self.meas)
+
+    class Expt:
+        def __init__(self, data):
+            self.data = data
+
+        def _update_categories(self, called_by_minimizer=False):
+            del called_by_minimizer
+            self.data.calc = self.data.calc + 1.0
+
+    class Weight:
+        def __init__(self, value):
+            self.weight = type('W', (), {'value': value})()
+
+    class Expts(dict):
+        @property
+        def names(self):
+            return list(self)
+
+    experiments = Expts(a=Expt(Data([2.0, 3.0], [1.0, 2.0])), b=Expt(Data([5.0], [4.0])))
+    weights = {'a': Weight(1.0), 'b': Weight(3.0)}
+
+    f = Fitter()
+    first = f._calculate_residuals([], experiments, weights=weights)
+    buffer = f._residual_layout[0]
+    second = f._calculate_residuals([], experiments, weights=weights)
+
+    # Weights are normalized to sum to the number of experiments
+    wa, wb = np.sqrt(0.5), np.sqrt(1.5)
+    assert np.allclose(first, [1.0 * wa, 1.0 * wa, 1.0 * wb])
+    assert np.allclose(second, [0.0, 0.5 * wa, 0.75 * wb])
+    # The buffer is reused and the returned residuals are copies
+    assert f._residual_layout[0] is buffer
+    assert first is not buffer and second is not buffer
@@ -65,3 +65,18 @@ def test_category_collection_str_and_cif_calls():
     assert 'collection' in s and '2 items' in s
     # as_cif delegates to serializer; should be a string (possibly empty)
     assert isinstance(c.as_cif, str)
+
+
+def test_category_collection_load_columns():
+    class DefaultItem(SimpleItem):
+        def __init__(self):
+            super().__init__(lambda: self.a.value)
+
+    c = CategoryCollection(item_type=DefaultItem)
+    c._load_columns({'a': ['p', 'q'], 'b': ['1', '2']})
+    assert c.names == ['p', 'q']
+    assert c['q'].b.value == '2'
+
+    c._load_columns({'a': ['r']})
+    assert c.names == ['r']
+    assert c['r'].b.value == 'y'
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2021-2026 EasyDiffraction contributors <https://github.com/easyscience/diffraction>
 # SPDX-License-Identifier: BSD-3-Clause
 
+
 def test_datablock_collection_add_and_filters_with_real_parameters():
     from easydiffraction.core.category import CategoryItem
     from easydiffraction.core.datablock import DatablockCollection
@@ -71,3 +72,65 @@ def test_datablock_collection_add_and_filters_with_real_parameters():
     # free is subset of fittable where free=True (true for p1)
     free_params = coll.free_parameters
     assert free_params == fittable
+
+
+def test_datablock_item_updates_only_changed_categories_and_dependents():
+    from easydiffraction.core.category import CategoryItem
+    from easydiffraction.core.datablock import DatablockItem
+    from easydiffraction.core.parameters import Parameter
+    from easydiffraction.core.validation import AttributeSpec
+    from easydiffraction.core.validation import DataTypes
+    from easydiffraction.io.cif.handler import CifHandler
+
+    updated = []
+
+    class Cat(CategoryItem):
+        def __init__(self, code):
+            super().__init__()
+            self._identity.category_code = code
+            self._p = Parameter(
+                name='p',
+                description='',
+                value_spec=AttributeSpec(value=1.0, type_=DataTypes.NUMERIC, default=0.0),
+                units='',
+                cif_handler=CifHandler(names=[f'_{code}.p']),
+            )
+
+        def _update(self, called_by_minimizer=False):
+            del called_by_minimizer
+            updated.append(self._identity.category_code)
+
+    class Derived(Cat):
+        _depends_on = ('a',)
+        _update_priority = 20
+
+    class Last(Cat):
+        _depends_on = ('*',)
+        _update_priority = 30
+
+    class Block(DatablockItem):
+        def __init__(self):
+            super().__init__()
+            self._last = Last('last')
+            self._derived = Derived('derived')
+            self._a = Cat('a')
+            self._b = Cat('b')
+
+    block = Block()
+    block._update_categories()
+    assert updated == ['a', 'b', 'derived', 'last']
+
+    # Nothing changed: nothing is updated
+    updated.clear()
+    block._update_categories()
+    assert updated == []
+
+    # Only the changed category and the ones depending on it
+    block._b._p.value = 2.0
+    block._update_categories()
+    assert updated == ['b', 'last']
+
+    updated.clear()
+    block._a._p.value = 2.0
+    block._update_categories()
+    assert updated == ['a', 'derived', 'last']
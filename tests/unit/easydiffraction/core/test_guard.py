@@ -51,3 +51,36 @@ def test_guard_allows_only_declared_public_properties_and_links_parent(monkeypat
     # Unknown attribute should raise AttributeError under current logging mode
     with pytest.raises(AttributeError):
         p.child.unknown_attr = 1
+
+
+def test_guard_public_attr_sets_are_cached_per_class():
+    from easydiffraction.core.guard import GuardedBase
+
+    class Base(GuardedBase):
+        @property
+        def parameters(self):
+            return []
+
+        @property
+        def as_cif(self) -> str:
+            return ''
+
+        @property
+        def value(self):
+            return 0
+
+        @value.setter
+        def value(self, v):
+            pass
+
+    class Derived(Base):
+        @property
+        def extra(self):
+            return 1
+
+    # Computed once at class creation and reused on each call
+    assert Base._public_attrs() is Base._public_attrs()
+    assert {'parameters', 'as_cif', 'value'} <= Base._public_attrs()
+    assert Derived._public_attrs() == Base._public_attrs() | {'extra'}
+    assert 'extra' in Derived._public_readonly_attrs()
+    assert Derived._public_writable_attrs() == {'value'}
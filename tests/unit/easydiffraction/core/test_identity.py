@@ -28,3 +28,29 @@ def test_identity_cycle_safe_resolution():
     a._parent = b
     b._parent = a
     assert a._identity.category_code is None
+
+
+def test_identity_names_cached_until_invalidated():
+    from easydiffraction.core.identity import Identity
+    from easydiffraction.core.identity import invalidate_identities
+
+    calls = []
+
+    class Node:
+        def __init__(self):
+            self.name = 'a'
+            self._identity = Identity(owner=self, category_entry=self._entry)
+
+        def _entry(self):
+            calls.append(self.name)
+            return self.name
+
+    node = Node()
+    assert node._identity.category_entry_name == 'a'
+    assert node._identity.category_entry_name == 'a'
+    assert calls == ['a']
+
+    node.name = 'b'
+    invalidate_identities()
+    assert node._identity.category_entry_name == 'b'
+    assert calls == ['a', 'b']
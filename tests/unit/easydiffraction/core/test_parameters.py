@@ -98,3 +98,98 @@ def test_parameter_fit_bounds_assign_and_read():
     p.fit_min = -1.0
     p.fit_max = 10.0
     assert np.isclose(p.fit_min, -1.0) and np.isclose(p.fit_max, 10.0)
+
+
+def test_bulk_update_skips_validation_and_marks_datablock_on_exit():
+    from easydiffraction.core.category import CategoryItem
+    from easydiffraction.core.datablock import DatablockItem
+    from easydiffraction.core.parameters import Parameter
+    from easydiffraction.core.parameters import bulk_update
+    from easydiffraction.core.validation import AttributeSpec
+    from easydiffraction.core.validation import DataTypes
+    from easydiffraction.core.validation import RangeValidator
+    from easydiffraction.io.cif.handler import CifHandler
+
+    class Cat(CategoryItem):
+        def __init__(self):
+            super().__init__()
+            self._p = Parameter(
+                name='p',
+                value_spec=AttributeSpec(
+                    value=1.0,
+                    type_=DataTypes.NUMERIC,
+                    default=0.0,
+                    content_validator=RangeValidator(ge=0),
+                ),
+                cif_handler=CifHandler(names=['_cat.p']),
+            )
+
+    class Block(DatablockItem):
+        def __init__(self):
+            super().__init__()
+            self._cat = Cat()
+
+    block = Block()
+    p = block._cat._p
+
+    with bulk_update():
+        p.value = -2.0
+        with bulk_update():
+            p.value = -3.0
+        assert not block._need_categories_update
+
+    assert p.value == -3.0
+    assert block._need_categories_update
+
+    # Outside the context, values are validated again
+    with pytest.raises(TypeError):
+        p.value = -4.0
+
+
+def test_parameters_are_compact_and_share_specs():
+    from easydiffraction.core.parameters import Parameter
+    from easydiffraction.core.validation import AttributeSpec
+    from easydiffraction.core.validation import DataTypes
+    from easydiffraction.io.cif.handler import CifHandler
+    from easydiffraction.utils.logging import log
+
+    def make():
+        return Parameter(
+            name='p',
+            value_spec=AttributeSpec(value=1.0, type_=DataTypes.NUMERIC, default=0.0),
+            cif_handler=CifHandler(names=['_cat.p']),
+        )
+
+    p1, p2 = make(), make()
+
+    # No per-instance dicts, shared specs and interned CIF names
+    assert not hasattr(p1, '__dict__')
+    assert not hasattr(p1._identity, '__dict__')
+    assert p1._uncertainty_spec is p2._uncertainty_spec
+    assert p1._value_spec._type_validator is p2._value_spec._type_validator
+    assert p1._cif_handler.names is p2._cif_handler.names
+    assert p1._fit_start_value is None
+
+    # Public attributes are still guarded
+    log.configure(reaction=log.Reaction.WARN)
+    p1.unknown = 1
+    assert not hasattr(type(p1), 'unknown')
+    p1.free = True
+    assert p1.free is True
+
+
+def test_generate_uid_is_sequential_and_skips_taken_uids(monkeypatch):
+    import easydiffraction.core.parameters as MUT
+    from easydiffraction.core.parameters import GenericParameter
+    from easydiffraction.core.singletons import UidMapHandler
+
+    class Taken:
+        pass
+
+    taken = Taken()
+    monkeypatch.setattr(MUT, '_uid_counter', iter([27, 28, 29]))
+    monkeypatch.setitem(UidMapHandler.get().get_uid_map(), 'aaaaaaaaaaaaaabm', taken)
+
+    # 27 = 0x1b and 29 = 0x1d, while 28 = 0x1c is already taken
+    assert GenericParameter._generate_uid() == 'aaaaaaaaaaaaaabl'
+    assert GenericParameter._generate_uid() == 'aaaaaaaaaaaaaabn'
@@ -10,3 +10,210 @@ def test_uid_map_handler_rejects_non_descriptor():
     h = UidMapHandler.get()
     with pytest.raises(TypeError):
         h.add_to_uid_map(object())
+
+
+def test_constraints_handler_derivatives(monkeypatch):
+    from types import SimpleNamespace as NS
+
+    from easydiffraction.core.singletons import ConstraintsHandler
+    from easydiffraction.core.singletons import UidMapHandler
+
+    # The UID map references its values weakly, so keep them alive
+    class Param(NS):
+        pass
+
+    params = {
+        uid: Param(value=value)
+        for uid, value in {'u_a': 2.0, 'u_b': 0.0, 'u_c': 3.0, 'u_d': 0.0}.items()
+    }
+    uid_map = UidMapHandler.get().get_uid_map()
+    for uid, param in params.items():
+        monkeypatch.setitem(uid_map, uid, param)
+
+    h = ConstraintsHandler()
+    h._alias_to_param = {
+        alias: NS(param_uid=NS(value=f'u_{alias}')) for alias in ('a', 'b', 'c', 'd')
+    }
+    h._parsed_constraints = [('b', '1 - 2 * a'), ('d', 'a * c')]
+
+    derivatives = h.derivatives('u_a')
+    assert derivatives.keys() == {'u_b', 'u_d'}
+    assert derivatives['u_b'] == pytest.approx(-2.0)
+    assert derivatives['u_d'] == pytest.approx(3.0)
+
+    # Only the constraints referring to the parameter are included
+    assert h.derivatives('u_c') == pytest.approx({'u_d': 2.0})
+    assert h.derivatives('unknown') == {}
+
+
+def test_constraints_handler_applies_chained_constraints_once(monkeypatch):
+    from types import SimpleNamespace as NS
+
+    from easydiffraction.core.singletons import ConstraintsHandler
+    from easydiffraction.core.singletons import UidMapHandler
+    from easydiffraction.utils.logging import log
+
+    class Param:
+        def __init__(self, value):
+            self._value = value
+            self._constrained = False
+
+        @property
+        def value(self):
+            return self._value
+
+    params = {'a': Param(2.0), 'b': Param(0.0), 'c': Param(0.0)}
+    uid_map = UidMapHandler.get().get_uid_map()
+    for alias, param in params.items():
+        monkeypatch.setitem(uid_map, f'u_{alias}', param)
+
+    h = ConstraintsHandler()
+    h.set_aliases({alias: NS(param_uid=NS(value=f'u_{alias}')) for alias in params})
+    # 'c' depends on 'b', which is defined after it
+    h.set_constraints(
+        NS(
+            _items=[
+                NS(lhs_alias=NS(value='c'), rhs_expr=NS(value='b + 1')),
+                NS(lhs_alias=NS(value='b'), rhs_expr=NS(value='2 * a')),
+            ]
+        )
+    )
+    assert h._parsed_constraints == [('b', '2 * a'), ('c', 'b + 1')]
+
+    calls = []
+    evaluate = h._evaluate
+    h._evaluate = lambda values: calls.append(values) or evaluate(values)
+
+    h.apply()
+    assert params['b'].value == 4.0 and params['c'].value == 5.0
+    assert params['c']._constrained
+
+    # Evaluated again only once an aliased parameter changes
+    h.apply()
+    assert len(calls) == 1
+    params['a']._value = 3.0
+    h.apply()
+    assert len(calls) == 2
+    assert params['c'].value == 7.0
+
+    # Failures are logged instead of printed
+    warnings = []
+    monkeypatch.setattr(log, 'warning', lambda *messages, **kwargs: warnings.append(messages))
+    h.set_constraints(NS(_items=[NS(lhs_alias=NS(value='b'), rhs_expr=NS(value='unknown + 1'))]))
+    h.apply()
+    assert warnings and 'unknown' in warnings[0][0]
+    assert params['b'].value == 6.0
+
+
+def test_constraints_handler_vectorizes_linear_constraints(monkeypatch):
+    from types import SimpleNamespace as NS
+
+    from easydiffraction.core.singletons import ConstraintsHandler
+    from easydiffraction.core.singletons import UidMapHandler
+
+    class Param:
+        def __init__(self, value):
+            self._value = value
+            self._constrained = False
+
+        @property
+        def value(self):
+            return self._value
+
+    values = {'la': 0.3, 'ba': 0.0, 'b1': 0.5, 'b2': 0.0, 'b3': 0.0, 'x': 2.0, 'y': 0.0}
+    params = {alias: Param(value) for alias, value in values.items()}
+    uid_map = UidMapHandler.get().get_uid_map()
+    for alias, param in params.items():
+        monkeypatch.setitem(uid_map, f'u_{alias}', param)
+
+    constraints = {
+        'ba': '1 - la',
+        'b3': '(b2 + 1) / 2',  # Chained on the next one
+        'b2': '-b1 * 2',
+        'y': 'x ** 2',  # Not linear
+    }
+    h = ConstraintsHandler()
+    h.set_aliases({alias: NS(param_uid=NS(value=f'u_{alias}')) for alias in params})
+    h.set_constraints(
+        NS(
+            _items=[
+                NS(lhs_alias=NS(value=lhs), rhs_expr=NS(value=rhs))
+                for lhs, rhs in constraints.items()
+            ]
+        )
+    )
+
+    inputs, outputs, matrix, offset = h._linear()
+    assert inputs == ['b1', 'la']
+    assert outputs == ['ba', 'b2', 'b3']
+    assert matrix.toarray().tolist() == [[0.0, -1.0], [-2.0, 0.0], [-1.0, 0.0]]
+    assert offset.tolist() == [1.0, 0.0, 0.5]
+
+    h.apply()
+    applied = {alias: param.value for alias, param in params.items()}
+    assert applied['ba'] == pytest.approx(0.7)
+    assert applied['b2'] == pytest.approx(-1.0)
+    assert applied['b3'] == pytest.approx(0.0)
+    assert applied['y'] == pytest.approx(4.0)
+
+    # Same results when evaluating the expressions one by one
+    for alias in constraints:
+        params[alias]._value = 0.0
+    h.vectorize_linear = False
+    h._applied_values = None
+    h.apply()
+    assert {alias: param.value for alias, param in params.items()} == pytest.approx(applied)
+
+    # Derivatives are the finite differences of all constraints here,
+    # and the matrix columns if all constraints are linear
+    h.vectorize_linear = True
+    assert h.derivatives('u_b1') == pytest.approx({'u_b2': -2.0, 'u_b3': -1.0})
+    del constraints['y']
+    h.set_constraints(
+        NS(
+            _items=[
+                NS(lhs_alias=NS(value=lhs), rhs_expr=NS(value=rhs))
+                for lhs, rhs in constraints.items()
+            ]
+        )
+    )
+    assert h.derivatives('u_b1') == {'u_b2': -2.0, 'u_b3': -1.0}
+
+
+def test_uid_map_drops_removed_and_discarded_parameters():
+    import gc
+
+    from easydiffraction import Project
+    from easydiffraction.core.singletons import UidMapHandler
+
+    uid_map = UidMapHandler.get().get_uid_map()
+
+    def make_project():
+        project = Project()
+        project.sample_models.add(name='m')
+        project.sample_models['m'].atom_sites.add(label='Si', type_symbol='Si')
+        return project
+
+    # Removing a category item or a datablock drops its parameters
+    project = make_project()
+    model = project.sample_models['m']
+    b_iso = model.atom_sites['Si'].b_iso
+    assert uid_map[b_iso.uid] is b_iso
+    del model.atom_sites['Si']
+    assert b_iso.uid not in uid_map
+    length_a = model.cell.length_a
+    project.sample_models.remove('m')
+    assert length_a.uid not in uid_map
+    del project, model, b_iso, length_a
+
+    # Discarded projects leave neither parameters nor objects behind
+    for _ in range(10):
+        make_project()
+    gc.collect()
+    size = len(uid_map)
+    objects = len(gc.get_objects())
+    for _ in range(1000):
+        make_project()
+    gc.collect()
+    assert len(uid_map) == size
+    assert len(gc.get_objects()) - objects < 1000
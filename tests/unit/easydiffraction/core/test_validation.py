@@ -63,3 +63,27 @@ def test_membership_and_regex_validators(monkeypatch):
     rspec = AttributeSpec(default='a1', content_validator=RegexValidator(r'^[a-z]\d$'))
     assert rspec.validated('b2', name='r') == 'b2'
     assert rspec.validated('BAD', name='r') == 'a1'
+
+
+def test_name_provider_called_only_for_diagnostics():
+    from easydiffraction.core.validation import AttributeSpec
+    from easydiffraction.core.validation import DataTypes
+    from easydiffraction.core.validation import RangeValidator
+    from easydiffraction.utils.logging import log
+
+    log.configure(reaction=log.Reaction.WARN, level=log.Level.WARNING)
+    calls = []
+
+    def name():
+        calls.append('p')
+        return 'p'
+
+    spec = AttributeSpec(
+        type_=DataTypes.NUMERIC, default=1.0, content_validator=RangeValidator(ge=0, le=2)
+    )
+    assert spec.validated(1.5, name=name, current=1.0) == 1.5
+    assert calls == []
+
+    # Out of range -> keeps current and builds the name for the message
+    assert spec.validated(5.0, name=name, current=1.0) == 1.0
+    assert calls == ['p']
@@ -7,3 +7,88 @@ def test_module_import():
     expected_module_name = 'easydiffraction.crystallography.crystallography'
     actual_module_name = MUT.__name__
     assert expected_module_name == actual_module_name
+
+
+def test_parse_affine_component():
+    from fractions import Fraction
+
+    from easydiffraction.crystallography.crystallography import _parse_affine_component
+
+    assert _parse_affine_component('x') == ((1, 0, 0), 0)
+    assert _parse_affine_component('-y+1/2') == ((0, -1, 0), Fraction(1, 2))
+    assert _parse_affine_component('2x') == ((2, 0, 0), 0)
+    assert _parse_affine_component('-3/4') == ((0, 0, 0), Fraction(-3, 4))
+
+
+def test_apply_atom_sites_symmetry_constraints_batch():
+    import numpy as np
+
+    from easydiffraction.crystallography.crystallography import (
+        apply_atom_sites_symmetry_constraints,
+    )
+
+    coords = np.array([
+        [0.1, 0.2, 0.3],  # n: (x,y,z)
+        [0.1, 0.2, 0.3],  # m: (x,x,z)
+        [0.1, 0.2, 0.3],  # j: (1/2,y,y)
+        [0.1, 0.2, 0.3],  # g: (x,x,x)
+        [0.1, 0.2, 0.3],  # a: (0,0,0)
+    ])
+    result = apply_atom_sites_symmetry_constraints(
+        coords,
+        name_hm='P m -3 m',
+        coord_code='1',
+        wyckoff_letters=['n', 'm', 'j', 'g', 'a'],
+    )
+
+    assert np.allclose(
+        result,
+        [
+            [0.1, 0.2, 0.3],
+            [0.1, 0.1, 0.3],
+            [0.5, 0.2, 0.2],
+            [0.1, 0.1, 0.1],
+            [0.0, 0.0, 0.0],
+        ],
+    )
+    # Input is left untouched
+    assert np.allclose(coords, 0.1 * np.array([1, 2, 3]))
+
+
+def test_apply_atom_site_symmetry_constraints_with_multiple_of_x():
+    from easydiffraction.crystallography.crystallography import (
+        apply_atom_site_symmetry_constraints,
+    )
+
+    # P 6/m m m, Wyckoff o: (x,2x,z)
+    atom_site = {'fract_x': 0.1, 'fract_y': 0.7, 'fract_z': 0.3}
+    apply_atom_site_symmetry_constraints(
+        atom_site,
+        name_hm='P 6/m m m',
+        coord_code='h',
+        wyckoff_letter='o',
+    )
+    assert atom_site == {'fract_x': 0.1, 'fract_y': 0.2, 'fract_z': 0.3}
+
+
+def test_apply_cell_symmetry_constraints_hexagonal():
+    from easydiffraction.crystallography.crystallography import apply_cell_symmetry_constraints
+
+    cell = {
+        'lattice_a': 3.0,
+        'lattice_b': 4.0,
+        'lattice_c': 5.0,
+        'angle_alpha': 80.0,
+        'angle_beta': 85.0,
+        'angle_gamma': 95.0,
+    }
+    result = apply_cell_symmetry_constraints(cell, 'P 63/m m c')
+    assert result is cell
+    assert cell == {
+        'lattice_a': 3.0,
+        'lattice_b': 3.0,
+        'lattice_c': 5.0,
+        'angle_alpha': 90.0,
+        'angle_beta': 90.0,
+        'angle_gamma': 120.0,
+    }
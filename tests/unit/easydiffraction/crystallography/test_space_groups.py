@@ -7,3 +7,49 @@ def test_module_import():
     expected_module_name = 'easydiffraction.crystallography.space_groups'
     actual_module_name = MUT.__name__
     assert expected_module_name == actual_module_name
+
+
+def test_it_number_by_name_hm_matches_cryspy():
+    from cryspy.A_functions_base.function_2_space_group import ACCESIBLE_NAME_HM_SHORT
+    from cryspy.A_functions_base.function_2_space_group import get_it_number_by_name_hm_short
+
+    from easydiffraction.crystallography import space_groups as MUT
+
+    for name in ACCESIBLE_NAME_HM_SHORT:
+        assert MUT.it_number_by_name_hm(name) == get_it_number_by_name_hm_short(name)
+    assert MUT.it_number_by_name_hm('not a group') is None
+
+
+def test_cell_constraints_by_name_hm():
+    import numpy as np
+
+    from easydiffraction.crystallography import space_groups as MUT
+
+    cubic = MUT.cell_constraints_by_name_hm('F m -3 m')
+    assert cubic is MUT.CELL_CONSTRAINTS['cubic']
+    np.testing.assert_array_equal(cubic.equal_to_a, [False, True, True, False, False, False])
+    np.testing.assert_array_equal(cubic.fixed_values[3:], [90.0, 90.0, 90.0])
+    assert not cubic.fixed.flags.writeable
+
+    hexagonal = MUT.cell_constraints_by_name_hm('P 63/m m c')
+    assert hexagonal.fixed_values[5] == 120.0
+    assert MUT.cell_constraints_by_name_hm('not a group') is None
+
+
+def test_wyckoff_positions():
+    from easydiffraction.crystallography import space_groups as MUT
+
+    positions = MUT.wyckoff_positions(225, '1')
+    assert positions['a']['coords_xyz'][0] == '(0,0,0)'
+
+
+def test_space_groups_loaded_on_first_access():
+    import easydiffraction.crystallography.space_groups as MUT
+
+    MUT._load.cache_clear()
+    assert MUT._load.cache_info().currsize == 0
+
+    table = MUT.SPACE_GROUPS
+    assert MUT._load.cache_info().currsize == 1
+    assert MUT.SPACE_GROUPS is table
+    assert (225, '1') in table
@@ -29,3 +29,24 @@ def test_chebyshev_background_calculate_and_cif():
     cb.add(order=1, coef=0.5)
     cif = cb.as_cif
     assert '_pd_background.Chebyshev_order' in cif and '_pd_background.Chebyshev_coef' in cif
+
+
+def test_chebyshev_background_linear_derivatives():
+    from types import SimpleNamespace
+
+    from easydiffraction.experiments.categories.background.chebyshev import (
+        ChebyshevPolynomialBackground,
+    )
+
+    x = np.linspace(0.0, 1.0, 5)
+    mock_parent = SimpleNamespace(data=SimpleNamespace(x=x))
+
+    cb = ChebyshevPolynomialBackground()
+    object.__setattr__(cb, '_parent', mock_parent)
+    cb.add(id='0', order=0, coef=1.0)
+    cb.add(id='1', order=1, coef=0.5)
+
+    derivatives = cb._linear_derivatives()
+    assert [param for param, _ in derivatives] == [cb['0'].coef, cb['1'].coef]
+    assert np.allclose(derivatives[0][1], 1.0)
+    assert np.allclose(derivatives[1][1], np.linspace(-1.0, 1.0, 5))
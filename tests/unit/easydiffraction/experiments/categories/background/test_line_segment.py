@@ -37,3 +37,26 @@ def test_line_segment_background_calculate_and_cif():
         and '_pd_background.line_segment_X' in cif
         and '_pd_background.line_segment_intensity' in cif
     )
+
+
+def test_line_segment_background_linear_derivatives():
+    from types import SimpleNamespace
+
+    from easydiffraction.experiments.categories.background.line_segment import (
+        LineSegmentBackground,
+    )
+
+    x = np.array([0.0, 1.0, 2.0, 3.0])
+    mock_parent = SimpleNamespace(data=SimpleNamespace(x=x))
+
+    bkg = LineSegmentBackground()
+    object.__setattr__(bkg, '_parent', mock_parent)
+    assert bkg._linear_derivatives() == []
+
+    bkg.add(id='1', x=0.0, y=5.0)
+    bkg.add(id='2', x=2.0, y=7.0)
+    derivatives = bkg._linear_derivatives()
+
+    assert [param for param, _ in derivatives] == [bkg['1'].y, bkg['2'].y]
+    assert np.allclose(derivatives[0][1], [1.0, 0.5, 0.0, 0.0])
+    assert np.allclose(derivatives[1][1], [0.0, 0.5, 1.0, 1.0])
@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: 2021-2026 EasyDiffraction contributors <https://github.com/easyscience/diffraction>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+
+
+def _make_cwl_data(n=5):
+    from easydiffraction.experiments.categories.data.bragg_pd import PdCwlData
+
+    data = PdCwlData()
+    data._set_x(np.linspace(10.0, 20.0, n))
+    data._set_meas(np.arange(n, dtype=float))
+    data._set_meas_su(np.ones(n))
+    return data
+
+
+def test_columns_are_contiguous_arrays():
+    data = _make_cwl_data()
+
+    assert len(data) == 5
+    assert data._columns['two_theta'].dtype == np.float64
+    assert data._columns['calc_status'].dtype == bool
+    assert data._columns['intensity_meas'].flags['C_CONTIGUOUS']
+    assert list(data.keys()) == ['1', '2', '3', '4', '5']
+    assert list(data.calc_status) == ['incl'] * 5
+
+
+def test_calc_setters_and_getters_follow_mask():
+    data = _make_cwl_data()
+
+    data._set_calc_status(np.array([True, False, True, True, False]))
+    assert np.allclose(data.x, [10.0, 15.0, 17.5])
+    assert np.allclose(data.all_x, np.linspace(10.0, 20.0, 5))
+
+    data._set_calc(np.array([1.0, 2.0, 3.0]))
+    assert np.allclose(data.calc, [1.0, 2.0, 3.0])
+    assert np.allclose(data._columns['intensity_calc'], [1.0, 0.0, 2.0, 3.0, 0.0])
+
+    with pytest.raises(ValueError):
+        data._set_calc(np.array([1.0, 2.0]))
+
+
+def test_load_measured_replaces_all_columns_at_once():
+    from easydiffraction.experiments.categories.data.bragg_pd import PdTofData
+
+    data = PdTofData()
+    data._load_measured([1.0, 2.0, 3.0], [10.0, 20.0, 30.0], [1.0, 2.0, 3.0])
+
+    assert list(data.keys()) == ['1', '2', '3']
+    assert np.allclose(data.x, [1.0, 2.0, 3.0])
+    assert np.allclose(data.meas, [10.0, 20.0, 30.0])
+    assert np.allclose(data.meas_su, [1.0, 2.0, 3.0])
+    assert list(data.calc_status) == ['incl'] * 3
+
+    with pytest.raises(ValueError):
+        data._load_measured([1.0, 2.0], [10.0], [1.0, 2.0])
+
+
+def test_all_x_is_read_only():
+    data = _make_cwl_data()
+
+    with pytest.raises(ValueError):
+        data.all_x[0] = 0.0
+
+
+def test_item_views_read_and_write_columns():
+    data = _make_cwl_data()
+
+    point = data['3']
+    assert point.two_theta.value == 15.0
+    assert point.intensity_meas.value == 2.0
+    assert point.unique_name == 'pd_data.3'
+
+    point.intensity_meas.value = 42.0
+    point.calc_status.value = 'excl'
+    assert data._columns['intensity_meas'][2] == 42.0
+    assert not data._calc_mask[2]
+    assert [p.point_id.value for p in data] == ['1', '2', '3', '4', '5']
+
+
+def test_cif_round_trip():
+    import gemmi
+
+    from easydiffraction.experiments.categories.data.bragg_pd import PdCwlData
+
+    data = _make_cwl_data()
+    data._set_calc_status(np.array([True, True, False, True, True]))
+
+    block = gemmi.cif.read_string('data_test\n' + data.as_cif).sole_block()
+    restored = PdCwlData()
+    restored.from_cif(block)
+
+    assert len(restored) == 5
+    assert np.allclose(restored.all_x, data.all_x)
+    assert np.allclose(restored.meas, data.meas)
+    assert list(restored.calc_status) == list(data.calc_status)
+
+
+def test_cif_rows_limited_without_materializing_all_points():
+    data = _make_cwl_data(n=1000)
+
+    lines = data.as_cif.splitlines()
+    assert '...' in lines
+    assert lines[-1].split()[1] == '1000'
+
+
+def test_included_rows_cached_until_status_changes():
+    data = _make_cwl_data()
+
+    rows = data._included_rows
+    assert np.array_equal(rows, [0, 1, 2, 3, 4])
+
+    # Same status keeps the cached index
+    data._set_calc_status(np.ones(5, dtype=bool))
+    assert data._included_rows is rows
+
+    # Changed status rebuilds it
+    data._set_calc_status(np.array([False, True, True, True, True]))
+    assert np.array_equal(data._included_rows, [1, 2, 3, 4])
+
+
+def test_phase_patterns_reused_until_phase_changes():
+    from types import SimpleNamespace as NS
+
+    data = _make_cwl_data(n=3)
+
+    calls = []
+
+    class Calculator:
+        uses_phase_scale = False
+
+        def calculate_pattern(self, sample_model, experiment, called_by_minimizer=False):
+            calls.append(sample_model.name)
+            return np.full(3, sample_model.parameters[0].value)
+
+    phase_a = NS(name='a', parameters=[NS(value=1.0)])
+    phase_b = NS(name='b', parameters=[NS(value=2.0)])
+    linked = [
+        NS(_identity=NS(category_entry_name='a'), scale=NS(value=1.0)),
+        NS(_identity=NS(category_entry_name='b'), scale=NS(value=10.0)),
+    ]
+    project = NS(
+        sample_models={'a': phase_a, 'b': phase_b},
+        analysis=NS(calculator=Calculator()),
+    )
+    experiment = NS(
+        _parent=NS(_parent=project),
+        categories=[data],
+        _get_valid_linked_phases=lambda sample_models: linked,
+    )
+    object.__setattr__(data, '_parent', experiment)
+
+    assert np.allclose(data._calc_linked_phases(), 21.0)
+    assert calls == ['a', 'b']
+
+    # Scale changes reuse the unscaled pattern
+    linked[1].scale.value = 20.0
+    assert np.allclose(data._calc_linked_phases(), 41.0)
+    assert calls == ['a', 'b']
+
+    # Only the changed phase is recalculated
+    phase_a.parameters[0].value = 3.0
+    assert np.allclose(data._calc_linked_phases(), 43.0)
+    assert calls == ['a', 'b', 'a']
+
+    # Scale derivatives are the unscaled patterns
+    derivatives = data._linear_derivatives()
+    assert [param for param, _ in derivatives] == [linked[0].scale, linked[1].scale]
+    assert np.allclose(derivatives[0][1], 3.0)
+    assert np.allclose(derivatives[1][1], 2.0)
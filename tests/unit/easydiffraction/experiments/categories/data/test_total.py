@@ -0,0 +1,20 @@
+# SPDX-FileCopyrightText: 2021-2026 EasyDiffraction contributors <https://github.com/easyscience/diffraction>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+
+
+def test_total_data_columns_and_zero_background():
+    from easydiffraction.experiments.categories.data.total import TotalData
+
+    data = TotalData()
+    data._set_x(np.array([1.0, 2.0, 3.0]))
+    data._set_meas(np.array([0.5, -0.5, 0.25]))
+    data._set_calc_status(np.array([True, False, True]))
+    data._set_calc(np.array([0.4, 0.2]))
+
+    assert np.allclose(data.x, [1.0, 3.0])
+    assert np.allclose(data.meas, [0.5, 0.25])
+    assert np.allclose(data.calc, [0.4, 0.2])
+    assert np.allclose(data.bkg, [0.0, 0.0])
+    assert data['2'].g_r_meas.value == -0.5
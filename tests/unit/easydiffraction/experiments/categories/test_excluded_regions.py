@@ -50,3 +50,33 @@ def test_excluded_regions_add_updates_datastore_and_cif():
     # CIF loop includes header tags
     cif = coll.as_cif
     assert 'loop_' in cif and '_excluded_region.start' in cif and '_excluded_region.end' in cif
+
+
+def test_excluded_regions_update_skipped_when_unchanged():
+    from types import SimpleNamespace
+
+    from easydiffraction.experiments.categories.excluded_regions import ExcludedRegions
+
+    calls = []
+    ds = SimpleNamespace(all_x=np.array([0.0, 1.0, 2.0]), _x_revision=1)
+    ds._set_calc_status = calls.append
+
+    coll = ExcludedRegions()
+    object.__setattr__(coll, '_parent', SimpleNamespace(data=ds))
+    coll.add(start=0.5, end=1.5)
+
+    coll._update()
+    coll._update()
+    assert len(calls) == 1
+
+    # Changing a region triggers a new update
+    region = next(iter(coll))
+    region.end = 2.5
+    coll._update()
+    assert len(calls) == 2
+    assert np.array_equal(calls[-1], [True, False, False])
+
+    # So does changing the data points
+    ds._x_revision = 2
+    coll._update()
+    assert len(calls) == 3
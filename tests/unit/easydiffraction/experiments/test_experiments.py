@@ -34,6 +34,7 @@ def test_experiments_show_and_remove(monkeypatch, capsys):
 
     # Remove by name should not raise
     exps.remove('a')
+    assert exps.names == ['b']
     # Still can show names
     exps.show_names()
     out2 = capsys.readouterr().out
@@ -26,3 +26,14 @@ def test_atom_sites_collection_adds_by_label():
     sites.add(label='O1', type_symbol='O')
     assert 'O1' in sites.names
     assert sites['O1'].type_symbol.value == 'O'
+
+
+def test_unique_name_follows_reparenting_and_renaming():
+    site = AtomSite(label='Si')
+    assert site.fract_x.unique_name == 'atom_site.Si.fract_x'
+
+    sites = AtomSites()
+    sites._add(site)
+    site.label = 'O1'
+    assert site.fract_x.unique_name == 'atom_site.O1.fract_x'
+    assert sites['O1'] is site
@@ -74,3 +74,24 @@ def test_lazy_functions_execute_with_monkeypatch(monkeypatch, capsys, tmp_path):
     result = utils.download_data(id=12, destination=str(tmp_path), overwrite=True)
     assert Path(result).exists()
     assert calls['kwargs']['url'] == 'https://example.com/data.xye'
+
+
+def test_import_does_not_load_heavy_backends():
+    import subprocess
+    import sys
+
+    # Calculation, minimization and plotting engines are only imported
+    # once selected; check this in a fresh interpreter
+    backends = ['cryspy', 'diffpy.pdffit2', 'pycrysfml', 'lmfit', 'dfols', 'plotly']
+    code = (
+        'import sys\n'
+        'import easydiffraction\n'
+        f'print(*[name for name in {backends!r} if name in sys.modules])\n'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == []
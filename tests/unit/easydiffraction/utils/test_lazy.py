@@ -0,0 +1,11 @@
+# SPDX-FileCopyrightText: 2021-2026 EasyDiffraction contributors <https://github.com/easyscience/diffraction>
+# SPDX-License-Identifier: BSD-3-Clause
+
+def test_import_object_and_resolve():
+    import collections
+
+    import easydiffraction.utils.lazy as MUT
+
+    assert MUT.import_object('collections:OrderedDict') is collections.OrderedDict
+    assert MUT.resolve('collections:OrderedDict') is collections.OrderedDict
+    assert MUT.resolve(collections.OrderedDict) is collections.OrderedDict
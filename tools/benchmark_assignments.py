@@ -0,0 +1,38 @@
+"""Benchmark parameter value assignments.
+
+Assigns alternating valid values to a parameter attached to a sample
+model, so every assignment runs the full validation path without
+emitting diagnostics.
+
+Usage:
+    python tools/benchmark_assignments.py [--count N]
+"""
+
+import argparse
+import time
+
+from easydiffraction import SampleModelFactory
+
+
+def measure(count: int) -> float:
+    """Return the wall time in seconds of ``count`` assignments."""
+    model = SampleModelFactory.create(name='bench')
+    param = model.cell.length_a
+    values = (1.0, 2.0)
+    start = time.perf_counter()
+    for i in range(count):
+        param.value = values[i & 1]
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=1_000_000, help='number of assignments')
+    args = parser.parse_args()
+
+    elapsed = measure(args.count)
+    print(f'{args.count} assignments: {elapsed:.3f} s ({elapsed / args.count * 1e6:.3f} µs each)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark the import time of easydiffraction.
+
+Every measurement runs in a fresh Python process, so nothing is shared
+through ``sys.modules``. The statements after the import show what is
+deferred to first use, e.g. loading the space-group table.
+
+Usage:
+    python tools/benchmark_import.py [--repeat N]
+"""
+
+import argparse
+import statistics
+import subprocess  # noqa: S404
+import sys
+import time
+
+IMPORT = 'import easydiffraction'
+
+CASES = {
+    'import easydiffraction': IMPORT,
+    '+ first access of SPACE_GROUPS': (
+        f'{IMPORT}\n'
+        'from easydiffraction.crystallography import space_groups\n'
+        'space_groups.SPACE_GROUPS'
+    ),
+}
+
+
+def measure(code: str, repeat: int) -> float:
+    """Return the median wall time in seconds of running ``code`` in
+    a new interpreter.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True)  # noqa: S603
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='runs per case')
+    args = parser.parse_args()
+
+    baseline = measure('pass', args.repeat)
+    print(f'{"interpreter startup":<36}{baseline:8.3f} s')
+    for label, code in CASES.items():
+        print(f'{label:<36}{measure(code, args.repeat) - baseline:8.3f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Benchmark the memory footprint of descriptors and parameters.
+
+Builds a sample model with enough atom sites to hold the requested
+number of descriptors and parameters, and reports the memory allocated
+while building it, as traced by ``tracemalloc``.
+
+Usage:
+    python tools/benchmark_memory.py [--count N]
+"""
+
+import argparse
+import tracemalloc
+
+from easydiffraction import SampleModelFactory
+
+
+def measure(count: int) -> tuple[int, int]:
+    """Return the number of descriptors created and the bytes allocated
+    for a model holding at least ``count`` of them.
+    """
+    # Import and build everything reused across models up front
+    SampleModelFactory.create(name='warmup').atom_sites.add(label='X', type_symbol='Si')
+
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    model = SampleModelFactory.create(name='bench')
+    base = len(model.parameters)
+    model.atom_sites.add(label='Si0', type_symbol='Si', fract_x=0.1, b_iso=0.5)
+    per_atom = len(model.parameters) - base
+    for i in range(1, -(-(count - base) // per_atom)):
+        model.atom_sites.add(label=f'Si{i}', type_symbol='Si', fract_x=0.1, b_iso=0.5)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(model.parameters), current - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=10_000, help='number of descriptors')
+    args = parser.parse_args()
+
+    count, allocated = measure(args.count)
+    print(
+        f'{count} descriptors: {allocated / 2**20:.2f} MiB '
+        f'({allocated / count:.0f} bytes each, including their categories)'
+    )
+
+
+if __name__ == '__main__':
+    main()